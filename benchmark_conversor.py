@@ -0,0 +1,269 @@
+"""
+Benchmark da conversão UTM -> Geográficas
+
+Gera arquivos CSV sintéticos e reprodutíveis no formato do README (separador
+';' e vírgula decimal) e mede, para cada tamanho:
+
+- API ponto a ponto (ConversorUTM.utm_para_geografica)
+- API em lote (ConversorUTM.utm_para_geografica_lote)
+- Pipeline completo arquivo -> arquivo (processamento_lote.converter_arquivo)
+
+Cada medição roda em um processo separado, para que o pico de memória de uma
+não contamine as outras. Os resultados (pontos/s e pico de memória) são
+gravados em JSON para comparar execuções entre commits:
+
+    python benchmark_conversor.py --tamanhos 1000 100000 --saida atual.json
+    python benchmark_conversor.py --tamanhos 1000 100000 --comparar atual.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+import numpy as np
+
+
+TAMANHOS_PADRAO = [1_000, 100_000, 10_000_000]
+SEMENTE_PADRAO = 2000
+
+# A API ponto a ponto é medida em no máximo esta quantidade de pontos
+MAX_PONTOS_UNITARIOS = 20_000
+
+# Linhas geradas por vez ao escrever os arquivos sintéticos
+LINHAS_POR_ESCRITA = 500_000
+
+CABECALHO = "Vertice;E/Long;Sigma long;N/Lat;Sigma lat;h;Sigma h\n"
+
+
+def _decimal_virgula(valores, casas):
+    return np.char.replace(np.char.mod(f"%.{casas}f", valores), '.', ',')
+
+
+def gerar_coordenadas(n, semente=SEMENTE_PADRAO):
+    """
+    Gera coordenadas UTM sintéticas (zona 23S) reprodutíveis
+    
+    Args:
+        n (int): Quantidade de pontos
+        semente (int): Semente do gerador aleatório
+    
+    Returns:
+        tuple: (x, y) como numpy.ndarray
+    """
+    rng = np.random.default_rng(semente)
+    x = rng.uniform(166_000, 834_000, n).round(2)
+    y = rng.uniform(7_000_000, 9_990_000, n).round(2)
+    return x, y
+
+
+def gerar_csv(arquivo, n, semente=SEMENTE_PADRAO):
+    """
+    Gera um CSV sintético no formato do README, se ainda não existir
+    
+    Args:
+        arquivo (Path): Arquivo a gerar
+        n (int): Quantidade de linhas
+        semente (int): Semente do gerador aleatório
+    
+    Returns:
+        Path: Arquivo gerado
+    """
+    arquivo = Path(arquivo)
+    if arquivo.exists():
+        return arquivo
+    
+    arquivo.parent.mkdir(parents=True, exist_ok=True)
+    x, y = gerar_coordenadas(n, semente)
+    rng = np.random.default_rng(semente + 1)
+    temporario = arquivo.with_name(arquivo.name + '.tmp')
+    
+    with open(temporario, 'w', encoding='utf-8', newline='') as f:
+        f.write(CABECALHO)
+        for inicio in range(0, n, LINHAS_POR_ESCRITA):
+            fim = min(n, inicio + LINHAS_POR_ESCRITA)
+            m = fim - inicio
+            vertices = np.char.add('BSLL-M-B', np.char.zfill(np.arange(inicio, fim).astype(str), 8))
+            sigmas = _decimal_virgula(rng.uniform(0.001, 0.02, m), 3)
+            alturas = _decimal_virgula(rng.uniform(300, 1500, m), 2)
+            colunas = [vertices, _decimal_virgula(x[inicio:fim], 2), sigmas,
+                       _decimal_virgula(y[inicio:fim], 2), sigmas, alturas, sigmas]
+            linhas = colunas[0]
+            for coluna in colunas[1:]:
+                linhas = np.char.add(np.char.add(linhas, ';'), coluna)
+            f.write('\n'.join(linhas.tolist()))
+            f.write('\n')
+    
+    os.replace(temporario, arquivo)
+    return arquivo
+
+
+def _memoria_pico_mb():
+    # Pico de memória residente do processo (None onde não há o módulo resource)
+    try:
+        import resource
+    except ImportError:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa em KB, macOS em bytes
+    return pico / (1024 * 1024) if sys.platform == 'darwin' else pico / 1024
+
+
+def _medir(caso, n, arquivo, pasta_saida, semente):
+    # Executado em um processo novo para cada caso
+    from conversor_utm import ConversorUTM
+    from processamento_lote import converter_arquivo
+    
+    conversor = ConversorUTM()
+    conversor.utm_para_geografica(500000, 7000000)  # aquece o transformador
+    memoria_inicial = _memoria_pico_mb()
+    
+    if caso == 'ponto_a_ponto':
+        x, y = gerar_coordenadas(n, semente)
+        pontos = min(n, MAX_PONTOS_UNITARIOS)
+        x, y = x[:pontos].tolist(), y[:pontos].tolist()
+        inicio = time.perf_counter()
+        for xi, yi in zip(x, y):
+            conversor.utm_para_geografica(xi, yi)
+        segundos = time.perf_counter() - inicio
+    elif caso == 'lote':
+        x, y = gerar_coordenadas(n, semente)
+        pontos = n
+        inicio = time.perf_counter()
+        conversor.utm_para_geografica_lote(x, y)
+        segundos = time.perf_counter() - inicio
+    elif caso == 'arquivo':
+        destino = Path(pasta_saida) / f"saida_{Path(arquivo).name}"
+        inicio = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            estatisticas = converter_arquivo(arquivo, destino, 'B', 'D', conversor=conversor)
+        segundos = time.perf_counter() - inicio
+        pontos = estatisticas['linhas']
+        destino.unlink()
+    else:
+        raise ValueError(f"Caso desconhecido: {caso}")
+    
+    memoria_final = _memoria_pico_mb()
+    return {
+        'caso': caso,
+        'tamanho': n,
+        'pontos': pontos,
+        'segundos': round(segundos, 4),
+        'pontos_por_segundo': round(pontos / segundos, 1) if segundos > 0 else None,
+        'pico_memoria_mb': round(memoria_final, 1) if memoria_final is not None else None,
+        'pico_memoria_extra_mb': (round(memoria_final - memoria_inicial, 1)
+                                  if memoria_final is not None else None)
+    }
+
+
+def _commit_atual():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, cwd=Path(__file__).parent, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def executar_benchmark(tamanhos, casos, pasta_dados, semente=SEMENTE_PADRAO):
+    """
+    Executa os casos do benchmark para cada tamanho
+    
+    Args:
+        tamanhos (list): Quantidades de pontos/linhas
+        casos (list): Casos a medir ('ponto_a_ponto', 'lote', 'arquivo')
+        pasta_dados (Path): Pasta dos CSVs sintéticos (reaproveitados entre execuções)
+        semente (int): Semente do gerador aleatório
+    
+    Returns:
+        dict: Ambiente da execução e lista de resultados
+    """
+    import pandas
+    import pyproj
+    
+    pasta_dados = Path(pasta_dados)
+    resultados = []
+    
+    for n in tamanhos:
+        arquivo = None
+        if 'arquivo' in casos:
+            arquivo = gerar_csv(pasta_dados / f"sintetico_{n}_{semente}.csv", n, semente)
+        
+        for caso in casos:
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                resultado = executor.submit(_medir, caso, n, arquivo, pasta_dados, semente).result()
+            resultados.append(resultado)
+            print(f"{caso:>14} {n:>11,} pontos: {resultado['pontos_por_segundo']:>14,.0f} pontos/s"
+                  f"  pico {resultado['pico_memoria_mb']} MB")
+    
+    return {
+        'data': datetime.now().isoformat(timespec='seconds'),
+        'commit': _commit_atual(),
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'numpy': np.__version__,
+        'pandas': pandas.__version__,
+        'pyproj': pyproj.__version__,
+        'semente': semente,
+        'resultados': resultados
+    }
+
+
+def comparar(atual, anterior):
+    """
+    Imprime a variação de pontos/s em relação a uma execução anterior
+    
+    Args:
+        atual (dict): Resultado de executar_benchmark()
+        anterior (dict): Resultado anterior, lido do JSON
+    """
+    referencia = {(r['caso'], r['tamanho']): r for r in anterior.get('resultados', [])}
+    print(f"\nComparação com {anterior.get('commit')} ({anterior.get('data')}):")
+    for r in atual['resultados']:
+        antes = referencia.get((r['caso'], r['tamanho']))
+        if not antes or not antes.get('pontos_por_segundo') or not r.get('pontos_por_segundo'):
+            continue
+        razao = r['pontos_por_segundo'] / antes['pontos_por_segundo']
+        print(f"{r['caso']:>14} {r['tamanho']:>11,}: {razao:6.2f}x")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark da conversão UTM -> Geográficas')
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=TAMANHOS_PADRAO,
+                        help='Quantidades de pontos (padrão: 1000 100000 10000000)')
+    parser.add_argument('--casos', nargs='+', default=['ponto_a_ponto', 'lote', 'arquivo'],
+                        choices=['ponto_a_ponto', 'lote', 'arquivo'])
+    parser.add_argument('--dados', default='benchmark_dados',
+                        help='Pasta dos CSVs sintéticos (padrão: benchmark_dados)')
+    parser.add_argument('--semente', type=int, default=SEMENTE_PADRAO)
+    parser.add_argument('--saida', default='benchmark_resultados.json',
+                        help='Arquivo JSON com os resultados')
+    parser.add_argument('--comparar', default=None,
+                        help='JSON de uma execução anterior para comparação')
+    args = parser.parse_args(argv)
+    
+    anterior = None
+    if args.comparar:
+        with open(args.comparar, 'r', encoding='utf-8') as f:
+            anterior = json.load(f)
+    
+    resultado = executar_benchmark(args.tamanhos, args.casos, args.dados, args.semente)
+    
+    with open(args.saida, 'w', encoding='utf-8') as f:
+        json.dump(resultado, f, ensure_ascii=False, indent=2)
+    print(f"\nResultados salvos em {args.saida}")
+    
+    if anterior is not None:
+        comparar(resultado, anterior)
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+"""
+Compara os motores de projeção do ConversorUTM (pyproj e numpy)
+
+Precisão: converte uma grade de pontos em cada zona e hemisfério pelos dois
+motores e mede a maior distância, em metros, entre os resultados. A execução
+falha (código de saída 1) se alguma zona passar da tolerância.
+
+Vazão: mede pontos/s de utm_para_geografica_lote em cada motor.
+
+    python comparar_motores.py
+    python comparar_motores.py --zonas 18 25 --tolerancia 0.001 --tamanhos 1000 1000000
+"""
+
+import argparse
+import json
+import sys
+import time
+import numpy as np
+from conversor_utm import MOTORES, ConversorUTM
+
+
+# Zonas que cobrem o território brasileiro
+ZONAS_PADRAO = (18, 25)
+TOLERANCIA_PADRAO = 0.001  # metros
+TAMANHOS_PADRAO = [1_000, 100_000, 1_000_000]
+
+# Raio médio usado para converter diferenças angulares em metros
+RAIO_TERRA = 6371008.8
+
+# Faixas de Easting/Northing testadas em cada hemisfério
+FAIXA_ESTE = (160_000, 840_000)
+FAIXA_NORTE = {'N': (0, 9_300_000), 'S': (1_100_000, 10_000_000)}
+
+# As letras minúsculas conferem que os dois motores normalizam o hemisfério
+HEMISFERIOS = ('N', 'S', 'n', 's')
+
+
+def grade_utm(hemisferio, pontos_por_eixo=200):
+    """
+    Gera uma grade regular de coordenadas UTM cobrindo uma zona
+    
+    Args:
+        hemisferio (str): 'N' ou 'S' (maiúscula ou minúscula)
+        pontos_por_eixo (int): Pontos em cada direção
+    
+    Returns:
+        tuple: (x, y) como numpy.ndarray
+    """
+    este = np.linspace(*FAIXA_ESTE, pontos_por_eixo)
+    norte = np.linspace(*FAIXA_NORTE[hemisferio.upper()], pontos_por_eixo)
+    x, y = np.meshgrid(este, norte)
+    return x.ravel(), y.ravel()
+
+
+def distancia_metros(lon1, lat1, lon2, lat2):
+    """Distância aproximada em metros entre pontos muito próximos"""
+    dlat = np.radians(lat2 - lat1)
+    dlon = np.radians(lon2 - lon1) * np.cos(np.radians(lat1))
+    return RAIO_TERRA * np.hypot(dlat, dlon)
+
+
+def verificar_precisao(zona_inicial, zona_final, tolerancia=TOLERANCIA_PADRAO, pontos_por_eixo=200):
+    """
+    Compara os dois motores em todas as zonas do intervalo, nos dois hemisférios
+    (escritos em maiúscula e em minúscula)
+    
+    Args:
+        zona_inicial (int): Primeira zona
+        zona_final (int): Última zona (inclusive)
+        tolerancia (float): Maior diferença aceita, em metros
+        pontos_por_eixo (int): Densidade da grade de cada zona
+    
+    Returns:
+        list: Um dict por zona/hemisfério com a maior diferença e se passou
+    """
+    resultados = []
+    for hemisferio in HEMISFERIOS:
+        x, y = grade_utm(hemisferio, pontos_por_eixo)
+        for zona in range(zona_inicial, zona_final + 1):
+            saidas = {}
+            for motor in MOTORES:
+                conversor = ConversorUTM(zona_utm=zona, hemisferio=hemisferio, motor=motor)
+                saidas[motor] = conversor.utm_para_geografica_lote(x, y)
+            
+            lon1, lat1, validos1 = saidas['pyproj']
+            lon2, lat2, validos2 = saidas['numpy']
+            diferenca = distancia_metros(lon1[validos1], lat1[validos1], lon2[validos1], lat2[validos1])
+            maior = float(diferenca.max()) if diferenca.size else 0.0
+            
+            resultados.append({
+                'zona': zona,
+                'hemisferio': hemisferio,
+                'pontos': int(x.size),
+                'mesma_validade': bool(np.array_equal(validos1, validos2)),
+                'maior_diferenca_m': maior,
+                'ok': maior <= tolerancia and bool(np.array_equal(validos1, validos2))
+            })
+    return resultados
+
+
+def medir_vazao(tamanhos, repeticoes=3, semente=2000):
+    """
+    Mede pontos/s de cada motor na conversão em lote (melhor de N repetições)
+    
+    Args:
+        tamanhos (list): Quantidades de pontos
+        repeticoes (int): Repetições de cada medição
+        semente (int): Semente do gerador aleatório
+    
+    Returns:
+        list: Um dict por tamanho com os pontos/s de cada motor
+    """
+    rng = np.random.default_rng(semente)
+    resultados = []
+    for n in tamanhos:
+        x = rng.uniform(*FAIXA_ESTE, n)
+        y = rng.uniform(*FAIXA_NORTE['S'], n)
+        resultado = {'tamanho': n}
+        for motor in MOTORES:
+            conversor = ConversorUTM(motor=motor)
+            conversor.utm_para_geografica(500000, 7000000)  # aquece o transformador
+            melhor = min(_cronometrar(conversor.utm_para_geografica_lote, x, y) for _ in range(repeticoes))
+            resultado[motor] = round(n / melhor, 1) if melhor > 0 else None
+        resultados.append(resultado)
+    return resultados
+
+
+def _cronometrar(funcao, *args):
+    inicio = time.perf_counter()
+    funcao(*args)
+    return time.perf_counter() - inicio
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compara os motores de projeção pyproj e numpy')
+    parser.add_argument('--zonas', type=int, nargs=2, default=ZONAS_PADRAO, metavar=('INICIAL', 'FINAL'),
+                        help='Intervalo de zonas verificado (padrão: 18 25)')
+    parser.add_argument('--tolerancia', type=float, default=TOLERANCIA_PADRAO,
+                        help='Maior diferença aceita, em metros (padrão: 0.001)')
+    parser.add_argument('--grade', type=int, default=200,
+                        help='Pontos por eixo da grade de cada zona (padrão: 200)')
+    parser.add_argument('--tamanhos', type=int, nargs='*', default=TAMANHOS_PADRAO,
+                        help='Quantidades de pontos da medição de vazão (vazio para pular)')
+    parser.add_argument('--saida', default=None, help='Também grava os resultados em JSON')
+    args = parser.parse_args(argv)
+    
+    precisao = verificar_precisao(args.zonas[0], args.zonas[1], args.tolerancia, args.grade)
+    print("Precisão (numpy x pyproj):")
+    for r in precisao:
+        situacao = 'ok' if r['ok'] else 'FALHOU'
+        print(f"  zona {r['zona']:>2}{r['hemisferio']}: {r['maior_diferenca_m']:.3e} m  {situacao}")
+    
+    vazao = medir_vazao(args.tamanhos)
+    if vazao:
+        print("\nVazão (pontos/s):")
+        for r in vazao:
+            razao = r['numpy'] / r['pyproj'] if r['pyproj'] else float('nan')
+            print(f"  {r['tamanho']:>11,}: pyproj {r['pyproj']:>14,.0f}  numpy {r['numpy']:>14,.0f}  ({razao:.2f}x)")
+    
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as f:
+            json.dump({'tolerancia_m': args.tolerancia, 'precisao': precisao, 'vazao': vazao},
+                      f, ensure_ascii=False, indent=2)
+    
+    return 0 if all(r['ok'] for r in precisao) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
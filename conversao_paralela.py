@@ -0,0 +1,210 @@
+"""
+Conversão de um único arquivo grande em vários núcleos
+
+Os vetores de coordenadas já interpretados são divididos em partes contíguas
+e cada parte é projetada e formatada em um processo do pool. A troca de dados
+com os processos é feita por memória compartilhada
+(multiprocessing.shared_memory), e não por DataFrames serializados: cada
+processo lê a sua fatia de X/Y e escreve longitude/latitude formatadas, em
+texto de largura fixa, direto nas posições correspondentes. Assim o resultado
+já sai na ordem original das linhas, sem passar pelo disco. Os blocos de
+memória são reaproveitados de um bloco de linhas para o seguinte enquanto
+couberem.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from conversor_utm import ConversorUTM, formatar_dms_lote
+
+
+# Abaixo disso uma parte não compensa o custo de enviá-la a outro processo
+TAMANHO_MINIMO_PARTE = 50_000
+
+# Hemisférios gravados como int8 na memória compartilhada (0 = N, 1 = S, -1 = inválido)
+HEMISFERIOS_CODIGO = np.array(['N', 'S', None], dtype=object)
+
+# Maior texto possível de "GG MM SS,SSS H" com 3 casas ("180 00 00,000 W")
+LARGURA_TEXTO = 15
+
+# Vetores trocados com os processos e o tipo de cada um
+TIPOS = {
+    'x': np.float64,
+    'y': np.float64,
+    'zonas': np.float64,
+    'hemisferios': np.int8,
+    'lon': np.float64,
+    'lat': np.float64,
+    'validos': np.bool_,
+    'longitudes': f'S{LARGURA_TEXTO}',
+    'latitudes': f'S{LARGURA_TEXTO}',
+}
+
+
+def _vetor(memoria, nome, n):
+    # Vetor de n posições sobre o bloco de memória compartilhada
+    return np.ndarray((n,), dtype=TIPOS[nome], buffer=memoria.buf)
+
+
+def _converter_parte(conversor, segmentos, n, inicio, fim, formatar=True):
+    # Executado nos processos do pool: converte as linhas [inicio, fim)
+    memorias = {nome: shared_memory.SharedMemory(name=segmento) for nome, segmento in segmentos.items()}
+    try:
+        return _converter_fatia(conversor, memorias, n, inicio, fim, formatar)
+    finally:
+        for memoria in memorias.values():
+            memoria.close()
+
+
+def _converter_fatia(conversor, memorias, n, inicio, fim, formatar):
+    # As entradas são copiadas e as saídas gravadas por atribuição: nenhuma
+    # visão da memória compartilhada sobrevive à função (o close() falharia)
+    x = _vetor(memorias['x'], 'x', n)[inicio:fim].copy()
+    y = _vetor(memorias['y'], 'y', n)[inicio:fim].copy()
+    zonas = _vetor(memorias['zonas'], 'zonas', n)[inicio:fim].copy() if 'zonas' in memorias else None
+    hemisferios = None
+    if 'hemisferios' in memorias:
+        hemisferios = HEMISFERIOS_CODIGO[_vetor(memorias['hemisferios'], 'hemisferios', n)[inicio:fim]]
+    
+    lon, lat, validos = conversor.utm_para_geografica_lote(x, y, zonas, hemisferios)
+    
+    for nome, valores in (('lon', lon), ('lat', lat), ('validos', validos)):
+        _vetor(memorias[nome], nome, n)[inicio:fim] = valores
+    
+    if not formatar:
+        return fim - inicio
+    
+    # Inválidos ficam como texto vazio; a máscara diz quais posições usar
+    for nome, valores, letras in (('longitudes', lon, ('E', 'W')), ('latitudes', lat, ('N', 'S'))):
+        textos = formatar_dms_lote(valores, letras)
+        textos[~validos] = ''
+        _vetor(memorias[nome], nome, n)[inicio:fim] = textos.astype(f'S{LARGURA_TEXTO}')
+    return fim - inicio
+
+
+class ConversorParalelo:
+    """
+    Projeta e formata vetores de coordenadas em um pool de processos
+    
+    Use com `with` para que o pool e a memória compartilhada sejam liberados:
+        
+        with ConversorParalelo(conversor, workers=4) as paralelo:
+            lon, lat, validos, lon_texto, lat_texto = paralelo.projetar_e_formatar(x, y)
+    """
+    
+    def __init__(self, conversor=None, workers=None, tamanho_minimo_parte=TAMANHO_MINIMO_PARTE):
+        """
+        Inicializa o conversor paralelo
+        
+        Args:
+            conversor (ConversorUTM): Conversor a usar (padrão: SIRGAS2000 23S)
+            workers (int): Processos do pool (padrão: número de núcleos)
+            tamanho_minimo_parte (int): Menor quantidade de pontos por processo
+        """
+        self.conversor = conversor if conversor is not None else ConversorUTM()
+        self.workers = max(1, int(workers or os.cpu_count() or 1))
+        self.tamanho_minimo_parte = max(1, int(tamanho_minimo_parte))
+        self._executor = None
+        # Um bloco de memória compartilhada por vetor, reaproveitado enquanto couber
+        self._memorias = {}
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *erro):
+        self.fechar()
+    
+    def fechar(self):
+        """Encerra o pool e libera a memória compartilhada"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        for memoria in self._memorias.values():
+            memoria.close()
+            memoria.unlink()
+        self._memorias = {}
+    
+    def _partes(self, n):
+        # Limites [inicio, fim) de partes contíguas, no máximo uma por processo
+        quantidade = max(1, min(self.workers, n // self.tamanho_minimo_parte))
+        limites = np.linspace(0, n, quantidade + 1).astype(int)
+        return list(zip(limites[:-1].tolist(), limites[1:].tolist()))
+    
+    def _memoria(self, nome, n):
+        # Bloco de memória compartilhada com espaço para n posições do vetor
+        tamanho = max(1, n * np.dtype(TIPOS[nome]).itemsize)
+        memoria = self._memorias.get(nome)
+        if memoria is None or memoria.size < tamanho:
+            if memoria is not None:
+                memoria.close()
+                memoria.unlink()
+            memoria = self._memorias[nome] = shared_memory.SharedMemory(create=True, size=tamanho)
+        return memoria
+    
+    def projetar_e_formatar(self, x, y, zonas=None, hemisferios=None, formatar=True):
+        """
+        Converte vetores UTM para graus decimais e textos "GG MM SS,SSS H"
+        
+        Args:
+            x (numpy.ndarray): Coordenadas X UTM
+            y (numpy.ndarray): Coordenadas Y UTM
+            zonas (numpy.ndarray): Zona de cada ponto (opcional)
+            hemisferios (numpy.ndarray): Hemisfério de cada ponto (opcional)
+            formatar (bool): Gera também os textos GG MM SS
+        
+        Returns:
+            tuple: (longitudes, latitudes, validos, longitudes_texto, latitudes_texto);
+                   os textos são vetores object (None nos pontos inválidos),
+                   ou None com formatar=False
+        """
+        n = len(x)
+        partes = self._partes(n)
+        
+        if len(partes) == 1:
+            # Pouco trabalho: converte aqui mesmo
+            lon, lat, validos = self.conversor.utm_para_geografica_lote(x, y, zonas, hemisferios)
+            if not formatar:
+                return lon, lat, validos, None, None
+            return lon, lat, validos, formatar_dms_lote(lon, ('E', 'W')), formatar_dms_lote(lat, ('N', 'S'))
+        
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        
+        segmentos = self._gravar_entradas(x, y, zonas, hemisferios, formatar)
+        futuros = [self._executor.submit(_converter_parte, self.conversor, segmentos, n, inicio, fim, formatar)
+                   for inicio, fim in partes]
+        for futuro in futuros:
+            futuro.result()
+        
+        lon, lat, validos = (_vetor(self._memorias[nome], nome, n).copy() for nome in ('lon', 'lat', 'validos'))
+        if not formatar:
+            return lon, lat, validos, None, None
+        
+        textos = []
+        for nome in ('longitudes', 'latitudes'):
+            texto = _vetor(self._memorias[nome], nome, n).astype(str).astype(object)
+            texto[~validos] = None
+            textos.append(texto)
+        return lon, lat, validos, textos[0], textos[1]
+    
+    def _gravar_entradas(self, x, y, zonas, hemisferios, formatar):
+        # Preenche as entradas da rodada e reserva as saídas; devolve {vetor: nome do bloco}
+        n = len(x)
+        
+        entradas = {'x': np.asarray(x, dtype=float), 'y': np.asarray(y, dtype=float)}
+        if zonas is not None:
+            entradas['zonas'] = np.broadcast_to(np.asarray(zonas, dtype=float), (n,))
+        if hemisferios is not None:
+            hems = np.broadcast_to(np.asarray(hemisferios, dtype=object), (n,))
+            entradas['hemisferios'] = np.where(hems == 'S', 1, np.where(hems == 'N', 0, -1)).astype(np.int8)
+        
+        saidas = ['lon', 'lat', 'validos'] + (['longitudes', 'latitudes'] if formatar else [])
+        
+        segmentos = {}
+        for nome in list(entradas) + saidas:
+            memoria = self._memoria(nome, n)
+            if nome in entradas:
+                _vetor(memoria, nome, n)[:] = entradas[nome]
+            segmentos[nome] = memoria.name
+        return segmentos
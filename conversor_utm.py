@@ -2,24 +2,233 @@
 Módulo para conversão de coordenadas UTM para coordenadas geográficas (GG MM SS)
 """
 
+import functools
 import math
-from pyproj import Proj, transform
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+import numpy as np
 import pandas as pd
+from instrumentacao import medir
+from mercator_transversa import utm_inversa
+
+
+# Elipsoide de cada datum suportado e translação geocêntrica (m) para o
+# SIRGAS2000, com os parâmetros oficiais do IBGE; SIRGAS2000 usa o GRS80
+DATUMS = {
+    'SIRGAS2000': {'elipsoide': 'GRS80', 'translacao': None},
+    'SAD69': {'elipsoide': 'aust_SA', 'translacao': (-67.35, 3.88, -38.22)},
+    'CORREGO_ALEGRE': {'elipsoide': 'intl', 'translacao': (-206.048, 168.279, -3.823)},
+}
+
+# Grafias aceitas para cada datum
+_APELIDOS_DATUM = {
+    'SIRGAS': 'SIRGAS2000',
+    'SAD': 'SAD69',
+    'SAD1969': 'SAD69',
+    'CORREGOALEGRE': 'CORREGO_ALEGRE',
+}
+
+
+@functools.lru_cache(maxsize=None)
+def normalizar_datum(datum):
+    """
+    Retorna o nome padronizado de um datum ("SAD-69" -> "SAD69", "Córrego Alegre" -> "CORREGO_ALEGRE")
+    
+    Args:
+        datum (str): Nome do datum
+    
+    Returns:
+        str: Chave de DATUMS
+    """
+    texto = unicodedata.normalize('NFKD', str(datum)).encode('ascii', 'ignore').decode().upper()
+    nome = re.sub(r'[^A-Z0-9]+', '_', texto).strip('_')
+    if nome in DATUMS:
+        return nome
+    compacto = nome.replace('_', '')
+    for chave in DATUMS:
+        if chave.replace('_', '') == compacto:
+            return chave
+    if compacto in _APELIDOS_DATUM:
+        return _APELIDOS_DATUM[compacto]
+    raise ValueError(f"Datum não suportado: {datum} (use {', '.join(DATUMS)})")
+
+
+class RegistroTransformadores:
+    """
+    Registro de transformadores pyproj prontos para uso, com remoção LRU
+    
+    Montar a projeção custa muito mais do que transformar os pontos, então
+    cada combinação (zona, hemisfério, datum) é construída uma única vez por
+    processo e reaproveitada por todas as conversões.
+    """
+    
+    def __init__(self, tamanho_maximo=32):
+        """
+        Inicializa o registro
+        
+        Args:
+            tamanho_maximo (int): Quantidade máxima de transformadores mantidos
+        """
+        self._transformadores = OrderedDict()
+        self._lock = threading.Lock()
+        self._tamanho_maximo = max(1, int(tamanho_maximo))
+        self.acertos = 0
+        self.faltas = 0
+        self.remocoes = 0
+    
+    @property
+    def tamanho_maximo(self):
+        return self._tamanho_maximo
+    
+    @tamanho_maximo.setter
+    def tamanho_maximo(self, valor):
+        with self._lock:
+            self._tamanho_maximo = max(1, int(valor))
+            self._remover_excedentes()
+    
+    def obter(self, zona, hemisferio='S', datum='SIRGAS2000'):
+        """
+        Retorna o transformador UTM -> geográficas para a combinação pedida
+        
+        Args:
+            zona (int): Zona UTM
+            hemisferio (str): 'N' para Norte ou 'S' para Sul
+            datum (str): Sistema de referência
+        
+        Returns:
+            pyproj.Transformer: Transformador com saída (longitude, latitude) em graus
+        """
+        chave = (int(zona), str(hemisferio).upper(), normalizar_datum(datum))
+        
+        with self._lock:
+            transformador = self._transformadores.get(chave)
+            if transformador is not None:
+                self._transformadores.move_to_end(chave)
+                self.acertos += 1
+                return transformador
+            self.faltas += 1
+        
+        # A construção fica fora do lock para não serializar as threads; o
+        # pyproj só é importado quando o primeiro transformador é necessário
+        from pyproj import Transformer
+        transformador = Transformer.from_pipeline(definicao_pipeline(*chave))
+        
+        with self._lock:
+            self._transformadores[chave] = transformador
+            self._transformadores.move_to_end(chave)
+            self._remover_excedentes()
+        
+        return transformador
+    
+    def _remover_excedentes(self):
+        while len(self._transformadores) > self._tamanho_maximo:
+            self._transformadores.popitem(last=False)
+            self.remocoes += 1
+    
+    def limpar(self):
+        """Remove todos os transformadores e zera os contadores"""
+        with self._lock:
+            self._transformadores.clear()
+            self.acertos = 0
+            self.faltas = 0
+            self.remocoes = 0
+    
+    def estatisticas(self):
+        """
+        Retorna os contadores do registro
+        
+        Returns:
+            dict: {'acertos': int, 'faltas': int, 'remocoes': int,
+                   'tamanho': int, 'tamanho_maximo': int}
+        """
+        with self._lock:
+            return {
+                'acertos': self.acertos,
+                'faltas': self.faltas,
+                'remocoes': self.remocoes,
+                'tamanho': len(self._transformadores),
+                'tamanho_maximo': self._tamanho_maximo
+            }
+
+
+def definicao_pipeline(zona, hemisferio='S', datum='SIRGAS2000'):
+    """
+    Monta a definição PROJ da conversão UTM -> geográficas (graus decimais)
+    
+    Args:
+        zona (int): Zona UTM
+        hemisferio (str): 'N' para Norte ou 'S' para Sul
+        datum (str): Datum das coordenadas UTM (chave de DATUMS)
+    
+    Returns:
+        str: Pipeline PROJ; datums diferentes do SIRGAS2000 saem em
+             geográficas SIRGAS2000
+    """
+    parametros = DATUMS[normalizar_datum(datum)]
+    elipsoide = parametros['elipsoide']
+    sul = ' +south' if hemisferio == 'S' else ''
+    passos = f"+step +inv +proj=utm +zone={zona}{sul} +ellps={elipsoide} "
+    
+    if parametros['translacao'] is not None:
+        # Translação geocêntrica para o SIRGAS2000, sem grades externas
+        dx, dy, dz = parametros['translacao']
+        passos += (f"+step +proj=cart +ellps={elipsoide} "
+                   f"+step +proj=helmert +x={dx} +y={dy} +z={dz} "
+                   f"+step +inv +proj=cart +ellps=GRS80 ")
+    
+    return f"+proj=pipeline {passos}+step +proj=unitconvert +xy_in=rad +xy_out=deg"
+
+
+# Pontos convertidos por vez nos arquivos binários mapeados em memória
+TAMANHO_JANELA_BINARIA = 1_000_000
+
+
+# Motores de projeção disponíveis: PROJ (via pyproj) ou séries de Krüger em NumPy
+MOTORES = ('pyproj', 'numpy')
+
+
+# Registro compartilhado por todas as conversões do processo
+registro_transformadores = RegistroTransformadores()
+
+
+def obter_transformador(zona, hemisferio='S', datum='SIRGAS2000'):
+    """Atalho para registro_transformadores.obter()"""
+    return registro_transformadores.obter(zona, hemisferio, datum)
 
 
 class ConversorUTM:
-    def __init__(self, zona_utm=23, hemisferio='S', datum='SIRGAS2000'):
+    def __init__(self, zona_utm=23, hemisferio='S', datum='SIRGAS2000', motor='pyproj'):
         """
         Inicializa o conversor UTM
         
         Args:
             zona_utm (int): Zona UTM (padrão: 23 para Brasil)
-            hemisferio (str): 'N' para Norte ou 'S' para Sul (padrão: 'S')
-            datum (str): Sistema de referência (padrão: 'SIRGAS2000')
+            hemisferio (str): 'N' para Norte ou 'S' para Sul, maiúscula ou minúscula (padrão: 'S')
+            datum (str): Datum das coordenadas UTM: 'SIRGAS2000' (padrão),
+                         'SAD69' ou 'CORREGO_ALEGRE'; os dois últimos são
+                         transformados para geográficas SIRGAS2000
+            motor (str): 'pyproj' (padrão) ou 'numpy' para a inversa em NumPy puro
         """
+        if motor not in MOTORES:
+            raise ValueError(f"Motor de projeção inválido: {motor} (use {' ou '.join(MOTORES)})")
+        datum = normalizar_datum(datum)
+        if motor == 'numpy' and DATUMS[datum]['translacao'] is not None:
+            raise ValueError(f"O motor numpy só converte SIRGAS2000; use o motor pyproj para {datum}")
+        
         self.zona_utm = zona_utm
-        self.hemisferio = hemisferio
+        # Normalizado uma vez: 's' e 'S' valem o mesmo em todos os caminhos
+        self.hemisferio = str(hemisferio).upper()
         self.datum = datum
+        self.motor = motor
+    
+    def _transformar(self, utm_x, utm_y, zona, hemisferio):
+        # Inversa UTM de uma única zona/hemisfério no motor escolhido
+        if self.motor == 'numpy':
+            return utm_inversa(utm_x, utm_y, zona, str(hemisferio).upper() == 'S', DATUMS[self.datum]['elipsoide'])
+        return obter_transformador(zona, hemisferio, self.datum).transform(utm_x, utm_y)
     
     def utm_para_geografica(self, utm_x, utm_y, zona_utm=None, hemisferio=None):
         """
@@ -39,18 +248,117 @@ class ConversorUTM:
             zona = zona_utm if zona_utm is not None else self.zona_utm
             hem = hemisferio if hemisferio is not None else self.hemisferio
             
-            # Define o sistema de coordenadas UTM com SIRGAS2000
-            # SIRGAS2000 usa o elipsoide GRS80 que é compatível com WGS84
-            utm_proj = Proj(proj='utm', zone=zona, ellps='GRS80', 
-                           south=(hem == 'S'))
-            
             # Converte para coordenadas geográficas
-            lon, lat = utm_proj(utm_x, utm_y, inverse=True)
+            # SIRGAS2000 usa o elipsoide GRS80 que é compatível com WGS84
+            lon, lat = self._transformar(utm_x, utm_y, zona, hem)
             
+            if self.motor == 'numpy' and np.ndim(lon) == 0:
+                return float(lon), float(lat)
             return lon, lat
         except Exception as e:
             raise Exception(f"Erro na conversão UTM: {str(e)}")
     
+    def utm_para_geografica_lote(self, utm_x, utm_y, zona_utm=None, hemisferio=None):
+        """
+        Converte vetores de coordenadas UTM para geográficas em uma única chamada
+        
+        Valores ausentes, não numéricos ou fora do domínio da projeção não
+        interrompem o lote: a posição correspondente recebe NaN e é marcada
+        como inválida na máscara retornada.
+        
+        Zona e hemisfério podem ser únicos para o lote ou vetores com um valor
+        por ponto; nesse caso os pontos são agrupados por (zona, hemisfério) e
+        cada grupo é transformado em uma única chamada.
+        
+        Args:
+            utm_x (array-like): Coordenadas X UTM (lista, numpy.ndarray ou pandas.Series)
+            utm_y (array-like): Coordenadas Y UTM, com o mesmo tamanho de utm_x
+            zona_utm (int ou array-like): Zona UTM (usa a padrão se não especificada);
+                                          zonas fora de 1-60 invalidam o ponto
+            hemisferio (str ou array-like): 'N' ou 'S' (usa o padrão se não especificado)
+        
+        Returns:
+            tuple: (longitudes, latitudes, validos) como numpy.ndarray, onde
+                   validos é a máscara booleana dos pontos convertidos
+        """
+        x = _como_float(utm_x)
+        y = _como_float(utm_y)
+        
+        if x.shape != y.shape:
+            raise ValueError(f"Tamanhos diferentes: X={x.size}, Y={y.size}")
+        
+        lon = np.full(x.shape, np.nan)
+        lat = np.full(x.shape, np.nan)
+        validos = np.isfinite(x) & np.isfinite(y)
+        
+        zona = zona_utm if zona_utm is not None else self.zona_utm
+        hem = hemisferio if hemisferio is not None else self.hemisferio
+        if np.ndim(hem) == 0:
+            hem = str(hem).upper()
+        
+        if np.ndim(zona) == 0 and np.ndim(hem) == 0:
+            grupos = [((zona, hem), validos.nonzero()[0])] if validos.any() else []
+        else:
+            zonas = np.broadcast_to(_como_float(zona) if np.ndim(zona) else float(zona), x.shape)
+            hems = np.broadcast_to(np.asarray(hem, dtype=object).ravel() if np.ndim(hem) else hem, x.shape)
+            sul = hems == 'S'
+            validos &= (zonas >= 1) & (zonas <= 60) & (zonas == np.floor(zonas)) & (sul | (hems == 'N'))
+            grupos = _agrupar_por_zona(zonas, sul, validos)
+        
+        for (zona_grupo, hem_grupo), indices in grupos:
+            lon[indices], lat[indices] = self._transformar(x[indices], y[indices], zona_grupo, hem_grupo)
+        
+        # Pontos fora do domínio da projeção voltam como inf
+        validos &= np.isfinite(lon) & np.isfinite(lat)
+        lon[~validos] = np.nan
+        lat[~validos] = np.nan
+        
+        return lon, lat, validos
+    
+    def converter_arquivo_binario(self, arquivo_origem, arquivo_destino, tamanho_janela=TAMANHO_JANELA_BINARIA):
+        """
+        Converte uma nuvem de pontos binária (X, Y intercalados) sem carregá-la na memória
+        
+        A entrada é um .npy com formato (n, 2) ou um arquivo bruto de float64
+        little-endian na sequência X0 Y0 X1 Y1 ...; ambos são mapeados em
+        memória e convertidos em janelas de tamanho fixo. A saída segue o mesmo
+        formato da entrada (.npy ou bruto), com longitude e latitude em graus
+        decimais intercaladas e NaN nos pontos que não puderam ser convertidos.
+        
+        Args:
+            arquivo_origem (Path): Arquivo .npy ou binário bruto com X/Y UTM
+            arquivo_destino (Path): Arquivo de saída (.npy ou binário bruto)
+            tamanho_janela (int): Pontos convertidos por vez
+        
+        Returns:
+            dict: {'pontos': int, 'convertidos': int}
+        """
+        entrada = abrir_pontos_binarios(arquivo_origem)
+        n = entrada.shape[0]
+        
+        if Path(arquivo_destino).suffix.lower() == '.npy':
+            saida = np.lib.format.open_memmap(arquivo_destino, mode='w+', dtype='<f8', shape=(n, 2))
+        else:
+            saida = np.memmap(arquivo_destino, dtype='<f8', mode='w+', shape=(n, 2)) if n else None
+        
+        convertidos = 0
+        passo = max(1, int(tamanho_janela))
+        for inicio in range(0, n, passo):
+            janela = entrada[inicio:inicio + passo]
+            lon, lat, validos = self.utm_para_geografica_lote(janela[:, 0], janela[:, 1])
+            saida[inicio:inicio + passo, 0] = lon
+            saida[inicio:inicio + passo, 1] = lat
+            convertidos += int(validos.sum())
+        
+        if saida is not None:
+            saida.flush()
+        else:
+            # np.memmap não cria arquivos vazios
+            open(arquivo_destino, 'wb').close()
+        del saida
+        
+        return {'pontos': n, 'convertidos': convertidos}
+    
     def graus_decimais_para_dms(self, graus_decimais):
         """
         Converte graus decimais para formato GG MM SS
@@ -127,6 +435,394 @@ class ConversorUTM:
             raise Exception(f"Erro na conversão completa: {str(e)}")
 
 
+def abrir_pontos_binarios(arquivo_path):
+    """
+    Mapeia em memória um arquivo de pontos X/Y (somente leitura)
+    
+    Args:
+        arquivo_path (Path): .npy com formato (n, 2) ou binário bruto de float64
+                             little-endian com X e Y intercalados
+    
+    Returns:
+        numpy.memmap: Vetor (n, 2) com X na coluna 0 e Y na coluna 1
+    """
+    arquivo_path = Path(arquivo_path)
+    if arquivo_path.suffix.lower() == '.npy':
+        pontos = np.load(arquivo_path, mmap_mode='r')
+        if pontos.ndim != 2 or pontos.shape[1] != 2:
+            raise ValueError(f"{arquivo_path.name}: esperado formato (n, 2), encontrado {pontos.shape}")
+        return pontos
+    
+    tamanho = arquivo_path.stat().st_size
+    if tamanho % 16:
+        raise ValueError(f"{arquivo_path.name}: tamanho ({tamanho} bytes) não é múltiplo de 16 (pares X/Y float64)")
+    if tamanho == 0:
+        return np.empty((0, 2), dtype='<f8')
+    return np.memmap(arquivo_path, dtype='<f8', mode='r').reshape(-1, 2)
+
+
+def _como_float(valores):
+    # Vetor float 1-D; textos não numéricos viram NaN
+    valores = np.asarray(valores)
+    if valores.dtype.kind in 'fiu':
+        return valores.astype(float, copy=False).ravel()
+    return pd.to_numeric(pd.Series(valores.ravel()), errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+
+
+def _agrupar_por_zona(zonas, sul, validos):
+    # [((zona, hemisfério), índices), ...] dos pontos válidos, via uma única ordenação
+    indices = validos.nonzero()[0]
+    if indices.size == 0:
+        return []
+    
+    chaves = zonas[indices].astype(np.int64) * 2 + sul[indices]
+    ordem = np.argsort(chaves, kind='stable')
+    chaves = chaves[ordem]
+    indices = indices[ordem]
+    inicios = np.flatnonzero(np.r_[True, chaves[1:] != chaves[:-1]])
+    
+    return [((int(chaves[i] // 2), 'S' if chaves[i] % 2 else 'N'), grupo)
+            for i, grupo in zip(inicios, np.split(indices, inicios[1:]))]
+
+
+def interpretar_zonas(valores, hemisferio_padrao='S'):
+    """
+    Interpreta uma coluna de zonas UTM como "23", "23S", "22 N", "23K" ou 23.0
+    
+    O sufixo define o hemisfério: 'S'/'Sul' e as bandas C-M são Sul, 'N'/'Norte'
+    e as bandas P-X são Norte; sem sufixo vale o hemisfério padrão.
+    
+    Args:
+        valores (array-like): Valores da coluna de zona
+        hemisferio_padrao (str): Hemisfério para zonas sem sufixo
+    
+    Returns:
+        tuple: (zonas, hemisferios) como numpy.ndarray; zonas inválidas ou
+               vazias ficam como NaN
+    """
+    hemisferio_padrao = str(hemisferio_padrao).upper()
+    
+    # Colunas de zona têm poucos valores distintos: interpreta só os únicos
+    codigos, unicos = pd.factorize(pd.Series(np.asarray(valores, dtype=object).ravel()), use_na_sentinel=False)
+    partes = pd.Series(unicos, dtype=object).astype(str).str.strip().str.upper().str.extract(
+        r'^(\d{1,2})(?:[.,]0*)?\s*([A-Z]*)$')
+    
+    zonas_unicas = pd.to_numeric(partes[0], errors='coerce').to_numpy(dtype=float, na_value=np.nan, copy=True)
+    zonas_unicas[(zonas_unicas < 1) | (zonas_unicas > 60)] = np.nan
+    
+    letras = partes[1].fillna('').str[:1]
+    hems_unicos = np.array([_hemisferio_da_letra(letra, hemisferio_padrao) for letra in letras], dtype=object)
+    zonas_unicas[hems_unicos == None] = np.nan  # noqa: E711 (comparação elemento a elemento)
+    
+    return zonas_unicas[codigos], hems_unicos[codigos]
+
+
+def _hemisferio_da_letra(letra, hemisferio_padrao):
+    if letra == '':
+        return hemisferio_padrao
+    if letra == 'N':
+        return 'N'
+    if letra == 'S' or 'C' <= letra <= 'M':
+        return 'S'
+    if 'P' <= letra <= 'X':
+        return 'N'
+    return None
+
+
+def interpretar_hemisferios(valores):
+    """
+    Interpreta uma coluna de hemisférios ('N', 'S', 'Norte', 'Sul', ...)
+    
+    Args:
+        valores (array-like): Valores da coluna de hemisfério
+    
+    Returns:
+        numpy.ndarray: 'N', 'S' ou None (valor não reconhecido) para cada linha
+    """
+    codigos, unicos = pd.factorize(pd.Series(np.asarray(valores, dtype=object).ravel()), use_na_sentinel=False)
+    letras = pd.Series(unicos, dtype=object).astype(str).str.strip().str.upper().str[:1]
+    hems_unicos = np.array([letra if letra in ('N', 'S') else None for letra in letras], dtype=object)
+    return hems_unicos[codigos]
+
+
+def letra_para_indice(letra):
+    """
+    Converte a letra de uma coluna (como no Excel) para índice (A=0, B=1, ...)
+    
+    Args:
+        letra (str): Letra da coluna
+    
+    Returns:
+        int: Índice da coluna
+    """
+    try:
+        return ord(letra.upper()) - ord('A')
+    except (TypeError, AttributeError):
+        raise ValueError(f"Letra de coluna inválida: {letra}")
+
+
+def valores_numericos(serie):
+    """
+    Interpreta uma coluna de coordenadas como números, aceitando vírgula decimal
+    
+    Args:
+        serie (pandas.Series): Coluna com números ou textos como "168104,21"
+    
+    Returns:
+        numpy.ndarray: Valores float, com NaN onde o texto não é numérico
+    """
+    if pd.api.types.is_numeric_dtype(serie.dtype) and not pd.api.types.is_bool_dtype(serie.dtype):
+        return serie.to_numpy(dtype=float, na_value=np.nan)
+    
+    # A coluna inteira vira um único texto e a vírgula é trocada de uma vez,
+    # sem criar uma string intermediária por célula
+    textos = serie.astype(str).tolist()
+    partes = '\n'.join(textos).replace(',', '.').split('\n')
+    
+    if len(partes) != len(textos):
+        # Alguma célula tem quebra de linha: interpreta célula a célula
+        partes = serie.astype(str).str.replace(',', '.', regex=False).tolist()
+    elif '_' not in ''.join(partes):
+        # Caminho rápido: float() do Python (arredondamento correto, aceita
+        # espaços nas pontas) em todas as células de uma vez. O "_" fica de
+        # fora porque o float() aceita "1_000" e o to_numeric não
+        try:
+            return np.array(partes, dtype=float)
+        except ValueError:
+            pass
+    
+    # Alguma célula não é numérica: NaN nas inválidas
+    return pd.to_numeric(np.array(partes, dtype=object), errors='coerce').astype(float, copy=False)
+
+
+@functools.lru_cache(maxsize=16)
+def _tabelas_dms(casas_decimais, separador, separador_decimal, hemisferios):
+    # Textos pré-montados para cada parte do "GG MM SS,SSS H"
+    graus = np.array([f"{g}{separador}" for g in range(361)])
+    minutos_segundos = np.array([f"{m:02d}{separador}{s}"
+                                 for m in range(60) for s in range(60)])
+    if casas_decimais == 0:
+        fracao = np.array([''])
+    elif casas_decimais <= 4:
+        fracao = np.array([f"{separador_decimal}{f:0{casas_decimais}d}"
+                           for f in range(10 ** casas_decimais)])
+    else:
+        fracao = None
+    hemisferio = np.array([f"{separador}{hemisferios[0]}", f"{separador}{hemisferios[1]}"])
+    return graus, minutos_segundos, fracao, hemisferio
+
+
+def formatar_dms_lote(graus_decimais, hemisferios=('E', 'W'), casas_decimais=3,
+                      separador=' ', separador_decimal=','):
+    """
+    Formata vetores de graus decimais no estilo brasileiro "48 05 57,108 W"
+    
+    A decomposição em graus, minutos e segundos é feita sobre inteiros já
+    arredondados, então segundos que arredondam para 60 passam corretamente
+    para o minuto (e o grau) seguinte ("44 49 59,9996" -> "44 50 0,000").
+    A letra segue o sinal do valor, inclusive entre -1 e 0 grau
+    ("0 30 0,000 W"); valores que arredondam para zero recebem a letra positiva.
+    
+    Args:
+        graus_decimais (array-like): Coordenadas em graus decimais
+        hemisferios (tuple): Letras para valores (positivos, negativos),
+                             ('E', 'W') para longitude ou ('N', 'S') para latitude
+        casas_decimais (int): Número de casas decimais dos segundos
+        separador (str): Separador entre graus, minutos, segundos e hemisfério
+        separador_decimal (str): Separador decimal dos segundos
+    
+    Returns:
+        numpy.ndarray: Array de objetos com os textos (None onde o valor não é finito)
+    """
+    valores = np.asarray(graus_decimais, dtype=float)
+    resultado = np.full(valores.shape, None, dtype=object)
+    finitos = np.isfinite(valores)
+    if not finitos.any():
+        return resultado
+    
+    valores = valores[finitos]
+    tab_graus, tab_min_seg, tab_fracao, tab_hem = _tabelas_dms(
+        int(casas_decimais), separador, separador_decimal, tuple(hemisferios))
+    
+    # Tudo em unidades de 10^-casas segundos
+    escala = 10 ** int(casas_decimais)
+    total = np.rint(np.abs(valores) * (3600 * escala)).astype(np.int64)
+    graus, resto = np.divmod(total, 3600 * escala)
+    minutos_segundos, fracao = np.divmod(resto, escala)
+    
+    if graus.max() < len(tab_graus):
+        textos = tab_graus[graus]
+    else:
+        textos = np.char.add(graus.astype(str), separador)
+    
+    textos = np.char.add(textos, tab_min_seg[minutos_segundos])
+    
+    if tab_fracao is not None:
+        textos = np.char.add(textos, tab_fracao[fracao])
+    else:
+        textos = np.char.add(textos, np.char.add(
+            separador_decimal, np.char.zfill(fracao.astype(str), int(casas_decimais))))
+    
+    textos = np.char.add(textos, tab_hem[((valores < 0) & (total > 0)).astype(np.intp)])
+    
+    resultado[finitos] = textos.astype(object)
+    return resultado
+
+
+def pontos_unicos(x, y, zonas=None, hemisferios=None):
+    """
+    Identifica as combinações distintas de (x, y, zona, hemisfério)
+    
+    Args:
+        x (numpy.ndarray): Coordenadas X
+        y (numpy.ndarray): Coordenadas Y
+        zonas (numpy.ndarray): Zona de cada ponto (opcional)
+        hemisferios (numpy.ndarray): Hemisfério de cada ponto (opcional)
+    
+    Returns:
+        tuple: (codigos, primeiros) como numpy.ndarray, onde codigos[i] é o
+               número da combinação do ponto i (na ordem da primeira ocorrência)
+               e primeiros[k] é a linha onde a combinação k aparece primeiro
+    """
+    # Um único hash sobre x + iy; NaN vira uma combinação como outra qualquer
+    codigos, unicos = pd.factorize(x + 1j * y, use_na_sentinel=False)
+    
+    if zonas is not None or hemisferios is not None:
+        zonas = np.broadcast_to(np.nan if zonas is None else zonas, x.shape)
+        hems = np.broadcast_to(np.asarray(hemisferios if hemisferios is not None else '', dtype=object), x.shape)
+        chave_zona = np.asarray(zonas, dtype=float) * 3 + np.where(hems == 'S', 1, np.where(hems == 'N', 0, 2))
+        codigos_zona, unicos_zona = pd.factorize(chave_zona, use_na_sentinel=False)
+        codigos, unicos = pd.factorize(codigos.astype(np.int64) * len(unicos_zona) + codigos_zona,
+                                       use_na_sentinel=False)
+    
+    primeiros = np.empty(len(unicos), dtype=np.int64)
+    primeiros[codigos[::-1]] = np.arange(len(codigos) - 1, -1, -1)
+    return codigos, primeiros
+
+
+def converter_colunas_df(df, idx_x, idx_y, conversor=None, idx_zona=None, idx_hemisferio=None,
+                         instrumentacao=None, estatisticas=None, paralelo=None, decimais=False,
+                         formatar=True):
+    """
+    Converte as colunas X/Y de um DataFrame de uma só vez (motor colunar)
+    
+    As colunas são interpretadas em bloco, transformadas em uma única chamada
+    ao pyproj e reescritas inteiras no formato "GG MM SS,SSS H". Linhas cujos
+    valores não puderem ser convertidos mantêm os valores originais.
+    
+    Pontos repetidos (mesmos x, y, zona e hemisfério, como vértices de
+    controle reobservados) são transformados e formatados uma única vez e o
+    resultado é copiado para todas as linhas em que aparecem.
+    
+    Args:
+        df (pandas.DataFrame): DataFrame com os dados
+        idx_x (int): Índice da coluna X (Easting)
+        idx_y (int): Índice da coluna Y (Northing)
+        conversor (ConversorUTM): Conversor a usar (padrão: SIRGAS2000 23S)
+        idx_zona (int): Índice da coluna com a zona de cada linha (opcional)
+        idx_hemisferio (int): Índice da coluna com o hemisfério de cada linha (opcional)
+        instrumentacao (Instrumentacao): Registra o tempo de cada etapa (opcional)
+        estatisticas (dict): Acumula 'linhas' e 'duplicadas' (linhas com um
+                             ponto já visto no DataFrame) (opcional)
+        paralelo (ConversorParalelo): Projeta e formata os pontos em um pool de
+                                      processos, no lugar do processo atual (opcional)
+        decimais (bool): Acrescenta as colunas float64 'longitude_dec' e
+                         'latitude_dec' (NaN nas linhas não convertidas)
+        formatar (bool): Reescreve X/Y no formato GG MM SS; com False as colunas
+                         X/Y ficam como estão (útil junto com decimais)
+    
+    Returns:
+        tuple: (DataFrame convertido, máscara numpy das linhas convertidas)
+    """
+    if conversor is None:
+        conversor = ConversorUTM()
+    
+    n_colunas = len(df.columns)
+    indices = [i for i in (idx_x, idx_y, idx_zona, idx_hemisferio) if i is not None]
+    if not all(0 <= i < n_colunas for i in indices):
+        raise IndexError(f"Colunas fora do arquivo ({n_colunas} colunas): {indices}")
+    
+    coluna_x = df.iloc[:, idx_x]
+    coluna_y = df.iloc[:, idx_y]
+    linhas = len(df)
+    
+    with medir(instrumentacao, 'interpretacao', linhas):
+        x = valores_numericos(coluna_x)
+        y = valores_numericos(coluna_y)
+        
+        # Zona/hemisfério por linha, quando houver colunas para isso
+        zonas = None
+        hemisferios = None
+        if idx_zona is not None:
+            zonas, hemisferios = interpretar_zonas(df.iloc[:, idx_zona], conversor.hemisferio)
+        if idx_hemisferio is not None:
+            hemisferios = interpretar_hemisferios(df.iloc[:, idx_hemisferio])
+        
+        # Daqui em diante só os pontos distintos são processados
+        codigos, primeiros = pontos_unicos(x, y, zonas, hemisferios)
+        repetidos = len(primeiros) < linhas
+        if repetidos:
+            x, y = x[primeiros], y[primeiros]
+            zonas = zonas[primeiros] if zonas is not None else None
+            hemisferios = hemisferios[primeiros] if hemisferios is not None else None
+    
+    duplicadas = linhas - len(primeiros)
+    if estatisticas is not None:
+        estatisticas['linhas'] = estatisticas.get('linhas', 0) + linhas
+        estatisticas['duplicadas'] = estatisticas.get('duplicadas', 0) + duplicadas
+    if instrumentacao is not None:
+        instrumentacao.contar('pontos_duplicados', duplicadas)
+    
+    with medir(instrumentacao, 'projecao', len(primeiros)):
+        if paralelo is not None:
+            # Projeção e formatação juntas, nos processos do pool
+            lon, lat, validos, lon_formatado, lat_formatado = paralelo.projetar_e_formatar(
+                x, y, zonas, hemisferios, formatar)
+        else:
+            lon, lat, validos = conversor.utm_para_geografica_lote(x, y, zonas, hemisferios)
+    
+    with medir(instrumentacao, 'formatacao', len(primeiros)):
+        if formatar and paralelo is None:
+            # Pontos inválidos saem como None e não são usados
+            lon_formatado = formatar_dms_lote(lon, ('E', 'W'))
+            lat_formatado = formatar_dms_lote(lat, ('N', 'S'))
+        
+        # Devolve cada ponto distinto a todas as linhas em que aparece
+        if repetidos:
+            validos = validos[codigos]
+            if formatar:
+                lon_formatado = lon_formatado[codigos]
+                lat_formatado = lat_formatado[codigos]
+            if decimais:
+                lon = lon[codigos]
+                lat = lat[codigos]
+        
+        # Cópia rasa: só as colunas convertidas são substituídas
+        df_convertido = df.copy(deep=False)
+        
+        if formatar:
+            novos_x = _como_texto(coluna_x)
+            novos_y = _como_texto(coluna_y)
+            novos_x[validos] = lon_formatado[validos]
+            novos_y[validos] = lat_formatado[validos]
+            
+            df_convertido.isetitem(idx_x, novos_x)
+            df_convertido.isetitem(idx_y, novos_y)
+        
+        if decimais:
+            df_convertido['longitude_dec'] = lon
+            df_convertido['latitude_dec'] = lat
+    
+    return df_convertido, validos
+
+
+def _como_texto(coluna):
+    # Valores originais como vetor object; colunas não textuais (ex.: Parquet) viram texto
+    if pd.api.types.is_string_dtype(coluna.dtype) or coluna.dtype == object:
+        return coluna.to_numpy(dtype=object, copy=True)
+    return coluna.astype(str).to_numpy(dtype=object)
+
+
 def detectar_colunas_utm(df):
     """
     Detecta automaticamente colunas UTM no DataFrame
@@ -180,6 +876,13 @@ def detectar_colunas_utm(df):
 
 
 if __name__ == "__main__":
+    import sys
+    
+    # Com argumentos, funciona como linha de comando: python -m conversor_utm convert ...
+    if len(sys.argv) > 1:
+        from linha_comando import main
+        sys.exit(main(sys.argv[1:]))
+    
     # Teste do módulo
     conversor = ConversorUTM()
     
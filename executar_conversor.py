@@ -5,25 +5,20 @@ Integra a interface gráfica com o módulo de conversão
 Configurado para SIRGAS 2000 UTM Zone 23S (Brasil)
 """
 
-from interface_grafica import InterfaceConversaoUTM
+import importlib.util
 import sys
 import tkinter as tk
 from tkinter import messagebox
 
 
+# Pacotes necessários para a conversão
+DEPENDENCIAS = ("numpy", "pandas", "pyproj")
+
+
 def verificar_dependencias():
-    """Verifica se todas as dependências estão instaladas"""
-    dependencias_faltando = []
-    
-    try:
-        import pandas
-    except ImportError:
-        dependencias_faltando.append("pandas")
-    
-    try:
-        import pyproj
-    except ImportError:
-        dependencias_faltando.append("pyproj")
+    """Verifica se todas as dependências estão instaladas (sem importá-las)"""
+    # find_spec só localiza o pacote; a importação fica para a primeira conversão
+    dependencias_faltando = [nome for nome in DEPENDENCIAS if importlib.util.find_spec(nome) is None]
     
     if dependencias_faltando:
         root = tk.Tk()
@@ -59,9 +54,10 @@ def main():
     try:
         # Inicia a interface gráfica
         print("\nIniciando interface gráfica...")
+        from interface_grafica import InterfaceConversaoUTM
         app = InterfaceConversaoUTM()
         app.executar()
-        
+    
     except Exception as e:
         print(f"\nERRO: {str(e)}")
         
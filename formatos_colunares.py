@@ -0,0 +1,148 @@
+"""
+Leitura e gravação de arquivos Parquet e Feather (opcional, requer pyarrow)
+
+Os arquivos são lidos e gravados em blocos de linhas, como os CSV, para que
+o uso de memória não cresça com o tamanho do arquivo. O pyarrow só é
+importado quando um desses formatos é usado.
+"""
+
+from pathlib import Path
+
+
+# Formato de cada extensão aceita
+FORMATOS_COLUNARES = {
+    '.parquet': 'parquet',
+    '.feather': 'feather',
+}
+
+
+def importar_pyarrow():
+    """
+    Importa o pyarrow sob demanda
+    
+    Returns:
+        module: Módulo pyarrow
+    """
+    try:
+        import pyarrow
+    except ImportError:
+        raise Exception("Arquivos Parquet/Feather exigem o pacote pyarrow (pip install pyarrow)")
+    return pyarrow
+
+
+def formato_colunar(arquivo_path):
+    """Retorna 'parquet' ou 'feather' conforme a extensão, ou None para outros arquivos"""
+    return FORMATOS_COLUNARES.get(Path(arquivo_path).suffix.lower())
+
+
+def ler_blocos_colunares(arquivo_path, tamanho_bloco=None):
+    """
+    Lê um arquivo Parquet ou Feather em blocos de linhas
+    
+    Args:
+        arquivo_path (Path): Arquivo de entrada
+        tamanho_bloco (int): Linhas por bloco (None lê o arquivo inteiro de uma vez)
+    
+    Yields:
+        pandas.DataFrame: Cada bloco, com os tipos de coluna do arquivo
+    """
+    pa = importar_pyarrow()
+    formato = formato_colunar(arquivo_path)
+    
+    if formato == 'parquet':
+        import pyarrow.parquet as pq
+        arquivo = pq.ParquetFile(arquivo_path)
+        if tamanho_bloco:
+            for lote in arquivo.iter_batches(batch_size=int(tamanho_bloco)):
+                yield lote.to_pandas()
+        else:
+            yield arquivo.read().to_pandas()
+    elif formato == 'feather':
+        # Arquivo Arrow mapeado em memória, lido lote a lote: com compressão
+        # (lz4 no GravadorColunar) só o lote em uso é descomprimido
+        with pa.memory_map(str(arquivo_path)) as origem:
+            leitor = pa.ipc.open_file(origem)
+            if not tamanho_bloco:
+                tabela = leitor.read_all()
+                if tabela.num_rows:
+                    yield tabela.to_pandas()
+                return
+            yield from _reagrupar_lotes(pa, (leitor.get_batch(i) for i in range(leitor.num_record_batches)),
+                                        int(tamanho_bloco))
+    else:
+        raise ValueError(f"Formato colunar não suportado: {arquivo_path}")
+
+
+def _reagrupar_lotes(pa, lotes, tamanho_bloco):
+    # Junta ou divide os lotes do arquivo em blocos de tamanho_bloco linhas
+    pendentes = []
+    linhas = 0
+    for lote in lotes:
+        while lote.num_rows:
+            parte = lote.slice(0, tamanho_bloco - linhas)
+            pendentes.append(parte)
+            linhas += parte.num_rows
+            lote = lote.slice(parte.num_rows)
+            if linhas == tamanho_bloco:
+                yield pa.Table.from_batches(pendentes).to_pandas()
+                pendentes = []
+                linhas = 0
+    if pendentes:
+        yield pa.Table.from_batches(pendentes).to_pandas()
+
+
+class GravadorColunar:
+    """
+    Grava blocos de DataFrames em um arquivo Parquet ou Feather
+    
+    O esquema (nomes e tipos das colunas) é definido pelo primeiro bloco e
+    os seguintes são convertidos para ele. Use com `with`.
+    """
+    
+    def __init__(self, arquivo_path, formato):
+        """
+        Inicializa o gravador
+        
+        Args:
+            arquivo_path (Path): Arquivo de saída
+            formato (str): 'parquet' ou 'feather'
+        """
+        if formato not in FORMATOS_COLUNARES.values():
+            raise ValueError(f"Formato colunar não suportado: {formato}")
+        self._pa = importar_pyarrow()
+        self.arquivo_path = Path(arquivo_path)
+        self.formato = formato
+        self._escritor = None
+        self._esquema = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *erro):
+        self.fechar()
+    
+    def gravar(self, df):
+        """Acrescenta um bloco ao arquivo"""
+        pa = self._pa
+        if self._escritor is None:
+            tabela = pa.Table.from_pandas(df, preserve_index=False)
+            self._esquema = tabela.schema
+            self._escritor = self._abrir(self._esquema)
+        else:
+            tabela = pa.Table.from_pandas(df, schema=self._esquema, preserve_index=False)
+        self._escritor.write_table(tabela)
+    
+    def _abrir(self, esquema):
+        pa = self._pa
+        if self.formato == 'parquet':
+            import pyarrow.parquet as pq
+            return pq.ParquetWriter(str(self.arquivo_path), esquema)
+        compressao = 'lz4' if pa.Codec.is_available('lz4') else None
+        return pa.ipc.new_file(str(self.arquivo_path), esquema,
+                               options=pa.ipc.IpcWriteOptions(compression=compressao))
+    
+    def fechar(self):
+        """Finaliza o arquivo (um arquivo sem blocos não é criado)"""
+        if self._escritor is not None:
+            self._escritor.close()
+            self._escritor = None
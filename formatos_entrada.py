@@ -0,0 +1,45 @@
+"""
+Arquivos aceitos na entrada da conversão
+
+Só usa a biblioteca padrão: a interface gráfica lista os arquivos da pasta
+com estas funções sem carregar o pandas antes da primeira conversão.
+"""
+
+import bz2
+import gzip
+import lzma
+from pathlib import Path
+from formatos_colunares import FORMATOS_COLUNARES
+
+
+# Extensões de entrada aceitas (Parquet/Feather exigem pyarrow)
+EXTENSOES_ENTRADA = ('.csv',) + tuple(FORMATOS_COLUNARES)
+
+# CSV comprimidos aceitos na entrada (ex.: dados.csv.gz) e o módulo que os abre;
+# um .zip é um pacote: cada CSV dentro dele é convertido separadamente
+COMPRESSOES = {'.gz': gzip.open, '.xz': lzma.open, '.bz2': bz2.open}
+EXTENSAO_PACOTE = '.zip'
+
+
+def arquivo_de_entrada(arquivo_path):
+    """Indica se o arquivo pode ser convertido (CSV, Parquet, Feather, CSV comprimido ou .zip)"""
+    sufixos = [sufixo.lower() for sufixo in Path(arquivo_path).suffixes[-2:]]
+    if not sufixos:
+        return False
+    if sufixos[-1] in EXTENSOES_ENTRADA or sufixos[-1] == EXTENSAO_PACOTE:
+        return True
+    return sufixos[-1] in COMPRESSOES and sufixos[:-1] == ['.csv']
+
+
+def arquivos_de_entrada(pasta):
+    """
+    Lista os arquivos convertíveis de uma pasta (sem entrar em subpastas)
+    
+    Args:
+        pasta (Path): Pasta a listar
+    
+    Returns:
+        list: Caminhos dos arquivos, em ordem alfabética
+    """
+    return sorted(arquivo for arquivo in Path(pasta).iterdir()
+                  if arquivo.is_file() and arquivo_de_entrada(arquivo))
@@ -0,0 +1,170 @@
+"""
+Instrumentação opcional do pipeline de conversão
+
+Registra tempo de parede e quantidade de linhas de cada etapa (detecção do
+formato, leitura, interpretação numérica, projeção, formatação DMS e
+gravação) e gera um relatório estruturado. Permite anexar o cProfile ou uma
+função própria chamada ao fim de cada etapa.
+"""
+
+import contextlib
+import cProfile
+import io
+import pstats
+import time
+
+
+# Etapas do pipeline, na ordem em que acontecem
+ETAPAS = ['deteccao', 'leitura', 'interpretacao', 'projecao', 'formatacao', 'gravacao']
+
+
+class Instrumentacao:
+    def __init__(self, perfil=False, ao_registrar=None):
+        """
+        Inicializa a instrumentação
+        
+        Args:
+            perfil (bool): Anexa o cProfile durante as etapas
+            ao_registrar (callable): Chamada como ao_registrar(etapa, segundos, linhas)
+                                     ao fim de cada etapa
+        """
+        self.etapas = {}
+        self.contadores = {}
+        self.ao_registrar = ao_registrar
+        self._perfil = cProfile.Profile() if perfil else None
+        self._inicio = time.perf_counter()
+    
+    @contextlib.contextmanager
+    def etapa(self, nome, linhas=0):
+        """
+        Mede uma etapa (use com `with`)
+        
+        O `with` entrega um dict {'linhas': int} que pode ser atualizado
+        dentro do bloco, quando a quantidade de linhas só é conhecida no fim.
+        
+        Args:
+            nome (str): Nome da etapa
+            linhas (int): Linhas processadas na etapa
+        """
+        medicao = {'linhas': linhas}
+        if self._perfil is not None:
+            self._perfil.enable()
+        inicio = time.perf_counter()
+        try:
+            yield medicao
+        finally:
+            segundos = time.perf_counter() - inicio
+            if self._perfil is not None:
+                self._perfil.disable()
+            self.registrar(nome, segundos, medicao['linhas'])
+    
+    def registrar(self, nome, segundos, linhas=0):
+        """Acumula o tempo e as linhas de uma etapa"""
+        registro = self.etapas.setdefault(nome, {'segundos': 0.0, 'linhas': 0, 'chamadas': 0})
+        registro['segundos'] += segundos
+        registro['linhas'] += int(linhas)
+        registro['chamadas'] += 1
+        if self.ao_registrar is not None:
+            self.ao_registrar(nome, segundos, linhas)
+    
+    def contar(self, nome, valor=1):
+        """Soma um valor a um contador livre (ex.: linhas rejeitadas)"""
+        self.contadores[nome] = self.contadores.get(nome, 0) + valor
+    
+    def perfil_texto(self, limite=25):
+        """
+        Retorna as funções mais custosas segundo o cProfile
+        
+        Args:
+            limite (int): Quantidade de funções listadas
+        
+        Returns:
+            str: Saída do pstats ordenada por tempo acumulado (None sem perfil)
+        """
+        if self._perfil is None:
+            return None
+        saida = io.StringIO()
+        pstats.Stats(self._perfil, stream=saida).sort_stats('cumulative').print_stats(limite)
+        return saida.getvalue()
+    
+    def relatorio(self):
+        """
+        Gera o relatório estruturado da instrumentação
+        
+        Returns:
+            dict: {'total_segundos': float, 'etapas': {nome: {'segundos', 'linhas',
+                   'chamadas', 'linhas_por_segundo'}}, 'contadores': dict,
+                   'perfil': str ou None}
+        """
+        etapas = {}
+        for nome in sorted(self.etapas, key=_ordem_etapa):
+            registro = self.etapas[nome]
+            etapas[nome] = {
+                'segundos': round(registro['segundos'], 6),
+                'linhas': registro['linhas'],
+                'chamadas': registro['chamadas'],
+                'linhas_por_segundo': (round(registro['linhas'] / registro['segundos'], 1)
+                                       if registro['segundos'] > 0 and registro['linhas'] else None)
+            }
+        return {
+            'total_segundos': round(time.perf_counter() - self._inicio, 6),
+            'etapas': etapas,
+            'contadores': dict(self.contadores),
+            'perfil': self.perfil_texto()
+        }
+
+
+def _ordem_etapa(nome):
+    return (ETAPAS.index(nome) if nome in ETAPAS else len(ETAPAS), nome)
+
+
+def medir(instrumentacao, nome, linhas=0):
+    """
+    Atalho para instrumentacao.etapa() que não faz nada sem instrumentação
+    
+    Args:
+        instrumentacao (Instrumentacao): Instrumentação ou None
+        nome (str): Nome da etapa
+        linhas (int): Linhas processadas na etapa
+    
+    Returns:
+        Gerenciador de contexto para usar com `with`
+    """
+    if instrumentacao is None:
+        return contextlib.nullcontext()
+    return instrumentacao.etapa(nome, linhas)
+
+
+def somar_relatorios(relatorios):
+    """
+    Soma os relatórios de vários arquivos em um relatório geral
+    
+    Args:
+        relatorios (list): Relatórios gerados por Instrumentacao.relatorio()
+    
+    Returns:
+        dict: {'etapas': {nome: {'segundos', 'linhas', 'chamadas', 'linhas_por_segundo'}},
+               'contadores': dict}
+    """
+    etapas = {}
+    contadores = {}
+    for relatorio in relatorios:
+        if not relatorio:
+            continue
+        for nome, registro in relatorio.get('etapas', {}).items():
+            soma = etapas.setdefault(nome, {'segundos': 0.0, 'linhas': 0, 'chamadas': 0})
+            soma['segundos'] += registro['segundos']
+            soma['linhas'] += registro['linhas']
+            soma['chamadas'] += registro['chamadas']
+        for nome, valor in relatorio.get('contadores', {}).items():
+            contadores[nome] = contadores.get(nome, 0) + valor
+    
+    for soma in etapas.values():
+        soma['segundos'] = round(soma['segundos'], 6)
+        soma['linhas_por_segundo'] = (round(soma['linhas'] / soma['segundos'], 1)
+                                      if soma['segundos'] > 0 and soma['linhas'] else None)
+    
+    return {
+        'etapas': dict(sorted(etapas.items(), key=lambda item: _ordem_etapa(item[0]))),
+        'contadores': contadores
+    }
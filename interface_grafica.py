@@ -5,11 +5,16 @@ Sistema específico para SIRGAS 2000 UTM Zone 23S
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import pandas as pd
 import os
 import json
+import queue
+import threading
+import time
 from pathlib import Path
-from conversor_utm import ConversorUTM
+from formatos_entrada import arquivos_de_entrada
+
+# O motor de conversão (pandas, pyproj) só é importado na primeira conversão,
+# para a janela abrir rápido
 
 
 class InterfaceConversaoUTM:
@@ -24,7 +29,20 @@ class InterfaceConversaoUTM:
         self.pasta_destino = tk.StringVar()
         self.coluna_x = tk.StringVar()
         self.coluna_y = tk.StringVar()
-        self.conversor = ConversorUTM(zona_utm=23, hemisferio='S', datum='SIRGAS2000')
+        self.coluna_zona = tk.StringVar()
+        self.incremental = tk.BooleanVar(value=False)
+        self._conversor = None  # criado na primeira conversão
+        self.tamanho_bloco = None  # None usa o padrão de processamento_lote
+        self.workers = None  # None usa todos os núcleos
+        
+        # Conversão em segundo plano
+        self.fila_progresso = queue.Queue()
+        self.evento_cancelar = threading.Event()
+        self.thread_conversao = None
+        
+        # Monitoramento da pasta de origem
+        self.monitor = None
+        self.fila_monitor = queue.Queue()
         
         # Carrega configurações salvas
         self.carregar_configuracoes()
@@ -37,6 +55,14 @@ class InterfaceConversaoUTM:
         
         self.criar_interface()
     
+    @property
+    def conversor(self):
+        """Conversor UTM, criado (e o motor de conversão importado) no primeiro uso"""
+        if self._conversor is None:
+            from conversor_utm import ConversorUTM
+            self._conversor = ConversorUTM(zona_utm=23, hemisferio='S', datum='SIRGAS2000')
+        return self._conversor
+    
     def criar_interface(self):
         """Cria a interface gráfica"""
         
@@ -95,6 +121,13 @@ class InterfaceConversaoUTM:
         ttk.Label(config_frame, text="Exemplos: B, D | A, C | E, F | X, Y", 
                  font=('Arial', 8), foreground='blue').grid(row=2, column=0, columnspan=4, pady=(2, 0))
         
+        ttk.Label(config_frame, text="Coluna Zona (opcional):").grid(row=3, column=0, sticky=tk.W, padx=5, pady=(10, 0))
+        self.entry_col_zona = ttk.Entry(config_frame, textvariable=self.coluna_zona, width=5)
+        self.entry_col_zona.grid(row=3, column=1, sticky=(tk.W, tk.E), padx=5, pady=(10, 0))
+        
+        ttk.Label(config_frame, text="Vazio = zona 23S para todas as linhas | 'auto' = coluna zona/fuso do arquivo", 
+                 font=('Arial', 8), foreground='gray').grid(row=3, column=2, columnspan=2, sticky=tk.W, pady=(10, 0))
+        
         # Seção 3: Pasta destino
         ttk.Label(main_frame, text="3. Pasta de Destino:", 
                  font=('Arial', 10, 'bold')).grid(row=6, column=0, sticky=tk.W, pady=(20, 5))
@@ -105,12 +138,20 @@ class InterfaceConversaoUTM:
         ttk.Button(main_frame, text="Selecionar Pasta", 
                   command=self.selecionar_pasta_destino).grid(row=7, column=2, padx=(5, 0))
         
+        ttk.Checkbutton(main_frame, text="Converter apenas arquivos novos ou alterados", 
+                       variable=self.incremental).grid(row=8, column=0, columnspan=3, sticky=tk.W, pady=(10, 0))
+        
         # Seção 4: Botões de ação
         buttons_frame = ttk.Frame(main_frame)
-        buttons_frame.grid(row=8, column=0, columnspan=3, pady=(30, 0))
+        buttons_frame.grid(row=9, column=0, columnspan=3, pady=(30, 0))
+        
+        self.botao_converter = ttk.Button(buttons_frame, text="Converter TODOS os Arquivos", 
+                                          command=self.converter_todos_arquivos, style='Accent.TButton')
+        self.botao_converter.pack(side=tk.LEFT, padx=5)
         
-        ttk.Button(buttons_frame, text="Converter TODOS os Arquivos", 
-                  command=self.converter_todos_arquivos, style='Accent.TButton').pack(side=tk.LEFT, padx=5)
+        self.botao_monitorar = ttk.Button(buttons_frame, text="Monitorar Pasta", 
+                                          command=self.alternar_monitoramento)
+        self.botao_monitorar.pack(side=tk.LEFT, padx=5)
         
         ttk.Button(buttons_frame, text="Salvar Configurações", 
                   command=self.salvar_configuracoes).pack(side=tk.LEFT, padx=5)
@@ -121,8 +162,23 @@ class InterfaceConversaoUTM:
         ttk.Button(buttons_frame, text="Sair", 
                   command=self.root.quit).pack(side=tk.LEFT, padx=5)
         
+        # Seção 5: Progresso da conversão
+        progress_frame = ttk.Frame(main_frame)
+        progress_frame.grid(row=10, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(20, 0))
+        progress_frame.columnconfigure(0, weight=1)
+        
+        self.barra_progresso = ttk.Progressbar(progress_frame, mode='determinate')
+        self.barra_progresso.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=(0, 5))
+        
+        self.botao_cancelar = ttk.Button(progress_frame, text="Cancelar", 
+                                         command=self.cancelar_conversao, state=tk.DISABLED)
+        self.botao_cancelar.grid(row=0, column=1, padx=(5, 0))
+        
+        self.status_progresso = ttk.Label(progress_frame, text="", font=('Arial', 9), foreground='gray')
+        self.status_progresso.grid(row=1, column=0, columnspan=2, sticky=tk.W, pady=(5, 0))
+        
         # Configurar peso das linhas
-        main_frame.rowconfigure(9, weight=1)
+        main_frame.rowconfigure(11, weight=1)
     
     def carregar_configuracoes(self):
         """Carrega configurações salvas"""
@@ -131,7 +187,7 @@ class InterfaceConversaoUTM:
             if config_file.exists():
                 with open(config_file, 'r', encoding='utf-8') as f:
                     config = json.load(f)
-                    
+                
                 # Define pasta inicial se existir
                 if 'pasta_origem' in config and Path(config['pasta_origem']).exists():
                     self.pasta_origem.set(config['pasta_origem'])
@@ -144,7 +200,13 @@ class InterfaceConversaoUTM:
                 
                 if 'coluna_y' in config:
                     self.coluna_y.set(config['coluna_y'])
-                    
+                
+                if 'coluna_zona' in config:
+                    self.coluna_zona.set(config['coluna_zona'])
+                
+                if 'incremental' in config:
+                    self.incremental.set(bool(config['incremental']))
+        
         except Exception as e:
             print(f"Erro ao carregar configurações: {e}")
     
@@ -155,12 +217,14 @@ class InterfaceConversaoUTM:
                 'pasta_origem': self.pasta_origem.get(),
                 'pasta_destino': self.pasta_destino.get(),
                 'coluna_x': self.coluna_x.get(),
-                'coluna_y': self.coluna_y.get()
+                'coluna_y': self.coluna_y.get(),
+                'coluna_zona': self.coluna_zona.get(),
+                'incremental': self.incremental.get()
             }
             
             with open("config.json", 'w', encoding='utf-8') as f:
                 json.dump(config, f, ensure_ascii=False, indent=2)
-                
+        
         except Exception as e:
             print(f"Erro ao salvar configurações: {e}")
     
@@ -169,10 +233,9 @@ class InterfaceConversaoUTM:
         pasta = filedialog.askdirectory(title="Selecionar pasta com arquivos CSV")
         if pasta:
             self.pasta_origem.set(pasta)
-            # Verifica se há arquivos CSV na pasta
+            # Verifica se há arquivos CSV na pasta (mesmo filtro da conversão)
             try:
-                pasta_path = Path(pasta)
-                arquivos_csv = list(pasta_path.glob("*.csv"))
+                arquivos_csv = arquivos_de_entrada(pasta)
                 print(f"Encontrados {len(arquivos_csv)} arquivos CSV na pasta selecionada")
             except Exception as e:
                 print(f"Erro ao verificar pasta: {e}")
@@ -204,9 +267,8 @@ class InterfaceConversaoUTM:
             return
         
         try:
-            # Lista todos os arquivos CSV da pasta
-            pasta = Path(self.pasta_origem.get())
-            arquivos_csv = list(pasta.glob("*.csv"))
+            # Lista os arquivos CSV da pasta (também .csv.gz, .zip etc.)
+            arquivos_csv = arquivos_de_entrada(self.pasta_origem.get())
             
             if not arquivos_csv:
                 messagebox.showwarning("Aviso", "Nenhum arquivo CSV encontrado na pasta.")
@@ -224,152 +286,267 @@ class InterfaceConversaoUTM:
             if not resposta:
                 return
             
-            # Processa cada arquivo
-            sucessos = 0
-            erros = 0
-            arquivos_processados = []
-            
-            for arquivo_csv in arquivos_csv:
-                try:
-                    print(f"Processando: {arquivo_csv.name}")
-                    
-                    # Carrega o arquivo
-                    df = self.carregar_arquivo_para_conversao(arquivo_csv)
-                    if df is None:
-                        erros += 1
-                        continue
-                    
-                    # Converte as coordenadas
-                    df_convertido = self.converter_coordenadas_df(df, self.coluna_x.get(), self.coluna_y.get())
-                    
-                    # Salva o arquivo convertido
-                    nome_sem_ext = arquivo_csv.stem
-                    arquivo_destino = Path(self.pasta_destino.get()) / f"{nome_sem_ext}.csv"
-                    
-                    df_convertido.to_csv(arquivo_destino, index=False, encoding='utf-8-sig', sep=';')
-                    
-                    sucessos += 1
-                    arquivos_processados.append(arquivo_csv.name)
-                    print(f"✅ Convertido: {arquivo_csv.name}")
-                    
-                except Exception as e:
-                    erros += 1
-                    print(f"❌ Erro em {arquivo_csv.name}: {str(e)}")
-            
-            # Mostra resultado final
-            mensagem = f"Conversão concluída!\n\n"
-            mensagem += f"✅ Sucessos: {sucessos}\n"
-            mensagem += f"❌ Erros: {erros}\n\n"
-            
-            if sucessos > 0:
-                mensagem += f"Arquivos convertidos:\n"
-                for arquivo in arquivos_processados:
-                    mensagem += f"• {arquivo}\n"
-            
-            if erros > 0:
-                mensagem += f"\nVerifique os erros no console."
-            
-            messagebox.showinfo("Resultado", mensagem)
-            
+            # Parâmetros lidos aqui: a thread de conversão não acessa o Tk
+            parametros = {
+                'pasta_destino': self.pasta_destino.get(),
+                'col_x': self.coluna_x.get(),
+                'col_y': self.coluna_y.get(),
+                'tamanho_bloco': self.tamanho_bloco,
+                'workers': self.workers,
+                'incremental': self.incremental.get(),
+                'col_zona': self.coluna_zona.get().strip() or None
+            }
+            self.iniciar_conversao(arquivos_csv, parametros)
+        
         except Exception as e:
             messagebox.showerror("Erro", f"Erro durante a conversão em lote: {str(e)}")
     
-    def carregar_arquivo_para_conversao(self, arquivo_path):
-        """Carrega um arquivo CSV para conversão"""
+    def iniciar_conversao(self, arquivos, parametros):
+        """Inicia a conversão em uma thread, sem travar a janela"""
+        self.evento_cancelar.clear()
+        self.progresso = {
+            'total': len(arquivos),
+            'concluidos': 0,
+            'linhas': 0,
+            'bytes_total': sum(arquivo.stat().st_size for arquivo in arquivos) or 1,
+            'bytes_concluidos': 0,
+            'tamanhos': {str(arquivo): arquivo.stat().st_size for arquivo in arquivos},
+            'inicio': time.perf_counter()
+        }
+        
+        self.barra_progresso.configure(maximum=len(arquivos), value=0)
+        self.status_progresso.configure(text=f"Convertendo 0 de {len(arquivos)} arquivos...")
+        self.botao_converter.configure(state=tk.DISABLED)
+        self.botao_monitorar.configure(state=tk.DISABLED)
+        self.botao_cancelar.configure(state=tk.NORMAL)
+        
+        self.thread_conversao = threading.Thread(
+            target=self._converter_em_segundo_plano, args=(arquivos, parametros), daemon=True)
+        self.thread_conversao.start()
+        self.root.after(100, self.acompanhar_progresso)
+    
+    def _converter_em_segundo_plano(self, arquivos, parametros):
+        # Executado na thread de conversão: só se comunica com a janela pela fila
         try:
-            # Tenta diferentes codificações e separadores
-            codificacoes = ['latin-1', 'cp1252', 'utf-8', 'utf-8-sig', 'iso-8859-1']
-            separadores = [';', ',', '\t']
-            
-            for encoding in codificacoes:
-                for sep in separadores:
-                    try:
-                        df = pd.read_csv(arquivo_path, encoding=encoding, sep=sep)
-                        # Verifica se carregou corretamente (mais de 1 coluna)
-                        if len(df.columns) > 1:
-                            print(f"✅ Arquivo carregado: {arquivo_path.name} (encoding: {encoding}, sep: '{sep}')")
-                            return df
-                    except:
-                        continue
-            
-            print(f"❌ Não foi possível carregar {arquivo_path.name}")
-            return None
-            
+            # A primeira conversão importa o motor aqui, sem travar a janela
+            from processamento_lote import TAMANHO_BLOCO_PADRAO, converter_arquivos
+            parametros['tamanho_bloco'] = parametros['tamanho_bloco'] or TAMANHO_BLOCO_PADRAO
+            resultados = converter_arquivos(
+                arquivos, parametros.pop('pasta_destino'),
+                parametros.pop('col_x'), parametros.pop('col_y'),
+                conversor=self.conversor,
+                ao_concluir=lambda resultado: self.fila_progresso.put(('arquivo', resultado)),
+                cancelar=self.evento_cancelar,
+                **parametros)
+            self.fila_progresso.put(('fim', resultados))
         except Exception as e:
-            print(f"❌ Erro ao carregar {arquivo_path.name}: {str(e)}")
-            return None
+            self.fila_progresso.put(('erro', str(e)))
+    
+    def acompanhar_progresso(self):
+        """Atualiza barra e status com as mensagens da thread de conversão"""
+        try:
+            while True:
+                tipo, dados = self.fila_progresso.get_nowait()
+                
+                if tipo == 'arquivo':
+                    self.atualizar_progresso(dados)
+                elif tipo == 'fim':
+                    self.finalizar_conversao()
+                    self.mostrar_resultado(dados)
+                    return
+                elif tipo == 'erro':
+                    self.finalizar_conversao()
+                    messagebox.showerror("Erro", f"Erro durante a conversão em lote: {dados}")
+                    return
+        except queue.Empty:
+            pass
+        
+        self.root.after(100, self.acompanhar_progresso)
+    
+    def atualizar_progresso(self, resultado):
+        """Atualiza o progresso com o resultado de um arquivo concluído"""
+        progresso = self.progresso
+        progresso['concluidos'] += 1
+        progresso['linhas'] += resultado.get('linhas', 0)
+        progresso['bytes_concluidos'] += progresso['tamanhos'].get(resultado['origem'], 0)
+        
+        decorrido = time.perf_counter() - progresso['inicio']
+        linhas_por_segundo = progresso['linhas'] / decorrido if decorrido > 0 else 0
+        
+        # Estimativa pelo volume de bytes já processado
+        fracao = progresso['bytes_concluidos'] / progresso['bytes_total']
+        restante = decorrido * (1 - fracao) / fracao if fracao > 0 else 0
+        
+        texto = f"{progresso['concluidos']} de {progresso['total']} arquivos | {linhas_por_segundo:,.0f} linhas/s"
+        if progresso['concluidos'] < progresso['total']:
+            texto += f" | restante: {self.formatar_duracao(restante)}"
+        if self.evento_cancelar.is_set():
+            texto += " | cancelando..."
+        
+        self.barra_progresso.configure(value=progresso['concluidos'])
+        self.status_progresso.configure(text=texto)
+    
+    def formatar_duracao(self, segundos):
+        """Formata segundos como '1h 02min', '3min 05s' ou '12s'"""
+        segundos = int(round(segundos))
+        if segundos >= 3600:
+            return f"{segundos // 3600}h {segundos % 3600 // 60:02d}min"
+        if segundos >= 60:
+            return f"{segundos // 60}min {segundos % 60:02d}s"
+        return f"{segundos}s"
+    
+    def cancelar_conversao(self):
+        """Pede o cancelamento da conversão em andamento"""
+        if self.thread_conversao is not None and self.thread_conversao.is_alive():
+            self.evento_cancelar.set()
+            self.botao_cancelar.configure(state=tk.DISABLED)
+            self.status_progresso.configure(text="Cancelando... aguardando o fim do bloco em andamento")
+    
+    def finalizar_conversao(self):
+        """Restaura os botões ao fim da conversão"""
+        self.thread_conversao = None
+        self.botao_converter.configure(state=tk.NORMAL)
+        self.botao_monitorar.configure(state=tk.NORMAL)
+        self.botao_cancelar.configure(state=tk.DISABLED)
+        self.status_progresso.configure(
+            text="Conversão cancelada." if self.evento_cancelar.is_set() else "Conversão concluída.")
+    
+    def mostrar_resultado(self, resultados):
+        """Mostra o resumo final da conversão"""
+        from processamento_lote import PASTA_REJEITADAS
+        
+        sucessos = sum(1 for r in resultados if r['sucesso'] and not r['pulado'])
+        pulados = sum(1 for r in resultados if r['pulado'])
+        cancelados = sum(1 for r in resultados if r['cancelado'])
+        erros = sum(1 for r in resultados if not r['sucesso'] and not r['cancelado'])
+        arquivos_processados = [r['arquivo'] for r in resultados if r['sucesso'] and not r['pulado']]
+        rejeitadas = sum(r.get('rejeitadas', 0) for r in resultados)
+        
+        # Mostra resultado final (parcial se o usuário cancelou)
+        cancelada = self.evento_cancelar.is_set() and cancelados > 0
+        if cancelada:
+            mensagem = (f"Conversão cancelada: {sucessos + pulados + erros} de {len(resultados)} "
+                        f"arquivo(s) concluído(s) antes do cancelamento.\n\n")
+        else:
+            mensagem = f"Conversão concluída!\n\n"
+        mensagem += f"✅ Sucessos: {sucessos}\n"
+        mensagem += f"❌ Erros: {erros}\n"
+        if pulados > 0:
+            mensagem += f"⏭️ Sem alterações (pulados): {pulados}\n"
+        if cancelados > 0:
+            mensagem += f"⛔ Cancelados: {cancelados}\n"
+        if rejeitadas > 0:
+            mensagem += f"⚠️ Linhas mantidas originais: {rejeitadas} (detalhes na pasta '{PASTA_REJEITADAS}' do destino)\n"
+        mensagem += "\n"
+        
+        if sucessos > 0:
+            mensagem += f"Arquivos convertidos:\n"
+            for arquivo in arquivos_processados:
+                mensagem += f"• {arquivo}\n"
+        
+        if erros > 0:
+            mensagem += f"\nVerifique os erros no console."
+        
+        if cancelada:
+            messagebox.showwarning("Conversão cancelada", mensagem)
+        else:
+            messagebox.showinfo("Resultado", mensagem)
+    
+    def carregar_arquivo_para_conversao(self, arquivo_path):
+        """Carrega um arquivo CSV para conversão"""
+        from processamento_lote import carregar_arquivo
+        return carregar_arquivo(arquivo_path)
     
     def converter_coordenadas_df(self, df, col_x, col_y):
         """Converte coordenadas de um DataFrame usando letras de colunas - substitui na mesma coluna"""
+        from conversor_utm import converter_colunas_df, letra_para_indice
+        
         try:
             # Converte letras para índices (A=0, B=1, C=2, etc.)
             try:
-                idx_x = ord(col_x.upper()) - ord('A')
-                idx_y = ord(col_y.upper()) - ord('A')
-            except:
+                idx_x = letra_para_indice(col_x)
+                idx_y = letra_para_indice(col_y)
+            except ValueError:
                 raise Exception(f"Letras de colunas inválidas: {col_x}, {col_y}")
             
-            # Cria cópia do DataFrame
-            df_convertido = df.copy()
+            # Converte as colunas inteiras de uma vez
+            df_convertido, validos = converter_colunas_df(df, idx_x, idx_y, self.conversor)
             
-            for i, row in df.iterrows():
-                try:
-                    
-                    # Usa índices das colunas
-                    valor_x = str(row.iloc[idx_x]).replace(',', '.')
-                    valor_y = str(row.iloc[idx_y]).replace(',', '.')
-                    
-                    # Remove espaços e caracteres não numéricos
-                    valor_x = valor_x.strip()
-                    valor_y = valor_y.strip()
-                    
-                    # Verifica se é um número válido
-                    if not valor_x or not valor_y:
-                        raise ValueError("Valor vazio")
-                    
-                    # Tenta converter para float - se falhar, pula a linha
-                    try:
-                        utm_x = float(valor_x)
-                        utm_y = float(valor_y)
-                    except ValueError:
-                        raise ValueError(f"Valor não numérico: X='{valor_x}', Y='{valor_y}'")
-                    
-                    # Converte as coordenadas
-                    resultado = self.conversor.converter_utm_para_dms(utm_x, utm_y)
-                    
-                    # Formata no estilo brasileiro: "48 04 35,347 W"
-                    lon_g, lon_m, lon_s = self.conversor.graus_decimais_para_dms(resultado['longitude_dec'])
-                    lat_g, lat_m, lat_s = self.conversor.graus_decimais_para_dms(resultado['latitude_dec'])
-                    
-                    # Formata com vírgula e direção
-                    lon_formatado = f"{abs(lon_g)} {lon_m:02d} {lon_s:.3f}".replace('.', ',')
-                    lat_formatado = f"{abs(lat_g)} {lat_m:02d} {lat_s:.3f}".replace('.', ',')
-                    
-                    # Adiciona direção
-                    lon_formatado += " W" if lon_g < 0 else " E"
-                    lat_formatado += " S" if lat_g < 0 else " N"
-                    
-                    # Substitui os valores nas colunas originais
-                    df_convertido.iloc[i, idx_x] = lon_formatado
-                    df_convertido.iloc[i, idx_y] = lat_formatado
-                    
-                except (ValueError, TypeError) as e:
-                    # Se houver erro na conversão, mantém o valor original
-                    print(f"Linha {i+1} mantida original: {e}")
-                    continue
+            # Linhas com erro na conversão mantêm o valor original
+            rejeitadas = int((~validos).sum())
+            if rejeitadas:
+                print(f"⚠️ {rejeitadas} linha(s) mantida(s) original(is): valor não numérico ou fora da zona")
             
             return df_convertido
-            
+        
         except Exception as e:
             raise Exception(f"Erro na conversão de coordenadas: {str(e)}")
     
     
+    def alternar_monitoramento(self):
+        """Inicia ou para a conversão automática dos arquivos que chegam à pasta de origem"""
+        if self.monitor is not None:
+            self.monitor.parar()
+            self.monitor = None
+            self.botao_monitorar.configure(text="Monitorar Pasta")
+            self.botao_converter.configure(state=tk.NORMAL)
+            self.status_progresso.configure(text="Monitoramento encerrado.")
+            return
+        
+        if not self.pasta_origem.get() or not self.pasta_destino.get():
+            messagebox.showerror("Erro", "Selecione as pastas de origem e de destino.")
+            return
+        
+        if not self.coluna_x.get() or not self.coluna_y.get():
+            messagebox.showerror("Erro", "Digite as letras das colunas X e Y primeiro.")
+            return
+        
+        from monitor_pasta import MonitorPasta
+        from processamento_lote import TAMANHO_BLOCO_PADRAO
+        
+        try:
+            self.monitor = MonitorPasta(
+                self.pasta_origem.get(), self.pasta_destino.get(),
+                self.coluna_x.get(), self.coluna_y.get(), conversor=self.conversor,
+                ao_concluir=self.fila_monitor.put,
+                tamanho_bloco=self.tamanho_bloco or TAMANHO_BLOCO_PADRAO,
+                col_zona=self.coluna_zona.get().strip() or None)
+        except ValueError as e:
+            messagebox.showerror("Erro", str(e))
+            return
+        
+        self.monitor.iniciar()
+        self.botao_monitorar.configure(text="Parar Monitoramento")
+        self.botao_converter.configure(state=tk.DISABLED)
+        self.status_progresso.configure(text=f"Monitorando {self.pasta_origem.get()}...")
+        self.root.after(500, self.acompanhar_monitoramento)
+    
+    def acompanhar_monitoramento(self):
+        """Mostra no status os arquivos convertidos pelo monitoramento"""
+        if self.monitor is None:
+            return
+        
+        try:
+            while True:
+                resultado = self.fila_monitor.get_nowait()
+                if not resultado['sucesso'] and not resultado['cancelado']:
+                    print(f"❌ Erro em {resultado['arquivo']}: {resultado['erro']}")
+        except queue.Empty:
+            pass
+        
+        estatisticas = self.monitor.estatisticas
+        self.status_progresso.configure(
+            text=f"Monitorando {self.pasta_origem.get()} | convertidos: {estatisticas['convertidos']}"
+                 f" | sem alterações: {estatisticas['pulados']} | erros: {estatisticas['erros']}")
+        self.root.after(500, self.acompanhar_monitoramento)
+    
     def limpar_campos(self):
         """Limpa todos os campos"""
         self.pasta_origem.set('')
         self.pasta_destino.set('')
         self.coluna_x.set('')
         self.coluna_y.set('')
+        self.coluna_zona.set('')
         print("Campos limpos. Use 'Salvar Configurações' para salvar as configurações atuais.")
     
     def executar(self):
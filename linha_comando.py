@@ -0,0 +1,281 @@
+"""
+Conversão UTM -> Geográficas pela linha de comando (sem interface gráfica)
+
+Uso:
+    python -m conversor_utm convert ORIGEM DESTINO --x B --y D --zona 23 --hem S --workers N
+    python -m conversor_utm watch PASTA DESTINO --x B --y D
+
+ORIGEM pode ser uma pasta (todos os *.csv) ou um único arquivo CSV. As
+mensagens de progresso vão para o stderr e o resumo da execução é impresso
+em JSON na saída padrão. O comando watch fica em execução e imprime uma
+linha JSON por arquivo convertido.
+"""
+
+import argparse
+import contextlib
+import json
+import sys
+import time
+from pathlib import Path
+from conversor_utm import DATUMS, MOTORES, ConversorUTM
+from formatos_entrada import arquivos_de_entrada
+from instrumentacao import somar_relatorios
+from monitor_pasta import ESTABILIDADE_PADRAO, INTERVALO_PADRAO, TAMANHO_FILA_PADRAO, MonitorPasta
+from processamento_lote import COMPRESSOES_SAIDA, FORMATOS_SAIDA, TAMANHO_BLOCO_PADRAO, converter_arquivos
+
+
+# Códigos de saída
+SAIDA_OK = 0
+SAIDA_FALHAS = 1
+SAIDA_USO = 2
+SAIDA_SEM_ARQUIVOS = 3
+
+
+def adicionar_opcoes_conversao(parser):
+    """Acrescenta ao subcomando as opções de conversão comuns a convert e watch"""
+    parser.add_argument('--x', default='B', help='Letra da coluna X/Easting (padrão: B)')
+    parser.add_argument('--y', default='D', help='Letra da coluna Y/Northing (padrão: D)')
+    parser.add_argument('--zona', type=int, default=23, help='Zona UTM (padrão: 23)')
+    parser.add_argument('--hem', choices=['N', 'S'], default='S', help='Hemisfério (padrão: S)')
+    parser.add_argument('--datum', choices=list(DATUMS), default='SIRGAS2000',
+                        help='Datum das coordenadas UTM; SAD69 e CORREGO_ALEGRE são '
+                             'transformados para SIRGAS2000 (padrão: SIRGAS2000)')
+    parser.add_argument('--zona-col', default=None,
+                        help="Letra da coluna com a zona de cada linha (ex.: 23S), ou 'auto'")
+    parser.add_argument('--hem-col', default=None,
+                        help='Letra da coluna com o hemisfério de cada linha')
+    parser.add_argument('--motor', choices=MOTORES, default='pyproj',
+                        help='Motor da projeção: pyproj (padrão) ou numpy')
+    parser.add_argument('--workers-arquivo', type=int, default=None,
+                        help='Divide cada arquivo entre N processos (arquivos um de cada vez; use com --bloco grande)')
+    parser.add_argument('--bloco', type=int, default=TAMANHO_BLOCO_PADRAO,
+                        help=f'Linhas por bloco de leitura (padrão: {TAMANHO_BLOCO_PADRAO})')
+    parser.add_argument('--formato-saida', choices=FORMATOS_SAIDA, default='csv',
+                        help='Formato dos arquivos convertidos (parquet/feather exigem pyarrow '
+                             'e incluem longitude_dec/latitude_dec em float64)')
+    parser.add_argument('--sem-texto', action='store_true',
+                        help='Com parquet/feather: não gera o texto GG MM SS, só as colunas decimais')
+    parser.add_argument('--compressao-saida', choices=list(COMPRESSOES_SAIDA), default=None,
+                        help='Grava os CSV convertidos comprimidos (ex.: dados.csv.gz)')
+
+
+def criar_parser():
+    """Cria o parser de argumentos da linha de comando"""
+    parser = argparse.ArgumentParser(
+        prog='python -m conversor_utm',
+        description='Conversão UTM -> Geográficas (GG MM SS,SSS) em lote, sem interface gráfica')
+    subparsers = parser.add_subparsers(dest='comando')
+    
+    converter = subparsers.add_parser(
+        'convert', aliases=['converter'],
+        help='Converte um arquivo CSV ou todos os CSV de uma pasta')
+    converter.add_argument('origem', help='Arquivo (CSV, CSV .gz/.xz/.bz2, .zip, Parquet ou Feather) ou pasta com esses arquivos')
+    converter.add_argument('destino', help='Pasta onde os arquivos convertidos serão salvos')
+    adicionar_opcoes_conversao(converter)
+    converter.add_argument('--workers', type=int, default=None,
+                           help='Processos simultâneos (padrão: número de núcleos)')
+    converter.add_argument('--incremental', action='store_true',
+                           help='Converte apenas arquivos novos ou alterados desde a última execução')
+    converter.add_argument('--instrumentar', action='store_true',
+                           help='Inclui no resumo o tempo e as linhas de cada etapa de cada arquivo')
+    converter.add_argument('--perfil', action='store_true',
+                           help='Como --instrumentar, anexando também o cProfile de cada arquivo')
+    converter.add_argument('--resumo', default=None,
+                           help='Também grava o resumo JSON neste arquivo')
+    
+    monitorar = subparsers.add_parser(
+        'watch', aliases=['monitorar'],
+        help='Monitora uma pasta e converte cada arquivo novo ou alterado assim que termina de chegar')
+    monitorar.add_argument('origem', help='Pasta monitorada')
+    monitorar.add_argument('destino', help='Pasta onde os arquivos convertidos serão salvos')
+    adicionar_opcoes_conversao(monitorar)
+    monitorar.add_argument('--intervalo', type=float, default=INTERVALO_PADRAO,
+                           help=f'Segundos entre verificações da pasta (padrão: {INTERVALO_PADRAO})')
+    monitorar.add_argument('--estabilidade', type=float, default=ESTABILIDADE_PADRAO,
+                           help=f'Segundos sem mudanças para considerar um arquivo completo (padrão: {ESTABILIDADE_PADRAO})')
+    monitorar.add_argument('--fila', type=int, default=TAMANHO_FILA_PADRAO,
+                           help=f'Arquivos prontos aguardando conversão, no máximo (padrão: {TAMANHO_FILA_PADRAO})')
+    monitorar.add_argument('--varredura', action='store_true',
+                           help='Usa varredura periódica mesmo onde o inotify está disponível')
+    
+    return parser
+
+
+def listar_arquivos(origem):
+    """
+    Lista os arquivos a converter
+    
+    Args:
+        origem (Path): Arquivo ou pasta
+    
+    Returns:
+        list: Arquivos CSV (também comprimidos e .zip), Parquet e Feather
+              encontrados (em ordem alfabética para pastas)
+    """
+    origem = Path(origem)
+    if origem.is_dir():
+        return arquivos_de_entrada(origem)
+    if origem.is_file():
+        return [origem]
+    return []
+
+
+def executar_conversao(args):
+    """
+    Executa o comando convert
+    
+    Args:
+        args (argparse.Namespace): Argumentos do comando
+    
+    Returns:
+        tuple: (código de saída, dict com o resumo da execução)
+    """
+    arquivos = listar_arquivos(args.origem)
+    resumo = {
+        'origem': str(args.origem),
+        'destino': str(args.destino),
+        'zona': args.zona,
+        'hemisferio': args.hem,
+        'datum': args.datum,
+        'motor': args.motor,
+        'arquivos': len(arquivos),
+        'sucessos': 0,
+        'erros': 0,
+        'pulados': 0,
+        'linhas': 0,
+        'convertidas': 0,
+        'rejeitadas': 0,
+        'duplicadas': 0,
+        'razao_duplicadas': 0.0,
+        'segundos': 0.0,
+        'pontos_por_segundo': 0.0,
+        'resultados': []
+    }
+    
+    if not arquivos:
+        print(f"❌ Nenhum arquivo CSV, .zip, Parquet ou Feather encontrado em {args.origem}", file=sys.stderr)
+        return SAIDA_SEM_ARQUIVOS, resumo
+    
+    if args.sem_texto and args.formato_saida == 'csv':
+        print("❌ --sem-texto exige --formato-saida parquet ou feather", file=sys.stderr)
+        return SAIDA_USO, resumo
+    
+    if args.compressao_saida and args.formato_saida != 'csv':
+        print("❌ --compressao-saida só vale para saída CSV", file=sys.stderr)
+        return SAIDA_USO, resumo
+    
+    try:
+        conversor = ConversorUTM(zona_utm=args.zona, hemisferio=args.hem, datum=args.datum, motor=args.motor)
+    except ValueError as e:
+        print(f"❌ {str(e)}", file=sys.stderr)
+        return SAIDA_USO, resumo
+    
+    Path(args.destino).mkdir(parents=True, exist_ok=True)
+    
+    inicio = time.perf_counter()
+    # Mensagens de progresso no stderr; a saída padrão fica só com o JSON
+    with contextlib.redirect_stdout(sys.stderr):
+        resultados = converter_arquivos(
+            arquivos, args.destino, args.x, args.y,
+            conversor=conversor, tamanho_bloco=args.bloco,
+            workers=args.workers, logs_em_stderr=True,
+            workers_arquivo=args.workers_arquivo,
+            formato_saida=args.formato_saida, formatar_texto=not args.sem_texto,
+            compressao_saida=args.compressao_saida, incremental=args.incremental,
+            col_zona=args.zona_col, col_hemisferio=args.hem_col,
+            instrumentar=('perfil' if args.perfil else args.instrumentar))
+    segundos = time.perf_counter() - inicio
+    
+    resumo['resultados'] = resultados
+    resumo['sucessos'] = sum(1 for r in resultados if r['sucesso'] and not r['pulado'])
+    resumo['pulados'] = sum(1 for r in resultados if r['pulado'])
+    resumo['erros'] = sum(1 for r in resultados if not r['sucesso'])
+    resumo['linhas'] = sum(r.get('linhas', 0) for r in resultados)
+    resumo['convertidas'] = sum(r.get('convertidas', 0) for r in resultados)
+    resumo['rejeitadas'] = sum(r.get('rejeitadas', 0) for r in resultados)
+    resumo['duplicadas'] = sum(r.get('duplicadas', 0) for r in resultados)
+    resumo['razao_duplicadas'] = round(resumo['duplicadas'] / resumo['linhas'], 4) if resumo['linhas'] else 0.0
+    resumo['segundos'] = round(segundos, 3)
+    resumo['pontos_por_segundo'] = round(resumo['convertidas'] / segundos, 1) if segundos > 0 else 0.0
+    if args.instrumentar or args.perfil:
+        resumo['instrumentacao'] = somar_relatorios(r.get('instrumentacao') for r in resultados)
+    
+    return (SAIDA_FALHAS if resumo['erros'] else SAIDA_OK), resumo
+
+
+def executar_monitoramento(args):
+    """
+    Executa o comando watch até ser interrompido (Ctrl+C)
+    
+    Args:
+        args (argparse.Namespace): Argumentos do comando
+    
+    Returns:
+        int: Código de saída
+    """
+    if args.sem_texto and args.formato_saida == 'csv':
+        print("❌ --sem-texto exige --formato-saida parquet ou feather", file=sys.stderr)
+        return SAIDA_USO
+    
+    if args.compressao_saida and args.formato_saida != 'csv':
+        print("❌ --compressao-saida só vale para saída CSV", file=sys.stderr)
+        return SAIDA_USO
+    
+    saida = sys.stdout
+    
+    def ao_concluir(resultado):
+        resultado = {chave: valor for chave, valor in resultado.items() if chave != 'instrumentacao'}
+        print(json.dumps(resultado, ensure_ascii=False), file=saida, flush=True)
+    
+    try:
+        conversor = ConversorUTM(zona_utm=args.zona, hemisferio=args.hem, datum=args.datum, motor=args.motor)
+        monitor = MonitorPasta(
+            args.origem, args.destino, args.x, args.y, conversor=conversor,
+            intervalo=args.intervalo, estabilidade=args.estabilidade, tamanho_fila=args.fila,
+            ao_concluir=ao_concluir, usar_inotify=not args.varredura,
+            tamanho_bloco=args.bloco, workers_arquivo=args.workers_arquivo,
+            formato_saida=args.formato_saida, formatar_texto=not args.sem_texto,
+            compressao_saida=args.compressao_saida, col_zona=args.zona_col, col_hemisferio=args.hem_col)
+    except ValueError as e:
+        print(f"❌ {str(e)}", file=sys.stderr)
+        return SAIDA_USO
+    
+    # Mensagens de progresso no stderr; a saída padrão fica só com os resultados
+    with contextlib.redirect_stdout(sys.stderr), monitor:
+        monitor.aguardar()
+    return SAIDA_OK
+
+
+def main(argv=None):
+    """
+    Ponto de entrada da linha de comando
+    
+    Args:
+        argv (list): Argumentos (padrão: sys.argv[1:])
+    
+    Returns:
+        int: Código de saída
+    """
+    parser = criar_parser()
+    args = parser.parse_args(argv)
+    
+    if args.comando in ('watch', 'monitorar'):
+        return executar_monitoramento(args)
+    if args.comando not in ('convert', 'converter'):
+        parser.print_help(sys.stderr)
+        return SAIDA_USO
+    
+    codigo, resumo = executar_conversao(args)
+    resumo['codigo_saida'] = codigo
+    
+    texto = json.dumps(resumo, ensure_ascii=False, indent=2)
+    print(texto)
+    if args.resumo:
+        with open(args.resumo, 'w', encoding='utf-8') as f:
+            f.write(texto)
+    
+    return codigo
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""
+Inversa da projeção Transversa de Mercator (UTM) em NumPy puro
+
+Implementa as séries de Krüger até a 6ª ordem em n (Karney, 2011), a mesma
+formulação usada pelo PROJ ("etmerc", padrão do +proj=utm). Dentro das zonas
+UTM a diferença para o pyproj fica na ordem de nanômetros, sem depender da
+chamada ao PROJ para cada lote.
+"""
+
+import functools
+import numpy as np
+
+
+# Parâmetros (semieixo maior em metros, achatamento) de cada elipsoide suportado
+PARAMETROS_ELIPSOIDES = {
+    'GRS80': (6378137.0, 1 / 298.257222101),
+}
+
+# Parâmetros fixos do sistema UTM
+FATOR_ESCALA_UTM = 0.9996
+FALSO_ESTE_UTM = 500000.0
+FALSO_NORTE_SUL_UTM = 10000000.0
+
+# Limite de |η'| aceito pelo PROJ; fora dele a série não converge
+LIMITE_ETA = 2.623395162778
+
+
+@functools.lru_cache(maxsize=8)
+def coeficientes_inversos(elipsoide='GRS80'):
+    """
+    Calcula os coeficientes da inversa para um elipsoide
+    
+    Args:
+        elipsoide (str): Nome do elipsoide (chave de PARAMETROS_ELIPSOIDES)
+    
+    Returns:
+        tuple: (raio retificante A, coeficientes β1..β6, coeficientes δ1..δ6)
+    """
+    try:
+        a, f = PARAMETROS_ELIPSOIDES[elipsoide]
+    except KeyError:
+        raise ValueError(f"Elipsoide não suportado pelo motor NumPy: {elipsoide}")
+    
+    n = f / (2 - f)
+    n2, n3, n4, n5, n6 = n ** 2, n ** 3, n ** 4, n ** 5, n ** 6
+    
+    raio = a / (1 + n) * (1 + n2 / 4 + n4 / 64 + n6 / 256)
+    
+    # Coordenadas de Gauss-Krüger -> esfera conforme
+    beta = np.array([
+        n / 2 - 2 * n2 / 3 + 37 * n3 / 96 - n4 / 360 - 81 * n5 / 512 + 96199 * n6 / 604800,
+        n2 / 48 + n3 / 15 - 437 * n4 / 1440 + 46 * n5 / 105 - 1118711 * n6 / 3870720,
+        17 * n3 / 480 - 37 * n4 / 840 - 209 * n5 / 4480 + 5569 * n6 / 90720,
+        4397 * n4 / 161280 - 11 * n5 / 504 - 830251 * n6 / 7257600,
+        4583 * n5 / 161280 - 108847 * n6 / 3991680,
+        20648693 * n6 / 638668800,
+    ])
+    
+    # Latitude conforme -> latitude geodésica
+    delta = np.array([
+        2 * n - 2 * n2 / 3 - 2 * n3 + 116 * n4 / 45 + 26 * n5 / 45 - 2854 * n6 / 675,
+        7 * n2 / 3 - 8 * n3 / 5 - 227 * n4 / 45 + 2704 * n5 / 315 + 2323 * n6 / 945,
+        56 * n3 / 15 - 136 * n4 / 35 - 1262 * n5 / 105 + 73814 * n6 / 2835,
+        4279 * n4 / 630 - 332 * n5 / 35 - 399572 * n6 / 14175,
+        4174 * n5 / 315 - 144838 * n6 / 6237,
+        601676 * n6 / 22275,
+    ])
+    
+    return raio, beta, delta
+
+
+def _serie_senos(coeficientes, angulo):
+    # Σ c_j sen(2jθ), j = 1..len(c), pelo método de Clenshaw (aceita θ complexo)
+    cos2 = 2 * np.cos(2 * angulo)
+    b1, b2 = coeficientes[-1], 0.0
+    for c in coeficientes[-2::-1]:
+        b1, b2 = c + cos2 * b1 - b2, b1
+    return b1 * np.sin(2 * angulo)
+
+
+def utm_inversa(utm_x, utm_y, zona, sul=True, elipsoide='GRS80'):
+    """
+    Converte coordenadas UTM de uma zona para longitude e latitude
+    
+    Args:
+        utm_x (array-like): Coordenadas X UTM (Easting)
+        utm_y (array-like): Coordenadas Y UTM (Northing)
+        zona (int): Zona UTM
+        sul (bool): True para o hemisfério Sul
+        elipsoide (str): Nome do elipsoide
+    
+    Returns:
+        tuple: (longitudes, latitudes) em graus decimais como numpy.ndarray;
+               pontos fora do domínio da projeção voltam como inf, como no pyproj
+    """
+    raio, beta, delta = coeficientes_inversos(elipsoide)
+    escala = FATOR_ESCALA_UTM * raio
+    
+    x = np.asarray(utm_x, dtype=float)
+    y = np.asarray(utm_y, dtype=float)
+    
+    # ζ' = ξ' + iη' na esfera de raio k0·A
+    xi = (y - (FALSO_NORTE_SUL_UTM if sul else 0.0)) / escala
+    eta = (x - FALSO_ESTE_UTM) / escala
+    fora = np.abs(eta) > LIMITE_ETA
+    
+    # ζ = ζ' - Σ βj sen(2jζ')
+    zeta = xi + 1j * np.where(fora, 0.0, eta)
+    zeta = zeta - _serie_senos(beta, zeta)
+    xi, eta = zeta.real, zeta.imag
+    
+    # Latitude conforme e diferença de longitude para o meridiano central
+    chi = np.arcsin(np.sin(xi) / np.cosh(eta))
+    dlon = np.arctan2(np.sinh(eta), np.cos(xi))
+    
+    lat = np.degrees(chi + _serie_senos(delta, chi))
+    lon = np.degrees(dlon) + (6 * int(zona) - 183)
+    lon = (lon + 180) % 360 - 180
+    
+    return np.where(fora, np.inf, lon), np.where(fora, np.inf, lat)
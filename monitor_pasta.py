@@ -0,0 +1,383 @@
+"""
+Monitoramento de uma pasta: converte os arquivos assim que terminam de chegar
+
+Novos arquivos e alterações são percebidos pelo inotify (Linux, via ctypes)
+ou, onde ele não existe, por varredura periódica que compara só tamanho e
+data de modificação. Com o inotify, um arquivo entra na fila quando o
+programa que o escrevia o fecha (IN_CLOSE_WRITE) ou quando é movido para a
+pasta (IN_MOVED_TO); na varredura, e para arquivos cuja escrita não foi
+acompanhada (os que já estavam na pasta), depois de ficar sem mudar por
+alguns segundos. A fila tem tamanho limitado: se a conversão não acompanhar
+a chegada dos arquivos, a detecção espera.
+
+Cada arquivo é convertido com o modo incremental de converter_arquivos, que
+registra o que já foi feito no manifesto da pasta de destino; arquivos já
+convertidos e sem alterações nunca são convertidos de novo, nem após
+reiniciar o monitor.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import queue
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from conversor_utm import ConversorUTM
+from formatos_entrada import arquivo_de_entrada
+from processamento_lote import TAMANHO_BLOCO_PADRAO, converter_arquivos, destinos_repetidos, erro_destino_repetido
+
+
+INTERVALO_PADRAO = 1.0      # segundos entre verificações
+ESTABILIDADE_PADRAO = 2.0   # segundos sem mudanças para considerar a escrita concluída
+TAMANHO_FILA_PADRAO = 16
+
+# Eventos do inotify (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_Q_OVERFLOW = 0x00004000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+EVENTOS_INOTIFY = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+EVENTOS_CONCLUSAO = IN_CLOSE_WRITE | IN_MOVED_TO
+_CABECALHO_EVENTO = struct.Struct('iIII')
+
+# Arquivos temporários de programas de sincronização e editores
+PREFIXOS_IGNORADOS = ('.', '~$')
+SUFIXOS_IGNORADOS = ('.tmp', '.part', '.partial', '.crdownload', '~')
+
+
+def arquivo_monitorado(caminho):
+    """Indica se o arquivo é uma entrada a converter (e não um temporário)"""
+    nome = Path(caminho).name
+    if nome.startswith(PREFIXOS_IGNORADOS) or nome.lower().endswith(SUFIXOS_IGNORADOS):
+        return False
+    return arquivo_de_entrada(nome)
+
+
+class _VigiaInotify:
+    """Eventos de escrita da pasta pelo inotify do Linux"""
+    
+    def __init__(self, pasta):
+        nome_libc = ctypes.util.find_library('c')
+        if not sys.platform.startswith('linux') or not nome_libc:
+            raise OSError("inotify indisponível")
+        libc = ctypes.CDLL(nome_libc, use_errno=True)
+        self._fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 falhou")
+        if libc.inotify_add_watch(self._fd, os.fsencode(str(pasta)), EVENTOS_INOTIFY) < 0:
+            erro = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(erro, "inotify_add_watch falhou")
+        self.pasta = Path(pasta)
+    
+    def esperar(self, timeout):
+        """
+        Espera eventos por até timeout segundos
+        
+        Returns:
+            dict: {arquivo alterado: True se a escrita foi concluída (fechado
+                  ou movido para a pasta), False se ainda está sendo escrito},
+                  ou None se eventos foram perdidos (fila do kernel cheia) e
+                  a pasta precisa ser varrida
+        """
+        prontos, _, _ = select.select([self._fd], [], [], timeout)
+        if not prontos:
+            return {}
+        try:
+            dados = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return {}
+        
+        # Vale o último evento de cada arquivo: escrita depois do fechamento reabre a espera
+        alterados = {}
+        posicao = 0
+        while posicao + _CABECALHO_EVENTO.size <= len(dados):
+            _, mascara, _, tamanho = _CABECALHO_EVENTO.unpack_from(dados, posicao)
+            posicao += _CABECALHO_EVENTO.size
+            nome = dados[posicao:posicao + tamanho].rstrip(b'\0')
+            posicao += tamanho
+            if mascara & IN_Q_OVERFLOW:
+                return None
+            if nome:
+                alterados[self.pasta / os.fsdecode(nome)] = bool(mascara & EVENTOS_CONCLUSAO)
+        return alterados
+    
+    def fechar(self):
+        os.close(self._fd)
+
+
+class _VigiaVarredura:
+    """Alternativa portátil: varre a pasta e compara tamanho e data de cada arquivo"""
+    
+    def __init__(self, pasta):
+        self.pasta = Path(pasta)
+        # Os arquivos já presentes entram pela listagem inicial do monitor
+        self._vistos = self._assinaturas()
+    
+    def _assinaturas(self):
+        atuais = {}
+        with os.scandir(self.pasta) as entradas:
+            for entrada in entradas:
+                try:
+                    if entrada.is_file():
+                        info = entrada.stat()
+                        atuais[entrada.path] = (info.st_size, info.st_mtime_ns)
+                except OSError:
+                    continue
+        return atuais
+    
+    def esperar(self, timeout):
+        # Sem eventos de fechamento: a conclusão da escrita fica indefinida (None)
+        time.sleep(timeout)
+        atuais = self._assinaturas()
+        alterados = {Path(caminho): None for caminho, assinatura in atuais.items()
+                     if self._vistos.get(caminho) != assinatura}
+        self._vistos = atuais
+        return alterados
+    
+    def fechar(self):
+        pass
+
+
+class MonitorPasta:
+    """
+    Converte automaticamente os arquivos que chegam a uma pasta
+    
+    Uma thread detecta os arquivos e outra os converte, ligadas por uma fila
+    limitada. Use iniciar()/parar() ou `with`:
+        
+        with MonitorPasta('entrada', 'saida', 'B', 'D') as monitor:
+            monitor.aguardar()
+    """
+    
+    def __init__(self, pasta_origem, pasta_destino, col_x, col_y, conversor=None,
+                 intervalo=INTERVALO_PADRAO, estabilidade=ESTABILIDADE_PADRAO,
+                 tamanho_fila=TAMANHO_FILA_PADRAO, ao_concluir=None, usar_inotify=True, **opcoes):
+        """
+        Inicializa o monitor
+        
+        Args:
+            pasta_origem (Path): Pasta monitorada
+            pasta_destino (Path): Pasta dos arquivos convertidos (e do manifesto)
+            col_x (str): Letra da coluna X (Easting)
+            col_y (str): Letra da coluna Y (Northing)
+            conversor (ConversorUTM): Conversor a usar (padrão: SIRGAS2000 23S)
+            intervalo (float): Segundos entre verificações da pasta
+            estabilidade (float): Segundos sem mudança de tamanho/data para
+                                  considerar a escrita de um arquivo concluída
+                                  (na varredura e nos arquivos já presentes;
+                                  com o inotify vale o fechamento do arquivo)
+            tamanho_fila (int): Arquivos prontos aguardando conversão, no máximo
+            ao_concluir (callable): Chamada com o resultado de cada arquivo
+            usar_inotify (bool): Usa o inotify quando disponível
+            **opcoes: Demais argumentos de converter_arquivos (tamanho_bloco,
+                      col_zona, formato_saida, ...)
+        """
+        self.pasta_origem = Path(pasta_origem)
+        self.pasta_destino = Path(pasta_destino)
+        if not self.pasta_origem.is_dir():
+            raise ValueError(f"Pasta de origem não encontrada: {pasta_origem}")
+        if self.pasta_origem.resolve() == self.pasta_destino.resolve():
+            # Os arquivos convertidos seriam detectados e convertidos de novo
+            raise ValueError("A pasta de destino deve ser diferente da pasta monitorada")
+        
+        self.col_x = col_x
+        self.col_y = col_y
+        self.conversor = conversor if conversor is not None else ConversorUTM()
+        self.intervalo = max(0.05, float(intervalo))
+        self.estabilidade = max(0.0, float(estabilidade))
+        self.ao_concluir = ao_concluir
+        self.usar_inotify = usar_inotify
+        self.opcoes = dict(opcoes)
+        self.opcoes.setdefault('tamanho_bloco', TAMANHO_BLOCO_PADRAO)
+        
+        self.fila = queue.Queue(maxsize=max(1, int(tamanho_fila)))
+        self.evento_parar = threading.Event()
+        self.metodo = None
+        self.estatisticas = {'detectados': 0, 'convertidos': 0, 'pulados': 0, 'erros': 0}
+        
+        # Arquivos aguardando o fim da escrita: caminho -> (tamanho, mtime, desde quando,
+        # concluído: True/False pelos eventos do inotify, None se só a estabilidade decide)
+        self._candidatos = {}
+        # Arquivos na fila ou em conversão, para não enfileirar duas vezes
+        self._em_andamento = set()
+        self._trava = threading.Lock()
+        self._threads = []
+    
+    def __enter__(self):
+        self.iniciar()
+        return self
+    
+    def __exit__(self, *erro):
+        self.parar()
+    
+    def iniciar(self):
+        """Inicia as threads de detecção e de conversão"""
+        self.pasta_destino.mkdir(parents=True, exist_ok=True)
+        self.evento_parar.clear()
+        self._threads = [threading.Thread(target=self._detectar, name='monitor-deteccao', daemon=True),
+                         threading.Thread(target=self._converter, name='monitor-conversao', daemon=True)]
+        for thread in self._threads:
+            thread.start()
+    
+    def parar(self, timeout=None):
+        """Para o monitor; o arquivo em conversão é concluído antes"""
+        self.evento_parar.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+    
+    def aguardar(self):
+        """Bloqueia até parar() ser chamado (ou Ctrl+C)"""
+        try:
+            while not self.evento_parar.wait(0.5):
+                pass
+        except KeyboardInterrupt:
+            pass
+    
+    def _abrir_vigia(self):
+        if self.usar_inotify:
+            try:
+                vigia = _VigiaInotify(self.pasta_origem)
+                self.metodo = 'inotify'
+                return vigia
+            except (OSError, AttributeError):
+                pass
+        self.metodo = 'varredura'
+        return _VigiaVarredura(self.pasta_origem)
+    
+    def _detectar(self):
+        # Thread de detecção: acompanha a pasta e enfileira arquivos com escrita concluída
+        vigia = self._abrir_vigia()
+        print(f"👀 Monitorando {self.pasta_origem} ({self.metodo})")
+        try:
+            # Arquivos que já estavam na pasta; os convertidos antes são pulados pelo manifesto
+            self._registrar(dict.fromkeys(self._arquivos_da_pasta()))
+            while not self.evento_parar.is_set():
+                alterados = vigia.esperar(self.intervalo)
+                self._registrar(dict.fromkeys(self._arquivos_da_pasta()) if alterados is None else alterados)
+                self._enfileirar_estaveis()
+        finally:
+            vigia.fechar()
+    
+    def _arquivos_da_pasta(self):
+        return [arquivo for arquivo in self.pasta_origem.iterdir() if arquivo.is_file()]
+    
+    def _registrar(self, alterados):
+        # Todo arquivo alterado (re)começa a contagem de estabilidade
+        agora = time.monotonic()
+        for caminho, concluido in alterados.items():
+            if not arquivo_monitorado(caminho):
+                continue
+            try:
+                info = os.stat(caminho)
+            except OSError:
+                self._candidatos.pop(caminho, None)
+                continue
+            # concluido None (varredura, ou eventos do inotify perdidos): vale a estabilidade
+            self._candidatos[caminho] = (info.st_size, info.st_mtime_ns, agora, concluido)
+    
+    def _enfileirar_estaveis(self):
+        agora = time.monotonic()
+        for caminho, (tamanho, mtime, desde, concluido) in list(self._candidatos.items()):
+            if concluido is False:
+                # O inotify avisa quando o arquivo for fechado
+                continue
+            try:
+                info = os.stat(caminho)
+            except OSError:
+                del self._candidatos[caminho]
+                continue
+            
+            if concluido is None:
+                if (info.st_size, info.st_mtime_ns) != (tamanho, mtime):
+                    # Ainda sendo escrito
+                    self._candidatos[caminho] = (info.st_size, info.st_mtime_ns, agora, None)
+                    continue
+                if agora - desde < self.estabilidade:
+                    continue
+            
+            with self._trava:
+                if caminho in self._em_andamento:
+                    # Mudou de novo durante a conversão: volta a ser verificado depois
+                    continue
+                self._em_andamento.add(caminho)
+            
+            # Fila cheia: a detecção espera a conversão liberar espaço
+            while not self.evento_parar.is_set():
+                try:
+                    self.fila.put(caminho, timeout=self.intervalo)
+                    break
+                except queue.Full:
+                    continue
+            else:
+                return
+            del self._candidatos[caminho]
+            self.estatisticas['detectados'] += 1
+    
+    def _destinos_repetidos(self, lote):
+        # Cada arquivo é convertido sozinho: a colisão de destinos (ex.: dados.csv e
+        # dados.csv.gz) é procurada entre as demais entradas da pasta, listada uma vez por lote
+        try:
+            na_pasta = self._arquivos_da_pasta()
+        except OSError:
+            na_pasta = []
+        arquivos = [Path(caminho) for caminho in lote]
+        no_lote = set(arquivos)
+        arquivos += [arquivo for arquivo in na_pasta if arquivo not in no_lote and arquivo_monitorado(arquivo)]
+        repetidos = destinos_repetidos(arquivos, self.opcoes.get('formato_saida', 'csv'),
+                                       self.opcoes.get('compressao_saida'))
+        return {lote[i]: outros for i, outros in repetidos.items() if i < len(lote)}
+    
+    def _converter(self):
+        # Thread de conversão: os arquivos prontos são tirados da fila em lotes
+        # e convertidos um por vez, pelo modo incremental (manifesto)
+        while not self.evento_parar.is_set():
+            try:
+                lote = [self.fila.get(timeout=self.intervalo)]
+            except queue.Empty:
+                continue
+            while True:
+                try:
+                    lote.append(self.fila.get_nowait())
+                except queue.Empty:
+                    break
+            
+            repetidos = self._destinos_repetidos(lote)
+            for caminho in lote:
+                self._converter_arquivo(caminho, repetidos.get(caminho))
+    
+    def _converter_arquivo(self, caminho, outros_no_destino=None):
+        formato_saida = self.opcoes.get('formato_saida', 'csv')
+        try:
+            if outros_no_destino:
+                raise ValueError(erro_destino_repetido(caminho, outros_no_destino, formato_saida,
+                                                       self.opcoes.get('compressao_saida')))
+            resultado = converter_arquivos(
+                [caminho], self.pasta_destino, self.col_x, self.col_y,
+                conversor=self.conversor, workers=1, incremental=True,
+                cancelar=self.evento_parar, **self.opcoes)[0]
+        except Exception as e:
+            print(f"❌ Erro em {Path(caminho).name}: {str(e)}")
+            resultado = {'arquivo': Path(caminho).name, 'origem': str(caminho),
+                         'sucesso': False, 'pulado': False, 'cancelado': False, 'erro': str(e)}
+        finally:
+            with self._trava:
+                self._em_andamento.discard(caminho)
+            self.fila.task_done()
+        
+        if resultado['pulado']:
+            self.estatisticas['pulados'] += 1
+        elif resultado['sucesso']:
+            self.estatisticas['convertidos'] += 1
+        elif not resultado['cancelado']:
+            self.estatisticas['erros'] += 1
+        if self.ao_concluir is not None:
+            self.ao_concluir(resultado)
@@ -0,0 +1,1093 @@
+"""
+Processamento de arquivos CSV para conversão UTM -> Geográficas
+
+Carrega, converte e grava os arquivos sem depender da interface gráfica.
+Os arquivos podem ser processados em blocos de linhas de tamanho fixo, de
+modo que o uso de memória não cresce com o tamanho do arquivo, e vários
+arquivos podem ser convertidos em paralelo em um pool de processos.
+Arquivos .gz, .xz, .bz2 e os CSV dentro de um .zip são descomprimidos
+durante a leitura, sem extração para o disco.
+"""
+
+import bz2
+import codecs
+import contextlib
+import functools
+import gzip
+import hashlib
+import json
+import lzma
+import multiprocessing
+import os
+import re
+import sys
+import zipfile
+import numpy as np
+import pandas as pd
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from conversor_utm import (ConversorUTM, converter_colunas_df, detectar_colunas_utm, interpretar_hemisferios,
+                           interpretar_zonas, letra_para_indice, valores_numericos)
+from conversao_paralela import ConversorParalelo
+from formatos_colunares import FORMATOS_COLUNARES, GravadorColunar, formato_colunar, ler_blocos_colunares
+from formatos_entrada import COMPRESSOES, EXTENSAO_PACOTE, arquivo_de_entrada
+from instrumentacao import Instrumentacao, medir
+
+
+# Separadores aceitos, em ordem de preferência em caso de empate
+SEPARADORES = [';', ',', '\t']
+
+# Marcas de ordem de bytes (BOM) e a codificação correspondente
+BOMS = [
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+# Bytes lidos do início do arquivo para descobrir codificação e separador
+TAMANHO_AMOSTRA = 64 * 1024
+LINHAS_AMOSTRA = 50
+
+# Tratamento de erros dos arquivos UTF-8: bytes inválidos são lidos como Latin-1
+ERROS_UTF8 = 'utf8_latin1'
+
+# Manifesto da conversão incremental, gravado na pasta de destino
+ARQUIVO_MANIFESTO = '.manifesto_conversao.json'
+
+# Formato já detectado em cada pasta: {pasta: (encoding, sep)}
+_formatos_pasta = {}
+
+_RE_ASPAS = re.compile(r'"[^"]*"')
+
+# Linhas por bloco no modo streaming
+TAMANHO_BLOCO_PADRAO = 100_000
+
+# Formatos de saída aceitos
+FORMATOS_SAIDA = ('csv', 'parquet', 'feather')
+
+# Compressões opcionais da saída CSV e a extensão acrescentada ao nome
+COMPRESSOES_SAIDA = {
+    'gzip': ('.gz', functools.partial(gzip.open, compresslevel=6)),
+    'xz': ('.xz', lzma.open),
+    'bz2': ('.bz2', bz2.open),
+}
+
+# Subpasta do destino com o relatório das linhas mantidas originais de cada arquivo
+PASTA_REJEITADAS = 'rejeitadas'
+
+
+class ConversaoCancelada(Exception):
+    """A conversão foi interrompida a pedido do usuário"""
+
+
+def _utf8_com_latin1(erro):
+    # A codificação é detectada só pela amostra: um byte que não é UTF-8
+    # válido mais adiante (ex.: um "ç" em Latin-1) é lido como Latin-1, em
+    # vez de interromper a leitura do arquivo
+    if isinstance(erro, UnicodeDecodeError):
+        return erro.object[erro.start:erro.end].decode('latin-1'), erro.end
+    raise erro
+
+
+codecs.register_error(ERROS_UTF8, _utf8_com_latin1)
+
+
+def _ler_csv(arquivo_path, encoding, sep, **kwargs):
+    # Todas as colunas como texto: o que não for convertido sai igual à entrada
+    if encoding.startswith('utf-8'):
+        kwargs.setdefault('encoding_errors', ERROS_UTF8)
+    return pd.read_csv(arquivo_path, encoding=encoding, sep=sep,
+                       dtype=str, keep_default_na=False, **kwargs)
+
+
+def nome_base(arquivo_path):
+    """Nome do arquivo sem as extensões de formato e de compressão ("dados.csv.gz" -> "dados")"""
+    caminho = Path(arquivo_path)
+    if caminho.suffix.lower() == EXTENSAO_PACOTE:
+        return caminho.name[:-len(EXTENSAO_PACOTE)]
+    if caminho.suffix.lower() in COMPRESSOES:
+        caminho = caminho.with_suffix('')
+    return caminho.stem
+
+
+def nome_destino(arquivo_path, formato_saida='csv', compressao_saida=None):
+    """
+    Nome do arquivo convertido a partir do nome da entrada
+    
+    Args:
+        arquivo_path (Path): Arquivo de entrada (ou membro de um .zip)
+        formato_saida (str): 'csv', 'parquet' ou 'feather'
+        compressao_saida (str): Compressão da saída CSV (chave de COMPRESSOES_SAIDA)
+    
+    Returns:
+        str: Ex.: "dados.csv", "dados.csv.gz"; para um .zip, o nome da pasta
+             que recebe os CSV convertidos do pacote
+    """
+    if Path(arquivo_path).suffix.lower() == EXTENSAO_PACOTE:
+        return nome_base(arquivo_path)
+    nome = f"{nome_base(arquivo_path)}.{formato_saida}"
+    if compressao_saida:
+        nome += COMPRESSOES_SAIDA[compressao_saida][0]
+    return nome
+
+
+def destinos_repetidos(arquivos, formato_saida='csv', compressao_saida=None):
+    """
+    Encontra entradas que seriam convertidas para o mesmo arquivo de destino
+    
+    "dados.csv", "dados.csv.gz" e "dados.parquet" geram todos "dados.csv";
+    convertidos para a mesma pasta, um sobrescreveria o outro (e o relatório
+    de linhas rejeitadas dele).
+    
+    Args:
+        arquivos (list): Arquivos de entrada (ou nomes de membros de um .zip)
+        formato_saida (str): 'csv', 'parquet' ou 'feather'
+        compressao_saida (str): Compressão da saída CSV (chave de COMPRESSOES_SAIDA)
+    
+    Returns:
+        dict: {índice em arquivos: nomes das outras entradas com o mesmo destino};
+              vazio se todos os destinos são diferentes
+    """
+    por_destino = {}
+    for i, arquivo in enumerate(arquivos):
+        destino = os.path.normcase(nome_destino(arquivo, formato_saida, compressao_saida))
+        por_destino.setdefault(destino, []).append(i)
+    
+    repetidos = {}
+    for indices in por_destino.values():
+        if len(indices) > 1:
+            for i in indices:
+                repetidos[i] = [Path(arquivos[j]).name for j in indices if j != i]
+    return repetidos
+
+
+def erro_destino_repetido(arquivo, outros, formato_saida='csv', compressao_saida=None):
+    """Mensagem de erro de uma entrada cujo destino também é o de outras (ver destinos_repetidos)"""
+    return (f"{Path(arquivo).name} e {', '.join(outros)} seriam gravados no mesmo destino "
+            f"({nome_destino(arquivo, formato_saida, compressao_saida)}); renomeie um deles")
+
+
+def membros_csv(arquivo_zip):
+    """Lista os CSV (também .csv.gz etc.) dentro de um .zip, na ordem do pacote"""
+    with zipfile.ZipFile(arquivo_zip) as pacote:
+        return [info.filename for info in pacote.infolist()
+                if not info.is_dir() and not info.filename.startswith('__MACOSX/')
+                and not Path(info.filename).name.startswith('.')
+                and arquivo_de_entrada(info.filename)
+                and Path(info.filename).suffix.lower() not in FORMATOS_COLUNARES
+                and Path(info.filename).suffix.lower() != EXTENSAO_PACOTE]
+
+
+@contextlib.contextmanager
+def abrir_entrada(arquivo_path, membro=None):
+    """
+    Abre a entrada em modo binário, descomprimindo durante a leitura
+    
+    Args:
+        arquivo_path (Path): Arquivo CSV, CSV comprimido (.gz/.xz/.bz2) ou .zip
+        membro (str): Nome do CSV dentro do .zip
+    
+    Yields:
+        Objeto de arquivo binário, lido em sequência
+    """
+    with contextlib.ExitStack() as pilha:
+        if membro is not None:
+            pacote = pilha.enter_context(zipfile.ZipFile(arquivo_path))
+            arquivo = pilha.enter_context(pacote.open(membro))
+            abrir = COMPRESSOES.get(Path(membro).suffix.lower())
+            if abrir is not None:
+                # CSV comprimido dentro do pacote
+                arquivo = pilha.enter_context(abrir(arquivo, 'rb'))
+        else:
+            abrir = COMPRESSOES.get(Path(arquivo_path).suffix.lower(), open)
+            arquivo = pilha.enter_context(abrir(arquivo_path, 'rb'))
+        yield arquivo
+
+
+def _ler_amostra(arquivo_path, tamanho=TAMANHO_AMOSTRA, membro=None):
+    # Início do arquivo (já descomprimido), cortado na última quebra de linha completa
+    with abrir_entrada(arquivo_path, membro) as f:
+        amostra = f.read(tamanho)
+    if len(amostra) == tamanho and b'\n' in amostra:
+        amostra = amostra[:amostra.rindex(b'\n') + 1]
+    return amostra
+
+
+def detectar_codificacao(amostra):
+    """
+    Detecta a codificação a partir dos primeiros bytes do arquivo
+    
+    Args:
+        amostra (bytes): Início do arquivo
+    
+    Returns:
+        str: 'utf-8-sig'/'utf-16' se houver BOM, 'utf-8' se a amostra for UTF-8
+             válido com acentos, senão 'latin-1' (que lê qualquer byte). Nos
+             arquivos UTF-8, bytes inválidos depois da amostra são lidos como
+             Latin-1 (ver ERROS_UTF8)
+    """
+    for bom, encoding in BOMS:
+        if amostra.startswith(bom):
+            return encoding
+    
+    try:
+        amostra.decode('ascii')
+        return 'latin-1'
+    except UnicodeDecodeError:
+        pass
+    
+    try:
+        amostra.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return 'latin-1'
+
+
+def contar_colunas(linha, sep):
+    """Conta as colunas de uma linha CSV, ignorando separadores entre aspas"""
+    return _RE_ASPAS.sub('', linha).count(sep) + 1
+
+
+def detectar_separador(linhas):
+    """
+    Detecta o separador pela frequência em cada linha da amostra
+    
+    O separador escolhido é o que aparece no cabeçalho e se repete com a
+    mesma contagem no maior número de linhas de dados, de modo que vírgulas
+    decimais em arquivos separados por ';' não confundem a detecção.
+    
+    Args:
+        linhas (list): Primeiras linhas do arquivo (cabeçalho primeiro)
+    
+    Returns:
+        str: Separador ou None se nenhum gerar mais de uma coluna
+    """
+    if not linhas:
+        return None
+    
+    melhor = None
+    melhor_pontos = 0
+    for sep in SEPARADORES:
+        colunas = contar_colunas(linhas[0], sep)
+        if colunas < 2:
+            continue
+        
+        dados = linhas[1:]
+        consistentes = sum(1 for linha in dados if contar_colunas(linha, sep) == colunas)
+        pontos = (consistentes / len(dados)) if dados else 1.0
+        if pontos > melhor_pontos:
+            melhor, melhor_pontos = sep, pontos
+    
+    return melhor
+
+
+def _linhas_amostra(amostra, encoding):
+    texto = amostra.decode(encoding, errors='replace')
+    if texto.startswith('\ufeff'):
+        texto = texto[1:]
+    return [linha for linha in texto.splitlines()[:LINHAS_AMOSTRA] if linha.strip()]
+
+
+def _formato_compativel(amostra, formato):
+    # Confere rapidamente se o formato da pasta também serve para este arquivo
+    encoding, sep = formato
+    if detectar_codificacao(amostra) != encoding:
+        return False
+    linhas = _linhas_amostra(amostra, encoding)[:2]
+    return (len(linhas) > 0 and contar_colunas(linhas[0], sep) > 1 and
+            all(contar_colunas(linha, sep) == contar_colunas(linhas[0], sep) for linha in linhas))
+
+
+def detectar_formato(arquivo_path, usar_cache=True, membro=None):
+    """
+    Descobre codificação e separador lendo apenas o início do arquivo
+    
+    Usa a verificação de BOM, a validade UTF-8 e a frequência de cada
+    separador em alguns KB do arquivo, sem tentar ler o arquivo inteiro. O
+    formato detectado fica guardado por pasta e é reaproveitado pelos demais
+    arquivos da mesma pasta quando for compatível com eles.
+    
+    Args:
+        arquivo_path (Path): Arquivo CSV (também .gz, .xz, .bz2 ou o .zip de membro)
+        usar_cache (bool): Reaproveita o formato já detectado na pasta
+        membro (str): Nome do CSV dentro do .zip
+    
+    Returns:
+        tuple: (encoding, sep) ou None se o arquivo não parecer um CSV
+    """
+    arquivo_path = Path(arquivo_path)
+    pasta = str(arquivo_path.resolve().parent)
+    amostra = _ler_amostra(arquivo_path, membro=membro)
+    
+    formato = _formatos_pasta.get(pasta) if usar_cache else None
+    if formato is not None and _formato_compativel(amostra, formato):
+        return formato
+    
+    encoding = detectar_codificacao(amostra)
+    sep = detectar_separador(_linhas_amostra(amostra, encoding))
+    if sep is None:
+        return None
+    
+    formato = (encoding, sep)
+    if usar_cache:
+        _formatos_pasta[pasta] = formato
+    return formato
+
+
+def carregar_arquivo(arquivo_path):
+    """
+    Carrega um arquivo CSV inteiro para conversão
+    
+    Args:
+        arquivo_path (Path): Arquivo CSV
+    
+    Returns:
+        pandas.DataFrame: Dados do arquivo ou None se não for possível carregar
+    """
+    arquivo_path = Path(arquivo_path)
+    try:
+        formato = detectar_formato(arquivo_path)
+        if formato is None:
+            print(f"❌ Não foi possível carregar {arquivo_path.name}")
+            return None
+        
+        encoding, sep = formato
+        df = _ler_csv(arquivo_path, encoding, sep)
+        print(f"✅ Arquivo carregado: {arquivo_path.name} (encoding: {encoding}, sep: '{sep}')")
+        return df
+    
+    except Exception as e:
+        print(f"❌ Erro ao carregar {arquivo_path.name}: {str(e)}")
+        return None
+
+
+def ler_blocos(arquivo_path, tamanho_bloco=None, instrumentacao=None, membro=None):
+    """
+    Lê um arquivo CSV, Parquet ou Feather em blocos de linhas
+    
+    CSV comprimidos (.gz, .xz, .bz2) e membros de um .zip são descomprimidos
+    durante a leitura, bloco a bloco.
+    
+    Args:
+        arquivo_path (Path): Arquivo de entrada
+        tamanho_bloco (int): Linhas por bloco (None lê o arquivo inteiro de uma vez)
+        instrumentacao (Instrumentacao): Registra o tempo de detecção e leitura (opcional)
+        membro (str): Nome do CSV a ler dentro do .zip arquivo_path
+    
+    Returns:
+        tuple: (iterador de DataFrames, encoding, sep); encoding e sep são
+               None para Parquet/Feather
+    """
+    arquivo_path = Path(arquivo_path)
+    if membro is None and formato_colunar(arquivo_path):
+        return _medir_leitura(ler_blocos_colunares(arquivo_path, tamanho_bloco), instrumentacao), None, None
+    
+    with medir(instrumentacao, 'deteccao'):
+        formato = detectar_formato(arquivo_path, membro=membro)
+    if formato is None:
+        raise Exception(f"Não foi possível carregar {Path(membro or arquivo_path).name}")
+    
+    encoding, sep = formato
+    if membro is not None:
+        blocos = _ler_membro(arquivo_path, membro, encoding, sep, tamanho_bloco)
+    elif tamanho_bloco:
+        blocos = _ler_csv(arquivo_path, encoding, sep, chunksize=int(tamanho_bloco))
+    else:
+        blocos = _ler_inteiro(arquivo_path, encoding, sep)
+    
+    return _medir_leitura(blocos, instrumentacao), encoding, sep
+
+
+def _ler_inteiro(arquivo_path, encoding, sep):
+    # Arquivo inteiro como um único bloco, lido só quando o iterador for consumido
+    # (.gz/.xz/.bz2 são descomprimidos pelo pandas, pela extensão)
+    yield _ler_csv(arquivo_path, encoding, sep)
+
+
+def _ler_membro(arquivo_zip, membro, encoding, sep, tamanho_bloco):
+    # Membro de um .zip lido direto do pacote; o pacote fica aberto até o último bloco
+    with abrir_entrada(arquivo_zip, membro) as f:
+        if tamanho_bloco:
+            with _ler_csv(f, encoding, sep, chunksize=int(tamanho_bloco)) as leitor:
+                yield from leitor
+        else:
+            yield _ler_csv(f, encoding, sep)
+
+
+def _medir_leitura(blocos, instrumentacao):
+    # Mede o tempo de leitura de cada bloco sob demanda
+    iterador = iter(blocos)
+    while True:
+        with medir(instrumentacao, 'leitura') as medicao:
+            bloco = next(iterador, None)
+            if medicao is not None and bloco is not None:
+                medicao['linhas'] = len(bloco)
+        if bloco is None:
+            return
+        yield bloco
+
+
+class _SaidaCsv:
+    # Destino CSV (separador ';', UTF-8 com BOM), com a mesma interface do GravadorColunar
+    
+    def __init__(self, arquivo_path, compressao=None):
+        abrir = COMPRESSOES_SAIDA[compressao][1] if compressao else open
+        self._arquivo = abrir(arquivo_path, 'wt', encoding='utf-8-sig', newline='')
+        self._cabecalho = True
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *erro):
+        self._arquivo.close()
+    
+    def gravar(self, df):
+        df.to_csv(self._arquivo, index=False, sep=';', header=self._cabecalho)
+        self._cabecalho = False
+
+
+def abrir_saida(arquivo_destino, formato_saida='csv', compressao_saida=None):
+    """
+    Abre o destino de uma conversão para gravação bloco a bloco
+    
+    Args:
+        arquivo_destino (Path): Arquivo de saída
+        formato_saida (str): 'csv', 'parquet' ou 'feather'
+        compressao_saida (str): 'gzip', 'xz' ou 'bz2' para comprimir a saída CSV
+    
+    Returns:
+        Objeto com o método gravar(df), para usar com `with`
+    """
+    if compressao_saida and compressao_saida not in COMPRESSOES_SAIDA:
+        raise ValueError(f"Compressão inválida: {compressao_saida} (use {', '.join(COMPRESSOES_SAIDA)})")
+    if formato_saida == 'csv':
+        return _SaidaCsv(arquivo_destino, compressao_saida)
+    if compressao_saida:
+        raise ValueError("A compressão da saída só vale para CSV (Parquet/Feather já são comprimidos)")
+    if formato_saida in FORMATOS_SAIDA:
+        return GravadorColunar(arquivo_destino, formato_saida)
+    raise ValueError(f"Formato de saída inválido: {formato_saida} (use {', '.join(FORMATOS_SAIDA)})")
+
+
+def converter_arquivo(arquivo_origem, arquivo_destino, col_x, col_y,
+                      conversor=None, tamanho_bloco=TAMANHO_BLOCO_PADRAO,
+                      col_zona=None, col_hemisferio=None, instrumentacao=None, cancelar=None,
+                      workers_arquivo=None, formato_saida='csv', formatar_texto=True,
+                      compressao_saida=None, membro=None):
+    """
+    Converte um arquivo bloco a bloco, anexando cada bloco ao destino
+    
+    O resultado é idêntico, byte a byte, ao de uma conversão do arquivo
+    inteiro: o cabeçalho e o BOM são escritos uma única vez e as colunas não
+    convertidas são copiadas como texto.
+    
+    Nas saídas Parquet/Feather as colunas float64 'longitude_dec' e
+    'latitude_dec' são acrescentadas ao lado dos textos GG MM SS.
+    
+    Um .zip é tratado como pacote: arquivo_destino é uma pasta e cada CSV do
+    pacote é convertido para ela (ver converter_pacote_zip).
+    
+    Args:
+        arquivo_origem (Path): Arquivo de entrada (CSV, CSV comprimido, .zip, Parquet ou Feather)
+        arquivo_destino (Path): Arquivo de saída (CSV com separador ';' e UTF-8 com BOM,
+                                ou no formato de formato_saida)
+        col_x (str): Letra da coluna X (Easting)
+        col_y (str): Letra da coluna Y (Northing)
+        conversor (ConversorUTM): Conversor a usar (padrão: SIRGAS2000 23S)
+        tamanho_bloco (int): Linhas por bloco (None converte o arquivo inteiro de uma vez)
+        col_zona (str): Letra da coluna com a zona UTM de cada linha, 'auto' para
+                        usar a coluna encontrada por detectar_colunas_utm(), ou
+                        None para usar a zona do conversor em todas as linhas
+        col_hemisferio (str): Letra da coluna com o hemisfério de cada linha (opcional)
+        instrumentacao (Instrumentacao): Registra o tempo de cada etapa (opcional)
+        cancelar (threading.Event): Quando sinalizado, interrompe a conversão
+                                    entre um bloco e outro (ConversaoCancelada)
+        workers_arquivo (int): Com mais de 1, a projeção e a formatação de cada
+                               bloco são divididas entre esse número de processos
+                               (ver ConversorParalelo); use blocos grandes
+        formato_saida (str): 'csv' (padrão), 'parquet' ou 'feather'
+        formatar_texto (bool): Com False (só Parquet/Feather), X/Y ficam como na
+                               entrada e apenas as colunas decimais são geradas,
+                               sem o custo da formatação GG MM SS
+        compressao_saida (str): 'gzip', 'xz' ou 'bz2' para gravar o CSV comprimido
+        membro (str): Converte só este CSV de dentro do .zip arquivo_origem
+    
+    As linhas mantidas originais (linha, X e Y como no arquivo e o motivo) são
+    reunidas e gravadas de uma só vez, ao fim do arquivo, no relatório
+    indicado por caminho_rejeitadas().
+    
+    Returns:
+        dict: {'arquivo': str, 'linhas': int, 'convertidas': int,
+               'rejeitadas': int, 'relatorio_rejeitadas': str ou None,
+               'duplicadas': int, 'razao_duplicadas': float,
+               'encoding': str, 'sep': str}
+    """
+    arquivo_origem = Path(arquivo_origem)
+    if membro is None and arquivo_origem.suffix.lower() == EXTENSAO_PACOTE:
+        return converter_pacote_zip(arquivo_origem, arquivo_destino, col_x, col_y, conversor=conversor,
+                                    tamanho_bloco=tamanho_bloco, col_zona=col_zona,
+                                    col_hemisferio=col_hemisferio, instrumentacao=instrumentacao,
+                                    cancelar=cancelar, workers_arquivo=workers_arquivo,
+                                    formato_saida=formato_saida, formatar_texto=formatar_texto,
+                                    compressao_saida=compressao_saida)
+    nome = f"{arquivo_origem.name}/{membro}" if membro is not None else arquivo_origem.name
+    
+    try:
+        idx_x = letra_para_indice(col_x)
+        idx_y = letra_para_indice(col_y)
+        idx_zona = letra_para_indice(col_zona) if col_zona and col_zona != 'auto' else None
+        idx_hemisferio = letra_para_indice(col_hemisferio) if col_hemisferio else None
+    except ValueError:
+        raise Exception(f"Letras de colunas inválidas: {col_x}, {col_y}, {col_zona}, {col_hemisferio}")
+    
+    if conversor is None:
+        conversor = ConversorUTM()
+    
+    colunar = formato_saida != 'csv'
+    if not formatar_texto and not colunar:
+        raise ValueError("A saída CSV precisa do texto GG MM SS (formatar_texto=False só vale para Parquet/Feather)")
+    
+    blocos, encoding, sep = ler_blocos(arquivo_origem, tamanho_bloco, instrumentacao, membro)
+    if encoding is None:
+        print(f"✅ Arquivo carregado: {nome}")
+    else:
+        print(f"✅ Arquivo carregado: {nome} (encoding: {encoding}, sep: '{sep}')")
+    
+    linhas = 0
+    convertidas = 0
+    estatisticas = {'linhas': 0, 'duplicadas': 0}
+    rejeitadas = []
+    paralelo = ConversorParalelo(conversor, workers_arquivo) if (workers_arquivo or 1) > 1 else None
+    
+    try:
+        with abrir_saida(arquivo_destino, formato_saida, compressao_saida) as saida:
+            for bloco in blocos:
+                if cancelar is not None and cancelar.is_set():
+                    raise ConversaoCancelada(f"Conversão cancelada: {nome}")
+                
+                if col_zona == 'auto' and linhas == 0:
+                    colunas = detectar_colunas_utm(bloco)
+                    if colunas and colunas['zona_col'] is not None:
+                        idx_zona = bloco.columns.get_loc(colunas['zona_col'])
+                        print(f"Zona de cada linha lida da coluna '{colunas['zona_col']}'")
+                
+                bloco_convertido, validos = converter_colunas_df(bloco, idx_x, idx_y, conversor,
+                                                                 idx_zona, idx_hemisferio, instrumentacao,
+                                                                 estatisticas, paralelo, decimais=colunar,
+                                                                 formatar=formatar_texto)
+                
+                # Linhas com erro na conversão mantêm o valor original
+                if not validos.all():
+                    rejeitadas.append(linhas_rejeitadas(bloco, validos, idx_x, idx_y, idx_zona,
+                                                        idx_hemisferio, conversor.hemisferio, linhas))
+                
+                with medir(instrumentacao, 'gravacao', len(bloco)):
+                    saida.gravar(bloco_convertido)
+                
+                linhas += len(bloco)
+                convertidas += int(validos.sum())
+    except BaseException:
+        # Não deixa arquivo convertido pela metade no destino
+        try:
+            os.remove(arquivo_destino)
+        except OSError:
+            pass
+        raise
+    finally:
+        if paralelo is not None:
+            paralelo.fechar()
+    
+    relatorio = gravar_rejeitadas(caminho_rejeitadas(arquivo_destino), rejeitadas)
+    if relatorio is not None:
+        print(f"⚠️ {linhas - convertidas} linha(s) mantida(s) original(is) em {nome} "
+              f"(detalhes em {relatorio})")
+    
+    return {
+        'arquivo': nome,
+        'linhas': linhas,
+        'convertidas': convertidas,
+        'rejeitadas': linhas - convertidas,
+        'relatorio_rejeitadas': str(relatorio) if relatorio is not None else None,
+        # Repetições de um ponto dentro do mesmo bloco, convertidas uma só vez
+        'duplicadas': estatisticas['duplicadas'],
+        'razao_duplicadas': round(estatisticas['duplicadas'] / linhas, 4) if linhas else 0.0,
+        'encoding': encoding,
+        'sep': sep
+    }
+
+
+def converter_pacote_zip(arquivo_zip, pasta_destino, col_x, col_y, compressao_saida=None,
+                         formato_saida='csv', **opcoes):
+    """
+    Converte cada CSV de um .zip, lendo direto do pacote (sem extrair para o disco)
+    
+    Cada membro é convertido como um arquivo comum, bloco a bloco, para
+    pasta_destino; membros em subpastas do pacote têm as pastas incluídas
+    no nome ("campo/dia1.csv" -> "campo_dia1.csv").
+    
+    Args:
+        arquivo_zip (Path): Pacote de entrada
+        pasta_destino (Path): Pasta que recebe os arquivos convertidos
+        col_x (str): Letra da coluna X (Easting)
+        col_y (str): Letra da coluna Y (Northing)
+        compressao_saida (str): Compressão dos CSV convertidos (opcional)
+        formato_saida (str): 'csv', 'parquet' ou 'feather'
+        **opcoes: Demais argumentos de converter_arquivo
+    
+    Returns:
+        dict: Totais do pacote, com as chaves de converter_arquivo, e a lista
+              'membros' com o resultado de cada CSV
+    """
+    arquivo_zip = Path(arquivo_zip)
+    pasta_destino = Path(pasta_destino)
+    membros = membros_csv(arquivo_zip)
+    if not membros:
+        raise Exception(f"Nenhum arquivo CSV encontrado em {arquivo_zip.name}")
+    
+    nomes = []
+    for membro in membros:
+        # Só as partes do caminho que não saem da pasta de destino
+        partes = [parte for parte in Path(membro).parts[:-1] if parte not in ('', '.', '..', '/', '\\')]
+        nomes.append('_'.join(partes + [Path(membro).name]))
+    repetidos = destinos_repetidos(nomes, formato_saida, compressao_saida)
+    if repetidos:
+        i, outros = next(iter(repetidos.items()))
+        raise Exception(erro_destino_repetido(nomes[i], outros, formato_saida, compressao_saida))
+    
+    pasta_destino.mkdir(parents=True, exist_ok=True)
+    resultados = []
+    for membro, nome in zip(membros, nomes):
+        destino = pasta_destino / nome_destino(nome, formato_saida, compressao_saida)
+        resultados.append(converter_arquivo(arquivo_zip, destino, col_x, col_y,
+                                            formato_saida=formato_saida, compressao_saida=compressao_saida,
+                                            membro=membro, **opcoes))
+    
+    linhas = sum(r['linhas'] for r in resultados)
+    duplicadas = sum(r['duplicadas'] for r in resultados)
+    com_rejeitadas = any(r['relatorio_rejeitadas'] for r in resultados)
+    return {
+        'arquivo': arquivo_zip.name,
+        'linhas': linhas,
+        'convertidas': sum(r['convertidas'] for r in resultados),
+        'rejeitadas': sum(r['rejeitadas'] for r in resultados),
+        'relatorio_rejeitadas': str(pasta_destino / PASTA_REJEITADAS) if com_rejeitadas else None,
+        'duplicadas': duplicadas,
+        'razao_duplicadas': round(duplicadas / linhas, 4) if linhas else 0.0,
+        'encoding': resultados[0]['encoding'],
+        'sep': resultados[0]['sep'],
+        'membros': resultados
+    }
+
+
+def linhas_rejeitadas(bloco, validos, idx_x, idx_y, idx_zona=None, idx_hemisferio=None,
+                      hemisferio_padrao='S', primeira_linha=0):
+    """
+    Monta o relatório das linhas de um bloco que não puderam ser convertidas
+    
+    Args:
+        bloco (pandas.DataFrame): Bloco lido do arquivo
+        validos (numpy.ndarray): Máscara das linhas convertidas
+        idx_x (int): Índice da coluna X
+        idx_y (int): Índice da coluna Y
+        idx_zona (int): Índice da coluna de zona (opcional)
+        idx_hemisferio (int): Índice da coluna de hemisfério (opcional)
+        hemisferio_padrao (str): Hemisfério das zonas sem sufixo
+        primeira_linha (int): Linhas já processadas antes deste bloco
+    
+    Returns:
+        pandas.DataFrame: Colunas linha, x, y e motivo
+    """
+    indices = (~validos).nonzero()[0]
+    rejeitado = bloco.iloc[indices]
+    x_texto = rejeitado.iloc[:, idx_x]
+    y_texto = rejeitado.iloc[:, idx_y]
+    
+    # Só as linhas rejeitadas são reinterpretadas para descobrir o motivo
+    numericos = np.isfinite(valores_numericos(x_texto)) & np.isfinite(valores_numericos(y_texto))
+    zona_valida = np.ones(len(indices), dtype=bool)
+    if idx_zona is not None or idx_hemisferio is not None:
+        zonas, hemisferios = (interpretar_zonas(rejeitado.iloc[:, idx_zona], hemisferio_padrao)
+                              if idx_zona is not None else (None, None))
+        if idx_hemisferio is not None:
+            hemisferios = interpretar_hemisferios(rejeitado.iloc[:, idx_hemisferio])
+        if zonas is not None:
+            zona_valida &= ~np.isnan(zonas)
+        zona_valida &= hemisferios != None  # noqa: E711 (comparação elemento a elemento)
+    
+    motivos = np.where(~numericos, 'valor não numérico',
+                       np.where(~zona_valida, 'zona ou hemisfério inválido',
+                                'fora do domínio da projeção'))
+    
+    return pd.DataFrame({
+        'linha': indices + primeira_linha + 1,
+        'x': x_texto.to_numpy(dtype=object),
+        'y': y_texto.to_numpy(dtype=object),
+        'motivo': motivos
+    })
+
+
+def caminho_rejeitadas(arquivo_destino):
+    """Relatório (CSV) de linhas rejeitadas de um arquivo convertido, na subpasta do destino"""
+    arquivo_destino = Path(arquivo_destino)
+    return arquivo_destino.parent / PASTA_REJEITADAS / f"{nome_base(arquivo_destino)}.csv"
+
+
+def gravar_rejeitadas(caminho, partes):
+    """
+    Grava o relatório de linhas rejeitadas de um arquivo
+    
+    Sem linhas rejeitadas, remove o relatório de uma conversão anterior.
+    
+    Args:
+        caminho (Path): Arquivo do relatório (CSV, separador ';', UTF-8 com BOM)
+        partes (list): DataFrames gerados por linhas_rejeitadas()
+    
+    Returns:
+        Path: Caminho do relatório gravado, ou None se não houve rejeitadas
+    """
+    caminho = Path(caminho)
+    if not partes:
+        try:
+            os.remove(caminho)
+        except OSError:
+            pass
+        return None
+    
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    pd.concat(partes, ignore_index=True).to_csv(caminho, index=False, sep=';', encoding='utf-8-sig')
+    return caminho
+
+
+def hash_arquivo(arquivo_path, tamanho_leitura=1024 * 1024):
+    """
+    Calcula o hash do conteúdo de um arquivo (BLAKE2b, lido em partes)
+    
+    Args:
+        arquivo_path (Path): Arquivo
+        tamanho_leitura (int): Bytes lidos por vez
+    
+    Returns:
+        str: Hash hexadecimal
+    """
+    h = hashlib.blake2b(digest_size=16)
+    with open(arquivo_path, 'rb') as f:
+        for parte in iter(lambda: f.read(tamanho_leitura), b''):
+            h.update(parte)
+    return h.hexdigest()
+
+
+def assinatura_arquivo(arquivo_path, com_hash=True):
+    """
+    Retorna tamanho, data de modificação e (opcionalmente) hash de um arquivo
+    
+    Args:
+        arquivo_path (Path): Arquivo
+        com_hash (bool): Calcula também o hash do conteúdo
+    
+    Returns:
+        dict: {'tamanho': int, 'mtime': int, 'hash': str ou None}
+    """
+    info = os.stat(arquivo_path)
+    return {
+        'tamanho': info.st_size,
+        'mtime': info.st_mtime_ns,
+        'hash': hash_arquivo(arquivo_path) if com_hash else None
+    }
+
+
+def carregar_manifesto(pasta_destino):
+    """
+    Carrega o manifesto da conversão incremental da pasta de destino
+    
+    Args:
+        pasta_destino (Path): Pasta de destino
+    
+    Returns:
+        dict: {'configuracao': dict, 'arquivos': {origem: dict}} (vazio se não existir)
+    """
+    try:
+        with open(Path(pasta_destino) / ARQUIVO_MANIFESTO, 'r', encoding='utf-8') as f:
+            manifesto = json.load(f)
+        if isinstance(manifesto.get('arquivos'), dict):
+            return manifesto
+    except (OSError, ValueError):
+        pass
+    return {'configuracao': None, 'arquivos': {}}
+
+
+def salvar_manifesto(pasta_destino, manifesto):
+    """Grava o manifesto na pasta de destino (troca atômica do arquivo)"""
+    caminho = Path(pasta_destino) / ARQUIVO_MANIFESTO
+    temporario = caminho.with_name(caminho.name + '.tmp')
+    with open(temporario, 'w', encoding='utf-8') as f:
+        json.dump(manifesto, f, ensure_ascii=False, indent=2)
+    os.replace(temporario, caminho)
+
+
+def configuracao_conversao(col_x, col_y, conversor, col_zona=None, col_hemisferio=None,
+                           formato_saida='csv', formatar_texto=True, compressao_saida=None):
+    """Configurações que, se mudarem, exigem reconverter todos os arquivos"""
+    return {
+        'formato_saida': formato_saida,
+        'formatar_texto': formatar_texto,
+        'compressao_saida': compressao_saida,
+        'coluna_x': str(col_x).upper(),
+        'coluna_y': str(col_y).upper(),
+        'coluna_zona': col_zona,
+        'coluna_hemisferio': col_hemisferio,
+        'zona': conversor.zona_utm,
+        'hemisferio': conversor.hemisferio,
+        'datum': conversor.datum,
+        'motor': conversor.motor
+    }
+
+
+def arquivo_inalterado(arquivo_origem, arquivo_destino, registro):
+    """
+    Verifica se um arquivo já foi convertido e não mudou desde então
+    
+    Tamanho e data de modificação iguais bastam; se só a data mudou, o hash
+    do conteúdo decide (e o registro é atualizado com a nova data).
+    
+    Args:
+        arquivo_origem (Path): Arquivo de entrada
+        arquivo_destino (Path): Arquivo convertido
+        registro (dict): Entrada do manifesto para o arquivo (ou None)
+    
+    Returns:
+        bool: True se a conversão anterior continua válida
+    """
+    if not registro or not Path(arquivo_destino).exists():
+        return False
+    
+    atual = assinatura_arquivo(arquivo_origem, com_hash=False)
+    if atual['tamanho'] != registro.get('tamanho'):
+        return False
+    if atual['mtime'] == registro.get('mtime'):
+        return True
+    
+    if hash_arquivo(arquivo_origem) == registro.get('hash'):
+        registro['mtime'] = atual['mtime']
+        return True
+    return False
+
+
+def _inicializar_processo(logs_em_stderr):
+    # Mensagens dos processos do pool seguem o mesmo destino do processo principal
+    if logs_em_stderr:
+        sys.stdout = sys.stderr
+
+
+def _resultado_arquivo(arquivo_origem, arquivo_destino, **valores):
+    resultado = {
+        'arquivo': Path(arquivo_origem).name,
+        'origem': str(arquivo_origem),
+        'destino': str(arquivo_destino),
+        'sucesso': False,
+        'pulado': False,
+        'cancelado': False,
+        'erro': None
+    }
+    resultado.update(valores)
+    return resultado
+
+
+def _resultado_cancelado(arquivo_origem, arquivo_destino):
+    return _resultado_arquivo(arquivo_origem, arquivo_destino, cancelado=True,
+                              erro=f"Conversão cancelada: {Path(arquivo_origem).name}")
+
+
+def _converter_arquivo_seguro(arquivo_origem, arquivo_destino, opcoes, com_assinatura=False,
+                              cancelar=None):
+    # Executado nos processos do pool: erros voltam no resultado, não como exceção
+    resultado = _resultado_arquivo(arquivo_origem, arquivo_destino)
+    opcoes = dict(opcoes)
+    instrumentar = opcoes.pop('instrumentar', False)
+    instrumentacao = Instrumentacao(perfil=(instrumentar == 'perfil')) if instrumentar else None
+    try:
+        print(f"Processando: {resultado['arquivo']}")
+        # Assinatura tirada antes da leitura: se o arquivo mudar durante a
+        # conversão, a próxima execução incremental o converte de novo
+        if com_assinatura:
+            resultado['assinatura'] = assinatura_arquivo(arquivo_origem)
+        resultado.update(converter_arquivo(arquivo_origem, arquivo_destino,
+                                           instrumentacao=instrumentacao, cancelar=cancelar,
+                                           **opcoes))
+        resultado['sucesso'] = True
+        print(f"✅ Convertido: {resultado['arquivo']}")
+    except ConversaoCancelada as e:
+        resultado['cancelado'] = True
+        resultado['erro'] = str(e)
+        print(f"⛔ {str(e)}")
+    except Exception as e:
+        resultado['erro'] = str(e)
+        print(f"❌ Erro em {resultado['arquivo']}: {str(e)}")
+    if instrumentacao is not None:
+        resultado['instrumentacao'] = instrumentacao.relatorio()
+    return resultado
+
+
+def converter_arquivos(arquivos, pasta_destino, col_x, col_y, conversor=None,
+                       tamanho_bloco=TAMANHO_BLOCO_PADRAO, workers=None, ao_concluir=None,
+                       logs_em_stderr=False, incremental=False, col_zona=None, col_hemisferio=None,
+                       instrumentar=False, cancelar=None, workers_arquivo=None, formato_saida='csv',
+                       formatar_texto=True, compressao_saida=None):
+    """
+    Converte vários arquivos CSV, em paralelo em um pool de processos
+    
+    Cada arquivo é salvo em pasta_destino com o mesmo nome e a extensão do
+    formato de saída (.csv, .parquet ou .feather; ver nome_destino). Os CSV de
+    um .zip vão para uma pasta com o nome do pacote. Entradas que gerariam o
+    mesmo destino (ex.: dados.csv e dados.csv.gz) não são convertidas e
+    voltam com erro (ver destinos_repetidos).
+    No modo incremental, um manifesto na pasta de destino registra tamanho,
+    data de modificação e hash de cada entrada junto com as configurações da
+    conversão; arquivos que não mudaram desde a última execução são pulados.
+    
+    Args:
+        arquivos (list): Arquivos CSV de entrada
+        pasta_destino (Path): Pasta onde os arquivos convertidos serão salvos
+        col_x (str): Letra da coluna X (Easting)
+        col_y (str): Letra da coluna Y (Northing)
+        conversor (ConversorUTM): Conversor a usar (padrão: SIRGAS2000 23S)
+        tamanho_bloco (int): Linhas por bloco na leitura de cada arquivo
+        workers (int): Processos simultâneos (padrão: número de núcleos)
+        ao_concluir (callable): Chamada com o resultado de cada arquivo, na
+                                ordem em que terminam
+        logs_em_stderr (bool): Envia as mensagens dos processos do pool para o stderr
+        incremental (bool): Converte apenas arquivos novos ou alterados
+        col_zona (str): Coluna da zona de cada linha (ver converter_arquivo)
+        col_hemisferio (str): Coluna do hemisfério de cada linha (ver converter_arquivo)
+        instrumentar (bool ou str): Mede cada etapa de cada arquivo e inclui o
+                                    relatório em 'instrumentacao'; 'perfil'
+                                    anexa também o cProfile
+        cancelar (threading.Event): Quando sinalizado, arquivos ainda não
+                                    iniciados são cancelados e os que estão em
+                                    andamento (inclusive nos processos do pool)
+                                    param no próximo bloco
+        workers_arquivo (int): Divide cada arquivo entre esse número de processos
+                               (ver converter_arquivo); os arquivos passam a ser
+                               convertidos um de cada vez
+        formato_saida (str): 'csv', 'parquet' ou 'feather' (ver converter_arquivo)
+        formatar_texto (bool): Gera o texto GG MM SS (ver converter_arquivo)
+        compressao_saida (str): 'gzip', 'xz' ou 'bz2' para gravar os CSV comprimidos
+    
+    Returns:
+        list: Um dict por arquivo, na mesma ordem de `arquivos`, com as chaves
+              {'arquivo', 'origem', 'destino', 'sucesso', 'pulado', 'cancelado',
+              'erro'} e, em caso de conversão, as estatísticas de converter_arquivo()
+    """
+    arquivos = [Path(arquivo) for arquivo in arquivos]
+    pasta_destino = Path(pasta_destino)
+    if conversor is None:
+        conversor = ConversorUTM()
+    
+    opcoes = {
+        'col_x': col_x,
+        'col_y': col_y,
+        'conversor': conversor,
+        'tamanho_bloco': tamanho_bloco,
+        'col_zona': col_zona,
+        'col_hemisferio': col_hemisferio,
+        'instrumentar': instrumentar,
+        'workers_arquivo': workers_arquivo,
+        'formato_saida': formato_saida,
+        'formatar_texto': formatar_texto,
+        'compressao_saida': compressao_saida
+    }
+    tarefas = [(arquivo, pasta_destino / nome_destino(arquivo, formato_saida, compressao_saida), opcoes, incremental)
+               for arquivo in arquivos]
+    resultados = [None] * len(tarefas)
+    
+    # Entradas com o mesmo destino (ex.: dados.csv e dados.csv.gz) não são
+    # convertidas: uma sobrescreveria a outra, ou as duas gravariam ao mesmo tempo
+    repetidos = destinos_repetidos(arquivos, formato_saida, compressao_saida)
+    for i, outros in repetidos.items():
+        erro = erro_destino_repetido(arquivos[i], outros, formato_saida, compressao_saida)
+        resultados[i] = _resultado_arquivo(*tarefas[i][:2], erro=erro)
+        print(f"❌ Erro em {arquivos[i].name}: {erro}")
+        if ao_concluir is not None:
+            ao_concluir(resultados[i])
+    pendentes = [i for i in range(len(tarefas)) if i not in repetidos]
+    
+    if incremental:
+        manifesto = carregar_manifesto(pasta_destino)
+        configuracao = configuracao_conversao(col_x, col_y, conversor, col_zona, col_hemisferio,
+                                              formato_saida, formatar_texto, compressao_saida)
+        if manifesto.get('configuracao') != configuracao:
+            manifesto = {'configuracao': configuracao, 'arquivos': {}}
+        
+        a_converter = []
+        for i in pendentes:
+            arquivo, destino = tarefas[i][:2]
+            registro = manifesto['arquivos'].get(str(arquivo.resolve()))
+            if arquivo_inalterado(arquivo, destino, registro):
+                resultados[i] = _resultado_arquivo(arquivo, destino, sucesso=True, pulado=True)
+                print(f"⏭️ Sem alterações: {arquivo.name}")
+                if ao_concluir is not None:
+                    ao_concluir(resultados[i])
+            else:
+                a_converter.append(i)
+        pendentes = a_converter
+    
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(int(workers), len(pendentes) or 1))
+    if (workers_arquivo or 1) > 1:
+        # O paralelismo fica dentro de cada arquivo; dois níveis de pool disputariam os núcleos
+        workers = 1
+    
+    if workers == 1:
+        # Um único processo: converte aqui mesmo, sem custo de criar o pool
+        for i in pendentes:
+            if cancelar is not None and cancelar.is_set():
+                resultados[i] = _resultado_cancelado(*tarefas[i][:2])
+            else:
+                resultados[i] = _converter_arquivo_seguro(*tarefas[i], cancelar=cancelar)
+            if ao_concluir is not None:
+                ao_concluir(resultados[i])
+    elif pendentes:
+        with contextlib.ExitStack() as pilha:
+            # Um threading.Event não é visto pelos processos do pool: o sinal
+            # passa por um Event do Manager, conferido entre um bloco e outro
+            sinal = (pilha.enter_context(multiprocessing.Manager()).Event()
+                     if cancelar is not None else None)
+            executor = pilha.enter_context(ProcessPoolExecutor(max_workers=workers,
+                                                               initializer=_inicializar_processo,
+                                                               initargs=(logs_em_stderr,)))
+            futuros = {executor.submit(_converter_arquivo_seguro, *tarefas[i], cancelar=sinal): i
+                       for i in pendentes}
+            em_andamento = set(futuros)
+            while em_andamento:
+                # Espera com timeout para atender ao cancelamento sem demora
+                prontos, em_andamento = wait(em_andamento, timeout=0.2,
+                                             return_when=FIRST_COMPLETED)
+                for futuro in prontos:
+                    i = futuros[futuro]
+                    if futuro.cancelled():
+                        resultados[i] = _resultado_cancelado(*tarefas[i][:2])
+                    else:
+                        try:
+                            resultados[i] = futuro.result()
+                        except Exception as e:
+                            # Falha do próprio processo (ex.: processo encerrado)
+                            resultados[i] = _resultado_arquivo(*tarefas[i][:2], erro=str(e))
+                    if ao_concluir is not None:
+                        ao_concluir(resultados[i])
+                
+                if cancelar is not None and cancelar.is_set():
+                    sinal.set()
+                    for futuro in em_andamento:
+                        futuro.cancel()
+    
+    if incremental:
+        for i in pendentes:
+            chave = str(arquivos[i].resolve())
+            assinatura = resultados[i].pop('assinatura', None)
+            if resultados[i]['sucesso'] and assinatura is not None:
+                manifesto['arquivos'][chave] = dict(assinatura, destino=resultados[i]['destino'])
+            else:
+                manifesto['arquivos'].pop(chave, None)
+        salvar_manifesto(pasta_destino, manifesto)
+    
+    return resultados
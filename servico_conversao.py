@@ -0,0 +1,488 @@
+"""
+Serviço HTTP local de conversão UTM -> Geográficas (somente biblioteca padrão)
+
+Mantém o processo e os transformadores prontos, evitando o custo de abrir
+um script a cada ponto. Requisições simultâneas que chegam dentro de uma
+janela curta (padrão: 2 ms) são reunidas em um único lote e convertidas em
+uma só chamada vetorizada.
+
+    python servico_conversao.py --porta 8765
+
+Rotas:
+    GET  /converter?x=168104,21&y=8239998,82[&zona=23&hem=S]   um ponto
+    POST /converter   JSON {"x": ..., "y": ...}, {"pontos": [{"x", "y", "zona", "hem"}, ...]}
+                      ou [[x, y], ...]; ou CSV (Content-Type text/csv) com
+                      linhas "x;y[;zona[;hem]]"
+    GET  /estatisticas   contadores de latência e vazão
+    GET  /saude          verificação simples
+"""
+
+import argparse
+import asyncio
+import collections
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+import numpy as np
+import pandas as pd
+from conversor_utm import DATUMS, MOTORES, ConversorUTM, formatar_dms_lote, interpretar_zonas, valores_numericos
+
+
+HOST_PADRAO = '127.0.0.1'
+PORTA_PADRAO = 8765
+JANELA_PADRAO_MS = 2.0
+MAX_PONTOS_LOTE = 100_000
+
+# Maior corpo de requisição aceito
+MAX_CORPO = 64 * 1024 * 1024
+
+# Latências guardadas para os percentis de /estatisticas
+AMOSTRAS_LATENCIA = 10_000
+
+MOTIVOS_HTTP = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+                413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+
+class ErroRequisicao(Exception):
+    """Requisição inválida; vira uma resposta HTTP com o código indicado"""
+    
+    def __init__(self, mensagem, codigo=400):
+        super().__init__(mensagem)
+        self.codigo = codigo
+
+
+class Estatisticas:
+    """Contadores de requisições, lotes, latência e vazão do serviço"""
+    
+    def __init__(self):
+        self.inicio = time.perf_counter()
+        self.requisicoes = 0
+        self.erros = 0
+        self.pontos = 0
+        self.lotes = 0
+        self.pontos_em_lotes = 0
+        self.maior_lote = 0
+        self.segundos_conversao = 0.0
+        self._latencias = collections.deque(maxlen=AMOSTRAS_LATENCIA)
+    
+    def registrar_requisicao(self, segundos, pontos=0, erro=False):
+        self.requisicoes += 1
+        self.pontos += pontos
+        self.erros += int(erro)
+        self._latencias.append(segundos)
+    
+    def registrar_lote(self, pontos, segundos):
+        self.lotes += 1
+        self.pontos_em_lotes += pontos
+        self.maior_lote = max(self.maior_lote, pontos)
+        self.segundos_conversao += segundos
+    
+    def relatorio(self):
+        """
+        Retorna os contadores do serviço
+        
+        Returns:
+            dict: Requisições, pontos, lotes e latências (ms) desde o início
+        """
+        decorrido = time.perf_counter() - self.inicio
+        latencias = np.array(self._latencias) * 1000
+        percentis = (np.percentile(latencias, [50, 95, 99]).round(3).tolist()
+                     if latencias.size else [None, None, None])
+        return {
+            'segundos_ativo': round(decorrido, 3),
+            'requisicoes': self.requisicoes,
+            'erros': self.erros,
+            'pontos': self.pontos,
+            'requisicoes_por_segundo': round(self.requisicoes / decorrido, 1) if decorrido > 0 else None,
+            'pontos_por_segundo': round(self.pontos / decorrido, 1) if decorrido > 0 else None,
+            'lotes': self.lotes,
+            'pontos_por_lote': round(self.pontos_em_lotes / self.lotes, 1) if self.lotes else None,
+            'maior_lote': self.maior_lote,
+            'segundos_conversao': round(self.segundos_conversao, 6),
+            'latencia_ms': {
+                'media': round(float(latencias.mean()), 3) if latencias.size else None,
+                'p50': percentis[0],
+                'p95': percentis[1],
+                'p99': percentis[2],
+                'maxima': round(float(latencias.max()), 3) if latencias.size else None
+            }
+        }
+
+
+class AgrupadorLotes:
+    """
+    Reúne os pontos de requisições simultâneas em lotes vetorizados
+    
+    O primeiro pedido de um lote abre uma janela de espera; ao fim dela (ou
+    antes, se o lote atingir max_pontos) todos os pontos acumulados são
+    convertidos de uma vez e cada pedido recebe a sua fatia do resultado.
+    """
+    
+    def __init__(self, conversor, estatisticas, janela_ms=JANELA_PADRAO_MS, max_pontos=MAX_PONTOS_LOTE):
+        """
+        Inicializa o agrupador
+        
+        Args:
+            conversor (ConversorUTM): Conversor usado em todos os lotes
+            estatisticas (Estatisticas): Recebe o tamanho e o tempo de cada lote
+            janela_ms (float): Espera máxima para reunir pedidos, em milissegundos
+            max_pontos (int): Tamanho do lote que dispara a conversão sem esperar
+        """
+        self.conversor = conversor
+        self.estatisticas = estatisticas
+        self.janela = max(0.0, janela_ms) / 1000
+        self.max_pontos = max(1, int(max_pontos))
+        self._pendentes = []
+        self._pontos_pendentes = 0
+        self._temporizador = None
+        # Uma única thread: o laço de eventos segue atendendo conexões durante a conversão
+        self._executor = ThreadPoolExecutor(max_workers=1)
+    
+    async def converter(self, x, y, zonas, hemisferios):
+        """
+        Agenda pontos para o próximo lote e espera o resultado
+        
+        Args:
+            x (numpy.ndarray): Coordenadas X
+            y (numpy.ndarray): Coordenadas Y
+            zonas (numpy.ndarray): Zona de cada ponto (float, NaN se inválida)
+            hemisferios (numpy.ndarray): Hemisfério de cada ponto ('N'/'S'/None)
+        
+        Returns:
+            tuple: (lon, lat, validos, lon_dms, lat_dms) para os pontos pedidos
+        """
+        loop = asyncio.get_running_loop()
+        futuro = loop.create_future()
+        self._pendentes.append((x, y, zonas, hemisferios, futuro))
+        self._pontos_pendentes += len(x)
+        
+        if self._pontos_pendentes >= self.max_pontos:
+            self._disparar()
+        elif self._temporizador is None:
+            self._temporizador = loop.call_later(self.janela, self._disparar)
+        
+        return await futuro
+    
+    def _disparar(self):
+        if self._temporizador is not None:
+            self._temporizador.cancel()
+            self._temporizador = None
+        pendentes, self._pendentes = self._pendentes, []
+        self._pontos_pendentes = 0
+        if pendentes:
+            asyncio.ensure_future(self._converter_lote(pendentes))
+    
+    async def _converter_lote(self, pendentes):
+        loop = asyncio.get_running_loop()
+        try:
+            resultado = await loop.run_in_executor(self._executor, self._converter_vetores, pendentes)
+        except Exception as e:
+            for *_, futuro in pendentes:
+                if not futuro.done():
+                    futuro.set_exception(e)
+            return
+        
+        lon, lat, validos, lon_dms, lat_dms = resultado
+        inicio = 0
+        for x, *_, futuro in pendentes:
+            fim = inicio + len(x)
+            if not futuro.done():
+                futuro.set_result((lon[inicio:fim], lat[inicio:fim], validos[inicio:fim],
+                                   lon_dms[inicio:fim], lat_dms[inicio:fim]))
+            inicio = fim
+    
+    def _converter_vetores(self, pendentes):
+        # Executado na thread de conversão: uma única chamada para todo o lote
+        inicio = time.perf_counter()
+        x = np.concatenate([p[0] for p in pendentes])
+        y = np.concatenate([p[1] for p in pendentes])
+        zonas = np.concatenate([p[2] for p in pendentes])
+        hemisferios = np.concatenate([p[3] for p in pendentes])
+        
+        lon, lat, validos = self.conversor.utm_para_geografica_lote(x, y, zonas, hemisferios)
+        lon_dms = formatar_dms_lote(lon, ('E', 'W'))
+        lat_dms = formatar_dms_lote(lat, ('N', 'S'))
+        
+        self.estatisticas.registrar_lote(len(x), time.perf_counter() - inicio)
+        return lon, lat, validos, lon_dms, lat_dms
+    
+    def fechar(self):
+        self._executor.shutdown(wait=False)
+
+
+def _pontos_json(dados):
+    # Aceita {"x", "y"}, {"pontos": [...]} ou [[x, y], ...]; retorna (lista de pontos, único)
+    if isinstance(dados, dict) and 'pontos' not in dados:
+        return [dados], True
+    pontos = dados.get('pontos') if isinstance(dados, dict) else dados
+    if not isinstance(pontos, list):
+        raise ErroRequisicao("JSON esperado: {\"x\", \"y\"}, {\"pontos\": [...]} ou [[x, y], ...]")
+    return pontos, False
+
+
+def _campos_ponto(ponto):
+    # (x, y, zona, hem) de um ponto JSON, como objeto ou lista
+    if isinstance(ponto, dict):
+        return ponto.get('x'), ponto.get('y'), ponto.get('zona'), ponto.get('hem', ponto.get('hemisferio'))
+    if isinstance(ponto, (list, tuple)) and 2 <= len(ponto) <= 4:
+        return tuple(ponto) + (None,) * (4 - len(ponto))
+    raise ErroRequisicao(f"Ponto inválido: {ponto!r}")
+
+
+def interpretar_pontos(campos, conversor):
+    """
+    Converte listas de campos (x, y, zona, hem) em vetores para o agrupador
+    
+    Args:
+        campos (list): Tuplas (x, y, zona, hem); zona e hem podem ser None
+        conversor (ConversorUTM): Fornece a zona e o hemisfério padrão
+    
+    Returns:
+        tuple: (x, y, zonas, hemisferios) como numpy.ndarray
+    """
+    if not campos:
+        vazio = np.empty(0)
+        return vazio, vazio, vazio, np.empty(0, dtype=object)
+    
+    colunas = list(zip(*campos))
+    x = valores_numericos(_serie_textos(colunas[0]))
+    y = valores_numericos(_serie_textos(colunas[1]))
+    
+    # Zona com sufixo ("23S") define o hemisfério; sem nada, vale o padrão do conversor
+    zonas_texto = [conversor.zona_utm if z is None or z == '' else z for z in colunas[2]]
+    zonas, hemisferios = interpretar_zonas(zonas_texto, conversor.hemisferio)
+    hems_explicitos = [str(h).strip().upper()[:1] if h not in (None, '') else None for h in colunas[3]]
+    for i, hem in enumerate(hems_explicitos):
+        if hem is not None:
+            hemisferios[i] = hem if hem in ('N', 'S') else None
+    return x, y, zonas, hemisferios
+
+
+def _serie_textos(valores):
+    return pd.Series(['' if v is None else str(v) for v in valores], dtype=object)
+
+
+def _linhas_csv(corpo):
+    # Linhas "x;y[;zona[;hem]]" (também aceita ',' como separador quando não há ';')
+    campos = []
+    for linha in corpo.decode('utf-8-sig', errors='replace').splitlines():
+        linha = linha.strip()
+        if not linha:
+            continue
+        partes = linha.split(';') if ';' in linha else linha.split(',')
+        if len(partes) < 2:
+            raise ErroRequisicao(f"Linha CSV inválida: {linha!r}")
+        partes = [p.strip() for p in partes[:4]]
+        campos.append(tuple(partes) + (None,) * (4 - len(partes)))
+    
+    # Cabeçalho opcional (ex.: "x;y;zona")
+    if campos and not np.isfinite(valores_numericos(_serie_textos([campos[0][0]])))[0] \
+            and campos[0][0].strip().lower() in ('x', 'e', 'este', 'easting', 'utm_x'):
+        campos = campos[1:]
+    return campos
+
+
+def _numero_json(valor):
+    return float(valor) if np.isfinite(valor) else None
+
+
+class ServicoConversao:
+    """Servidor HTTP/1.1 mínimo sobre asyncio, com conexões persistentes"""
+    
+    def __init__(self, conversor=None, janela_ms=JANELA_PADRAO_MS, max_pontos_lote=MAX_PONTOS_LOTE):
+        self.conversor = conversor if conversor is not None else ConversorUTM()
+        self.estatisticas = Estatisticas()
+        self.agrupador = AgrupadorLotes(self.conversor, self.estatisticas, janela_ms, max_pontos_lote)
+        self._servidor = None
+    
+    async def iniciar(self, host=HOST_PADRAO, porta=PORTA_PADRAO):
+        """Aquece o transformador padrão e começa a aceitar conexões"""
+        self.conversor.utm_para_geografica(500000, 7000000)
+        self._servidor = await asyncio.start_server(self._atender_conexao, host, porta)
+        return self._servidor
+    
+    @property
+    def portas(self):
+        """Endereços (host, porta) em que o serviço está escutando"""
+        return [sock.getsockname()[:2] for sock in self._servidor.sockets] if self._servidor else []
+    
+    async def parar(self):
+        if self._servidor is not None:
+            self._servidor.close()
+            await self._servidor.wait_closed()
+            self._servidor = None
+        self.agrupador.fechar()
+    
+    async def _atender_conexao(self, leitor, escritor):
+        try:
+            while True:
+                try:
+                    cabecalho = await leitor.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+                
+                inicio = time.perf_counter()
+                try:
+                    metodo, alvo, cabecalhos = self._interpretar_cabecalho(cabecalho)
+                    tamanho = self._tamanho_corpo(cabecalhos)
+                except ErroRequisicao as e:
+                    # Sem um cabeçalho válido não se sabe onde o corpo termina: encerra a conexão
+                    await self._responder(escritor, e.codigo, {'erro': str(e)}, False)
+                    self.estatisticas.registrar_requisicao(time.perf_counter() - inicio, erro=True)
+                    return
+                corpo = await leitor.readexactly(tamanho) if tamanho else b''
+                
+                pontos = 0
+                try:
+                    codigo, resposta, tipo, pontos = await self._rotear(metodo, alvo, cabecalhos, corpo)
+                except ErroRequisicao as e:
+                    codigo, resposta, tipo = e.codigo, {'erro': str(e)}, 'application/json'
+                except Exception as e:
+                    codigo, resposta, tipo = 500, {'erro': str(e)}, 'application/json'
+                
+                manter = cabecalhos.get('connection', '').lower() != 'close'
+                await self._responder(escritor, codigo, resposta, manter, tipo)
+                self.estatisticas.registrar_requisicao(time.perf_counter() - inicio, pontos, codigo >= 400)
+                if not manter:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            escritor.close()
+    
+    @staticmethod
+    def _interpretar_cabecalho(cabecalho):
+        linhas = cabecalho.decode('latin-1').split('\r\n')
+        try:
+            metodo, alvo, _ = linhas[0].split(' ', 2)
+        except ValueError:
+            raise ErroRequisicao("Linha de requisição inválida")
+        cabecalhos = {}
+        for linha in linhas[1:]:
+            if ':' in linha:
+                nome, valor = linha.split(':', 1)
+                cabecalhos[nome.strip().lower()] = valor.strip()
+        return metodo.upper(), alvo, cabecalhos
+    
+    @staticmethod
+    def _tamanho_corpo(cabecalhos):
+        valor = cabecalhos.get('content-length', '')
+        if not valor:
+            return 0
+        # Só dígitos: recusa valores negativos, com sinal ou não numéricos
+        if not (valor.isascii() and valor.isdigit()):
+            raise ErroRequisicao(f"Content-Length inválido: {valor!r}")
+        tamanho = int(valor)
+        if tamanho > MAX_CORPO:
+            raise ErroRequisicao("Corpo da requisição grande demais", 413)
+        return tamanho
+    
+    async def _rotear(self, metodo, alvo, cabecalhos, corpo):
+        # Retorna (código, resposta, content-type, pontos convertidos)
+        url = urlsplit(alvo)
+        if url.path == '/saude':
+            return 200, {'status': 'ok'}, 'application/json', 0
+        if url.path == '/estatisticas':
+            relatorio = self.estatisticas.relatorio()
+            relatorio['transformadores'] = _estatisticas_transformadores()
+            return 200, relatorio, 'application/json', 0
+        if url.path != '/converter':
+            raise ErroRequisicao(f"Rota desconhecida: {url.path}", 404)
+        
+        if metodo == 'GET':
+            parametros = {chave: valores[0] for chave, valores in parse_qs(url.query).items()}
+            campos, unico, formato = [_campos_ponto(parametros)], True, 'json'
+        elif metodo == 'POST':
+            if 'csv' in cabecalhos.get('content-type', ''):
+                campos, unico, formato = _linhas_csv(corpo), False, 'csv'
+            else:
+                try:
+                    dados = json.loads(corpo.decode('utf-8') or 'null')
+                except ValueError:
+                    raise ErroRequisicao("JSON inválido")
+                pontos, unico = _pontos_json(dados)
+                campos, formato = [_campos_ponto(p) for p in pontos], 'json'
+        else:
+            raise ErroRequisicao(f"Método não suportado: {metodo}", 405)
+        
+        vetores = interpretar_pontos(campos, self.conversor)
+        if len(vetores[0]):
+            lon, lat, validos, lon_dms, lat_dms = await self.agrupador.converter(*vetores)
+        else:
+            lon = lat = np.empty(0)
+            validos = np.empty(0, dtype=bool)
+            lon_dms = lat_dms = np.empty(0, dtype=object)
+        
+        if formato == 'csv':
+            linhas = ['longitude_dms;latitude_dms;longitude_dec;latitude_dec']
+            for i in range(len(lon)):
+                linhas.append(f"{lon_dms[i]};{lat_dms[i]};{float(lon[i])!r};{float(lat[i])!r}" if validos[i] else ';;;')
+            return 200, '\r\n'.join(linhas) + '\r\n', 'text/csv; charset=utf-8', len(lon)
+        
+        resultados = [{
+            'longitude': _numero_json(lon[i]),
+            'latitude': _numero_json(lat[i]),
+            'longitude_dms': lon_dms[i],
+            'latitude_dms': lat_dms[i],
+            'valido': bool(validos[i])
+        } for i in range(len(lon))]
+        return 200, (resultados[0] if unico else {'resultados': resultados}), 'application/json', len(lon)
+    
+    @staticmethod
+    async def _responder(escritor, codigo, resposta, manter, tipo='application/json'):
+        if tipo == 'application/json':
+            corpo = json.dumps(resposta, ensure_ascii=False).encode('utf-8')
+            tipo = 'application/json; charset=utf-8'
+        else:
+            corpo = resposta.encode('utf-8')
+        cabecalho = (f"HTTP/1.1 {codigo} {MOTIVOS_HTTP.get(codigo, '')}\r\n"
+                     f"Content-Type: {tipo}\r\n"
+                     f"Content-Length: {len(corpo)}\r\n"
+                     f"Connection: {'keep-alive' if manter else 'close'}\r\n\r\n")
+        escritor.write(cabecalho.encode('latin-1') + corpo)
+        await escritor.drain()
+
+
+def _estatisticas_transformadores():
+    from conversor_utm import registro_transformadores
+    return registro_transformadores.estatisticas()
+
+
+async def _servir(args):
+    conversor = ConversorUTM(zona_utm=args.zona, hemisferio=args.hem, datum=args.datum, motor=args.motor)
+    servico = ServicoConversao(conversor, args.janela_ms, args.max_lote)
+    await servico.iniciar(args.host, args.porta)
+    for host, porta in servico.portas:
+        print(f"Serviço de conversão em http://{host}:{porta}/converter", file=sys.stderr)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await servico.parar()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serviço HTTP local de conversão UTM -> Geográficas')
+    parser.add_argument('--host', default=HOST_PADRAO, help=f'Endereço (padrão: {HOST_PADRAO})')
+    parser.add_argument('--porta', type=int, default=PORTA_PADRAO, help=f'Porta (padrão: {PORTA_PADRAO})')
+    parser.add_argument('--zona', type=int, default=23, help='Zona UTM padrão (padrão: 23)')
+    parser.add_argument('--hem', choices=['N', 'S'], default='S', help='Hemisfério padrão (padrão: S)')
+    parser.add_argument('--datum', choices=list(DATUMS), default='SIRGAS2000',
+                        help='Datum das coordenadas UTM (padrão: SIRGAS2000)')
+    parser.add_argument('--motor', choices=MOTORES, default='pyproj', help='Motor da projeção')
+    parser.add_argument('--janela-ms', type=float, default=JANELA_PADRAO_MS,
+                        help=f'Espera para reunir requisições em um lote (padrão: {JANELA_PADRAO_MS} ms)')
+    parser.add_argument('--max-lote', type=int, default=MAX_PONTOS_LOTE,
+                        help=f'Pontos que disparam o lote sem esperar (padrão: {MAX_PONTOS_LOTE})')
+    args = parser.parse_args(argv)
+    
+    try:
+        asyncio.run(_servir(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""
+Verifica o orçamento de tempo de inicialização da interface e da linha de comando
+
+Importa os módulos de entrada de cada caminho em um processo novo com
+`python -X importtime` e soma o tempo de importação informado pelo próprio
+Python. A execução falha (código de saída 1) se algum caminho passar do
+orçamento ou importar na inicialização um módulo que deveria ficar para a
+primeira conversão (ex.: pandas e pyproj na interface gráfica).
+
+    python verificar_inicializacao.py
+    python verificar_inicializacao.py --orcamento-gui 150 --orcamento-cli 1500 --repeticoes 5
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+
+# Orçamentos padrão, em milissegundos de importação
+ORCAMENTO_GUI_MS = 150.0
+ORCAMENTO_CLI_MS = 1500.0
+
+# Módulos importados na inicialização de cada caminho e os que não podem aparecer
+CAMINHOS = {
+    'gui': {
+        'modulos': ('executar_conversor', 'interface_grafica'),
+        'proibidos': ('numpy', 'pandas', 'pyproj', 'pyarrow'),
+    },
+    'cli': {
+        'modulos': ('linha_comando',),
+        'proibidos': ('pyproj',),
+    },
+}
+
+# Linha do -X importtime: "import time:  self [us] | cumulativo | pacote"
+_RE_IMPORTTIME = re.compile(r'^import time:\s+(\d+)\s*\|\s*(\d+) \| ( *)(\S+)\s*$')
+
+
+def medir_importacao(modulos, pasta=None):
+    """
+    Importa os módulos em um processo novo e lê o relatório do -X importtime
+    
+    Args:
+        modulos (tuple): Módulos importados, em ordem
+        pasta (Path): Pasta do projeto (padrão: a deste arquivo)
+    
+    Returns:
+        dict: {'ms': tempo total, 'modulos': {nome: ms cumulativo}, 'mais_lentos': [...]}
+    """
+    pasta = Path(pasta or Path(__file__).resolve().parent)
+    codigo = '; '.join(f"import {modulo}" for modulo in modulos)
+    ambiente = dict(os.environ, PYTHONDONTWRITEBYTECODE='1')
+    processo = subprocess.run([sys.executable, '-X', 'importtime', '-c', codigo],
+                              cwd=pasta, env=ambiente, capture_output=True, text=True)
+    if processo.returncode != 0:
+        raise RuntimeError(f"Falha ao importar {', '.join(modulos)}:\n{processo.stderr[-2000:]}")
+    
+    cumulativos = {}
+    total_us = 0
+    for linha in processo.stderr.splitlines():
+        encontrado = _RE_IMPORTTIME.match(linha)
+        if not encontrado:
+            continue
+        _, cumulativo, recuo, nome = encontrado.groups()
+        cumulativos[nome] = int(cumulativo) / 1000
+        if not recuo:
+            # Só as importações de primeiro nível: as internas já estão no cumulativo delas
+            total_us += int(cumulativo)
+    
+    mais_lentos = sorted(cumulativos.items(), key=lambda item: -item[1])[:8]
+    return {
+        'ms': round(total_us / 1000, 1),
+        'modulos': cumulativos,
+        'mais_lentos': [{'modulo': nome, 'ms': round(ms, 1)} for nome, ms in mais_lentos]
+    }
+
+
+def verificar_caminho(nome, orcamento_ms, repeticoes=3):
+    """
+    Mede um caminho de inicialização (melhor de N processos) e confere o orçamento
+    
+    Args:
+        nome (str): 'gui' ou 'cli'
+        orcamento_ms (float): Tempo máximo de importação, em milissegundos
+        repeticoes (int): Processos medidos; vale o mais rápido
+    
+    Returns:
+        dict: Tempo medido, orçamento, módulos proibidos encontrados e se passou
+    """
+    caminho = CAMINHOS[nome]
+    medicoes = [medir_importacao(caminho['modulos']) for _ in range(max(1, repeticoes))]
+    melhor = min(medicoes, key=lambda medicao: medicao['ms'])
+    
+    proibidos = sorted({modulo for medicao in medicoes for modulo in caminho['proibidos']
+                        if modulo in medicao['modulos']})
+    return {
+        'caminho': nome,
+        'modulos': list(caminho['modulos']),
+        'ms': melhor['ms'],
+        'orcamento_ms': orcamento_ms,
+        'proibidos_importados': proibidos,
+        'mais_lentos': melhor['mais_lentos'],
+        'ok': melhor['ms'] <= orcamento_ms and not proibidos
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Verifica o tempo de inicialização da interface e da linha de comando')
+    parser.add_argument('--orcamento-gui', type=float, default=ORCAMENTO_GUI_MS,
+                        help=f'Orçamento da interface gráfica, em ms (padrão: {ORCAMENTO_GUI_MS:g})')
+    parser.add_argument('--orcamento-cli', type=float, default=ORCAMENTO_CLI_MS,
+                        help=f'Orçamento da linha de comando, em ms (padrão: {ORCAMENTO_CLI_MS:g})')
+    parser.add_argument('--repeticoes', type=int, default=3,
+                        help='Processos medidos por caminho; vale o mais rápido (padrão: 3)')
+    parser.add_argument('--saida', default=None, help='Também grava os resultados em JSON')
+    args = parser.parse_args(argv)
+    
+    orcamentos = {'gui': args.orcamento_gui, 'cli': args.orcamento_cli}
+    resultados = [verificar_caminho(nome, orcamentos[nome], args.repeticoes) for nome in CAMINHOS]
+    
+    print(f"Inicialização (-X importtime, melhor de {max(1, args.repeticoes)}):")
+    for r in resultados:
+        situacao = 'ok' if r['ok'] else 'FALHOU'
+        print(f"  {r['caminho']}: {r['ms']:>8.1f} ms (orçamento {r['orcamento_ms']:g} ms)  {situacao}")
+        if r['proibidos_importados']:
+            print(f"       importados na inicialização: {', '.join(r['proibidos_importados'])}")
+        if not r['ok']:
+            for lento in r['mais_lentos']:
+                print(f"       {lento['ms']:>8.1f} ms  {lento['modulo']}")
+    
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as f:
+            json.dump(resultados, f, ensure_ascii=False, indent=2)
+    
+    return 0 if all(r['ok'] for r in resultados) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
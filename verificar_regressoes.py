@@ -0,0 +1,128 @@
+"""
+Verificações de regressão de comportamentos que mudam os bytes da saída
+
+Cada verificação cobre um caso em que a saída atual difere de propósito da
+versão original (ou em que um erro já corrigido poderia voltar). A execução
+falha (código de saída 1) se alguma verificação falhar.
+
+    python verificar_regressoes.py
+    python verificar_regressoes.py --lista
+"""
+
+import argparse
+import sys
+import traceback
+
+
+# Verificações registradas, na ordem em que são executadas
+VERIFICACOES = []
+
+
+def verificacao(funcao):
+    """Registra uma função de verificação (falha levantando AssertionError)"""
+    VERIFICACOES.append(funcao)
+    return funcao
+
+
+def conferir(obtido, esperado, descricao):
+    """Levanta AssertionError se obtido != esperado"""
+    if obtido != esperado:
+        raise AssertionError(f"{descricao}: esperado {esperado!r}, obtido {obtido!r}")
+
+
+@verificacao
+def dms_sinal_entre_menos_um_e_zero():
+    """Valores entre -1 e 0 grau recebem W/S (a versão original escrevia E/N)"""
+    from conversor_utm import formatar_dms_lote
+    conferir(list(formatar_dms_lote([-0.5, -0.999], ('E', 'W'))), ['0 30 0,000 W', '0 59 56,400 W'],
+             "longitude entre -1 e 0")
+    conferir(list(formatar_dms_lote([-0.25], ('N', 'S'))), ['0 15 0,000 S'], "latitude entre -1 e 0")
+    # Arredonda para zero: fica com a letra positiva, como na versão original
+    conferir(list(formatar_dms_lote([-1e-9, 0.0], ('E', 'W'))), ['0 00 0,000 E', '0 00 0,000 E'],
+             "valor que arredonda para zero")
+
+
+@verificacao
+def dms_segundos_arredondados_para_60():
+    """Segundos que arredondam para 60 passam para o minuto e o grau seguintes"""
+    from conversor_utm import formatar_dms_lote
+    # A versão original escrevia "44 49 60,000 W" e "44 59 60,000 E"
+    conferir(list(formatar_dms_lote([-(44 + 49 / 60 + 59.9996 / 3600)], ('E', 'W'))), ['44 50 0,000 W'],
+             "carry para o minuto")
+    conferir(list(formatar_dms_lote([44 + 59 / 60 + 59.99996 / 3600], ('E', 'W'))), ['45 00 0,000 E'],
+             "carry para o grau")
+    conferir(list(formatar_dms_lote([-(48 + 5 / 60 + 57.108 / 3600)], ('E', 'W'))), ['48 05 57,108 W'],
+             "valor comum")
+
+
+@verificacao
+def hemisferio_padrao_minusculo_com_coluna_de_zona():
+    """Hemisfério padrão 's' com zona por linha converte como 'S' (antes rejeitava todas as linhas)"""
+    import numpy as np
+    import pandas as pd
+    from conversor_utm import MOTORES, ConversorUTM, converter_colunas_df
+    
+    df = pd.DataFrame({'x': ['500000,00', '168104,21'], 'y': ['7000000,00', '8239998,82'], 'zona': ['23', '22']})
+    for motor in MOTORES:
+        esperado, validos_esperados = converter_colunas_df(df.copy(), 0, 1, ConversorUTM(hemisferio='S', motor=motor), 2)
+        obtido, validos = converter_colunas_df(df.copy(), 0, 1, ConversorUTM(hemisferio='s', motor=motor), 2)
+        conferir(validos.tolist(), [True, True], f"linhas válidas ({motor})")
+        conferir(obtido.values.tolist(), esperado.values.tolist(), f"coluna de zona ({motor})")
+        
+        conversor = ConversorUTM(hemisferio='s', motor=motor)
+        lon, lat, validos = conversor.utm_para_geografica_lote([500000], [7000000], np.array([23.0]))
+        conferir(bool(validos[0]) and round(float(lat[0]), 6), -27.12247, f"vetor de zonas ({motor})")
+
+
+@verificacao
+def csv_utf8_com_byte_latin1_depois_da_amostra():
+    """Arquivo UTF-8 na amostra com um byte Latin-1 depois dela é lido, não falha"""
+    import tempfile
+    from pathlib import Path
+    from processamento_lote import TAMANHO_AMOSTRA, converter_arquivo, detectar_formato
+    
+    linhas = ["Vertice;E;N;Obs\n"]
+    while sum(len(linha.encode('utf-8')) for linha in linhas) <= TAMANHO_AMOSTRA:
+        linhas.append(f"P{len(linhas)};500000,00;7000000,00;ação\n")
+    dados = ''.join(linhas).encode('utf-8') + "Px;500000,00;7000000,00;".encode() + "coração\n".encode('latin-1')
+    
+    with tempfile.TemporaryDirectory() as pasta:
+        origem = Path(pasta) / 'misto.csv'
+        destino = Path(pasta) / 'saida' / 'misto.csv'
+        destino.parent.mkdir()
+        origem.write_bytes(dados)
+        conferir(detectar_formato(origem, usar_cache=False), ('utf-8', ';'), "formato detectado pela amostra")
+        
+        resultado = converter_arquivo(origem, destino, 'B', 'C', tamanho_bloco=1000)
+        conferir(resultado['linhas'], len(linhas), "linhas lidas")
+        saida = destino.read_text(encoding='utf-8-sig').splitlines()
+        conferir(saida[1].rsplit(';', 1)[1], 'ação', "texto UTF-8 da amostra")
+        conferir(saida[-1].rsplit(';', 1)[1], 'coração', "byte Latin-1 depois da amostra")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Executa as verificações de regressão da conversão')
+    parser.add_argument('--lista', action='store_true', help='Só lista as verificações')
+    args = parser.parse_args(argv)
+    
+    if args.lista:
+        for funcao in VERIFICACOES:
+            print(f"  {funcao.__name__}: {funcao.__doc__}")
+        return 0
+    
+    falhas = 0
+    for funcao in VERIFICACOES:
+        try:
+            funcao()
+            print(f"  ok      {funcao.__name__}")
+        except Exception:
+            falhas += 1
+            print(f"  FALHOU  {funcao.__name__}")
+            print(''.join(f"          {linha}\n" for linha in traceback.format_exc().rstrip().splitlines()))
+    
+    print(f"\n{len(VERIFICACOES) - falhas} de {len(VERIFICACOES)} verificações passaram")
+    return 1 if falhas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())